@@ -0,0 +1,27 @@
+"""atletas_keyset_index
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-10-21 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_atletas_created_at_pk_id', 'atletas', ['created_at', 'pk_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_atletas_created_at_pk_id', table_name='atletas')
@@ -0,0 +1,116 @@
+"""atletas_resumo
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-10-22 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mesmas faixas de workout_api.atleta.stats.IMC_FAIXAS.
+_IMC = 'r.peso / (r.altura * r.altura)'
+_FAIXAS = {
+    'imc_abaixo': f'{_IMC} < 18.5',
+    'imc_normal': f'{_IMC} >= 18.5 AND {_IMC} < 25',
+    'imc_sobrepeso': f'{_IMC} >= 25 AND {_IMC} < 30',
+    'imc_obesidade': f'{_IMC} >= 30',
+}
+_COLUNAS = ['total', 'masculino', 'feminino', 'soma_idade', 'soma_peso', 'soma_altura', 'soma_imc', *_FAIXAS]
+
+
+def _valores(sinal: str) -> list[str]:
+    return [
+        sinal,
+        f"{sinal} * (r.genero = 'M')::int",
+        f"{sinal} * (r.genero = 'F')::int",
+        f'{sinal} * r.idade',
+        f'{sinal} * r.peso',
+        f'{sinal} * r.altura',
+        f'{sinal} * {_IMC}',
+        *(f'{sinal} * ({condicao})::int' for condicao in _FAIXAS.values()),
+    ]
+
+
+_APLICAR = """
+    INSERT INTO atletas_resumo (categoria_id, centro_treinamento_id, {colunas})
+    SELECT r.categoria_id, r.centro_treinamento_id, {valores} FROM (SELECT {linha}.*) AS r
+    ON CONFLICT (categoria_id, centro_treinamento_id) DO UPDATE SET {atualizacoes};
+"""
+
+
+def _aplicar(linha: str, sinal: str) -> str:
+    return _APLICAR.format(
+        colunas=', '.join(_COLUNAS),
+        valores=', '.join(_valores(sinal)),
+        linha=linha,
+        atualizacoes=', '.join(f'{coluna} = atletas_resumo.{coluna} + EXCLUDED.{coluna}' for coluna in _COLUNAS),
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.create_table(
+        'atletas_resumo',
+        sa.Column('categoria_id', sa.Integer(), nullable=False),
+        sa.Column('centro_treinamento_id', sa.Integer(), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('masculino', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('feminino', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('soma_idade', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('soma_peso', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('soma_altura', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('soma_imc', sa.Float(), nullable=False, server_default='0'),
+        *(sa.Column(coluna, sa.Integer(), nullable=False, server_default='0') for coluna in _FAIXAS),
+        sa.ForeignKeyConstraint(['categoria_id'], ['categorias.pk_id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['centro_treinamento_id'], ['centro_treinamento.pk_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('categoria_id', 'centro_treinamento_id'),
+    )
+
+    # Cada escrita em atletas aplica apenas o delta da linha: -1 para OLD e
+    # +1 para NEW. O UPDATE só é acionado quando colunas agregadas mudam.
+    op.execute(f"""
+        CREATE FUNCTION atletas_resumo_delta() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                {_aplicar('OLD', '-1')}
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                {_aplicar('NEW', '1')}
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER atletas_resumo_delta
+        AFTER INSERT OR DELETE OR UPDATE OF categoria_id, centro_treinamento_id, genero, idade, peso, altura
+        ON atletas FOR EACH ROW EXECUTE FUNCTION atletas_resumo_delta()
+    """)
+
+    op.execute(f"""
+        INSERT INTO atletas_resumo (categoria_id, centro_treinamento_id, {', '.join(_COLUNAS)})
+        SELECT r.categoria_id, r.centro_treinamento_id, {', '.join(f'sum({valor})' for valor in _valores('1'))}
+        FROM atletas AS r
+        GROUP BY r.categoria_id, r.centro_treinamento_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('DROP TRIGGER IF EXISTS atletas_resumo_delta ON atletas')
+    op.execute('DROP FUNCTION IF EXISTS atletas_resumo_delta()')
+    op.drop_table('atletas_resumo')
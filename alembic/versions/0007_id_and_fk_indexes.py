@@ -0,0 +1,60 @@
+"""id_and_fk_indexes
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-10-25 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, Sequence[str], None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ('ix_categorias_id', 'categorias', ['id'], True),
+    ('ix_centro_treinamento_id', 'centro_treinamento', ['id'], True),
+    ('ix_atletas_id', 'atletas', ['id'], True),
+    ('ix_atletas_categoria_id', 'atletas', ['categoria_id'], False),
+    ('ix_atletas_centro_treinamento_id', 'atletas', ['centro_treinamento_id'], False),
+)
+
+
+def _drop_if_invalid(name: str) -> None:
+    # Um CREATE INDEX CONCURRENTLY interrompido (ex.: duplicata no índice
+    # único) deixa o índice INVALID, que o IF NOT EXISTS manteria.
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql' or op.get_context().as_sql:
+        return
+    invalid = bind.execute(
+        sa.text(
+            'SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid '
+            'WHERE c.relname = :name AND NOT i.indisvalid'
+        ),
+        {'name': name},
+    ).first()
+    if invalid is not None:
+        op.drop_index(name, postgresql_concurrently=True, if_exists=True)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY não bloqueia escritas em atletas durante a criação, mas
+    # não pode rodar dentro de uma transação.
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in INDEXES:
+            _drop_if_invalid(name)
+            op.create_index(name, table, columns, unique=unique, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
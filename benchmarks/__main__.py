@@ -0,0 +1,119 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import re
+import sys
+from datetime import datetime, timezone
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmark das rotas da Workout API.')
+    parser.add_argument('--db-url', default=os.environ.get('DB_URL', 'sqlite+aiosqlite:///./bench.db'),
+                        help='Banco usado pela API e pelo seed (padrão: SQLite local em ./bench.db)')
+    parser.add_argument('--base-url', default=None,
+                        help='Testa um servidor já em execução em vez da app em processo')
+    parser.add_argument('--categorias', type=int, default=10)
+    parser.add_argument('--centros', type=int, default=20)
+    parser.add_argument('--atletas', type=int, default=10_000)
+    parser.add_argument('--no-seed', action='store_true', help='Não recria nem popula o banco')
+    parser.add_argument('--seed', type=int, default=42, help='Semente do gerador de dados')
+    parser.add_argument('--requests', type=int, default=200, help='Requisições por rota')
+    parser.add_argument('--concurrency', type=int, default=1, help='Requisições simultâneas por rota (1 = sequencial)')
+    parser.add_argument('--routes', default=None, help='Regex aplicada a "MÉTODO /rota" para filtrar rotas')
+    parser.add_argument('--output', default=None, help='Arquivo JSON com os resultados')
+    parser.add_argument('--compare', default=None, help='JSON de uma execução anterior para comparação')
+    return parser.parse_args(argv)
+
+
+def print_table(results: list[dict], baseline: dict | None = None) -> None:
+    header = f'{"rota":<42} {"req":>6} {"err":>5} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"req/s":>9}'
+    if baseline:
+        header += f' {"Δp95":>8} {"Δreq/s":>8}'
+    print(header)
+    print('-' * len(header))
+
+    fmt = lambda value: f'{value:9.2f}' if value is not None else f'{"-":>9}'
+    for result in results:
+        name = f'{result["method"]} {result["route"]}'
+        line = (f'{name:<42} {result["requests"]:>6} {result["errors"]:>5} '
+                f'{fmt(result["p50_ms"])} {fmt(result["p95_ms"])} {fmt(result["p99_ms"])} {result["rps"]:9.1f}')
+        previous = (baseline or {}).get(name)
+        if previous:
+            line += f' {_delta(previous["p95_ms"], result["p95_ms"]):>8} {_delta(previous["rps"], result["rps"]):>8}'
+        print(line)
+
+
+def _delta(before: float | None, after: float | None) -> str:
+    if not before or after is None:
+        return '-'
+    return f'{(after - before) / before * 100:+.1f}%'
+
+
+async def main(args: argparse.Namespace) -> dict:
+    # As settings são lidas na importação: DB_URL precisa estar definido antes.
+    os.environ['DB_URL'] = args.db_url
+
+    import httpx
+    from benchmarks.runner import app_routes, new_state, run
+    from benchmarks.seed import load_existing, seed
+    from workout_api.configs.database import engine
+    from workout_api.main import app
+
+    if args.no_seed:
+        data = await load_existing(engine)
+    else:
+        data = await seed(
+            engine, args.categorias, args.centros, args.atletas,
+            spare=args.requests, seed=args.seed, create_schema=True,
+        )
+
+    routes = app_routes(app)
+    if args.routes:
+        pattern = re.compile(args.routes)
+        routes = [(method, route) for method, route in routes if pattern.search(f'{method} {route}')]
+
+    state = new_state(data, args.seed)
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=60)
+    else:
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://bench', timeout=60)
+
+    try:
+        async with app.router.lifespan_context(app), client:
+            results, uncovered = await run(client, routes, state, args.requests, args.concurrency)
+    finally:
+        await engine.dispose()
+
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'db': engine.url.get_backend_name(),
+            'target': args.base_url or 'asgi',
+            'atletas': args.atletas,
+            'requests': args.requests,
+            'concurrency': args.concurrency,
+            'seed': args.seed,
+        },
+        'results': [result.to_dict() for result in results],
+        'uncovered': [f'{method} {route}' for method, route in uncovered],
+    }
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    report = asyncio.run(main(args))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = {f'{r["method"]} {r["route"]}': r for r in json.load(file)['results']}
+    print_table(report['results'], baseline)
+    if report['uncovered']:
+        print(f'\nRotas sem cenário: {", ".join(report["uncovered"])}', file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
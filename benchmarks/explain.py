@@ -0,0 +1,127 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.explain',
+        description='Roda EXPLAIN nas queries das rotas quentes e falha se aparecer Seq Scan.',
+    )
+    parser.add_argument('--db-url', default=os.environ.get('DB_URL'),
+                        help='PostgreSQL com as migrações aplicadas (padrão: DB_URL)')
+    parser.add_argument('--atletas', type=int, default=10_000, help='Atletas gerados se o banco estiver vazio')
+    parser.add_argument('--seed', type=int, default=42, help='Semente do gerador de dados')
+    parser.add_argument('--verbose', action='store_true', help='Imprime o plano de cada query')
+    return parser.parse_args(argv)
+
+
+def hot_paths(sample) -> list[tuple[str, object]]:
+    from sqlalchemy import delete, update
+    from sqlalchemy.future import select
+
+    from workout_api.atleta import projection, search
+    from workout_api.atleta.models import AtletaModel
+    from workout_api.categorias.models import CategoriaModel
+    from workout_api.centro_treinamento.models import CentroTreinamentoModel
+    from workout_api.contrib.pagination import encode_cursor, keyset
+
+    atleta, categoria, centro = sample
+    listing = projection.list_stmt(projection.DEFAULT_FIELDS)
+    return [
+        ('GET /atletas/{id}', select(AtletaModel).filter_by(id=atleta.id)),
+        ('GET /atletas/{id} (If-None-Match)', (
+            select(AtletaModel.updated_at, CategoriaModel.updated_at, CentroTreinamentoModel.updated_at)
+            .join(CategoriaModel, AtletaModel.categoria_id == CategoriaModel.pk_id)
+            .join(CentroTreinamentoModel, AtletaModel.centro_treinamento_id == CentroTreinamentoModel.pk_id)
+            .where(AtletaModel.id == atleta.id)
+        )),
+        ('PATCH /atletas/{id}', update(AtletaModel).where(AtletaModel.id == atleta.id).values(nome=atleta.nome, updated_at=atleta.updated_at)),
+        ('DELETE /atletas/{id}', delete(AtletaModel).where(AtletaModel.id == atleta.id)),
+        ('GET /atletas/ (primeira página)', keyset(listing, AtletaModel, None, 20)),
+        ('GET /atletas/ (cursor)', keyset(listing, AtletaModel, encode_cursor(atleta.created_at, atleta.pk_id), 20)),
+        ('GET /atletas/?cpf=', keyset(listing.filter(AtletaModel.cpf == atleta.cpf), AtletaModel, None, 20)),
+        ('GET /atletas/search?modo=prefix', search.search_stmt('postgresql', atleta.nome[:4], 'prefix', 20)),
+        ('GET /atletas/search?modo=fuzzy', search.search_stmt('postgresql', atleta.nome, 'fuzzy', 20)),
+        ('POST /atletas/ (categoria por nome)', select(CategoriaModel.pk_id).where(CategoriaModel.nome.in_([categoria.nome]))),
+        ('POST /atletas/ (centro por nome)', select(CentroTreinamentoModel.pk_id).where(CentroTreinamentoModel.nome.in_([centro.nome]))),
+        ('GET /categorias/{id}', select(CategoriaModel).filter_by(id=categoria.id)),
+        ('GET /centros_treinamento/{ct_id}', select(CentroTreinamentoModel).filter_by(id=centro.id)),
+        # O DELETE de categoria/centro checa a FK em atletas com estas buscas.
+        ('atletas por categoria', select(AtletaModel.pk_id).where(AtletaModel.categoria_id == atleta.categoria_id)),
+        ('atletas por centro', select(AtletaModel.pk_id).where(AtletaModel.centro_treinamento_id == atleta.centro_treinamento_id)),
+    ]
+
+
+def seq_scans(node: dict) -> list[str]:
+    found = [node.get('Relation Name', '?')] if node.get('Node Type') == 'Seq Scan' else []
+    for child in node.get('Plans', []):
+        found.extend(seq_scans(child))
+    return found
+
+
+async def explain_hot_paths(engine, atletas: int = 10_000, random_seed: int = 42) -> list[tuple[str, list[str], dict]]:
+    from sqlalchemy.future import select
+
+    from benchmarks.seed import seed
+    from workout_api.atleta.models import AtletaModel
+    from workout_api.categorias.models import CategoriaModel
+    from workout_api.centro_treinamento.models import CentroTreinamentoModel
+
+    async with engine.connect() as conn:
+        empty = (await conn.execute(select(AtletaModel.pk_id).limit(1))).first() is None
+    if empty:
+        await seed(engine, 10, 20, atletas, seed=random_seed)
+
+    results = []
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql('ANALYZE')
+        sample = (
+            (await conn.execute(select(AtletaModel).order_by(AtletaModel.pk_id).limit(1))).first(),
+            (await conn.execute(select(CategoriaModel).limit(1))).first(),
+            (await conn.execute(select(CentroTreinamentoModel).limit(1))).first(),
+        )
+
+        # Com enable_seqscan desligado o planner só escolhe Seq Scan quando
+        # não há índice utilizável; assim o teste não depende do volume.
+        await conn.exec_driver_sql('SET enable_seqscan = off')
+        for name, stmt in hot_paths(sample):
+            sql = stmt.compile(dialect=conn.dialect, compile_kwargs={'literal_binds': True})
+            plan = (await conn.exec_driver_sql(f'EXPLAIN (FORMAT JSON) {sql}')).scalar()
+            plan = json.loads(plan) if isinstance(plan, str) else plan
+            results.append((name, seq_scans(plan[0]['Plan']), plan[0]['Plan']))
+        await conn.rollback()
+    return results
+
+
+async def main(args: argparse.Namespace) -> int:
+    os.environ['DB_URL'] = args.db_url
+
+    from workout_api.configs.database import engine
+
+    failures = 0
+    try:
+        if engine.dialect.name != 'postgresql':
+            print('O EXPLAIN das rotas quentes exige PostgreSQL.', file=sys.stderr)
+            return 2
+
+        for name, scans, plan in await explain_hot_paths(engine, args.atletas, args.seed):
+            status = f'Seq Scan em {", ".join(sorted(set(scans)))}' if scans else 'ok'
+            print(f'{name:<42} {status}')
+            if args.verbose:
+                print(json.dumps(plan, indent=2))
+            failures += bool(scans)
+    finally:
+        await engine.dispose()
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    if not args.db_url:
+        print('Informe --db-url ou DB_URL apontando para um PostgreSQL.', file=sys.stderr)
+        sys.exit(2)
+    sys.exit(asyncio.run(main(args)))
@@ -0,0 +1,117 @@
+import asyncio
+import math
+import random
+import time
+from dataclasses import asdict, dataclass
+
+import httpx
+from fastapi.routing import APIRoute
+
+from benchmarks.scenarios import SCENARIOS, ScenarioState
+
+
+@dataclass
+class RouteResult:
+    method: str
+    route: str
+    requests: int
+    errors: int
+    skipped: int
+    p50_ms: float | None
+    p95_ms: float | None
+    p99_ms: float | None
+    mean_ms: float | None
+    rps: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def percentile(samples: list[float], pct: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def app_routes(app) -> list[tuple[str, str]]:
+    routes = []
+    for route in app.routes:
+        if isinstance(route, APIRoute):
+            routes.extend((method, route.path) for method in sorted(route.methods))
+    # DELETE por último: consome os registros que os cenários de PATCH usam.
+    return sorted(routes, key=lambda item: item[0] == 'DELETE')
+
+
+async def _run_route(
+    client: httpx.AsyncClient, state: ScenarioState, method: str, route: str, requests: int, concurrency: int
+) -> RouteResult:
+    build = SCENARIOS[(method, route)]
+    latencies: list[float] = []
+    errors = skipped = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(requests):
+        queue.put_nowait(None)
+
+    async def worker():
+        nonlocal errors, skipped
+        while True:
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            request = build(state)
+            if request is None:
+                skipped += 1
+                continue
+            start = time.perf_counter()
+            try:
+                response = await client.request(request.method, request.url, params=request.params, json=request.json)
+                await response.aread()
+                if response.status_code >= 400:
+                    errors += 1
+                elif response.status_code == 202 and 'location' in response.headers:
+                    state.job_urls.append(response.headers['location'])
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return RouteResult(
+        method=method,
+        route=route,
+        requests=len(latencies),
+        errors=errors,
+        skipped=skipped,
+        p50_ms=percentile(latencies, 50),
+        p95_ms=percentile(latencies, 95),
+        p99_ms=percentile(latencies, 99),
+        mean_ms=sum(latencies) / len(latencies) if latencies else None,
+        rps=len(latencies) / elapsed if elapsed > 0 else 0.0,
+    )
+
+
+async def run(
+    client: httpx.AsyncClient,
+    routes: list[tuple[str, str]],
+    state: ScenarioState,
+    requests: int,
+    concurrency: int,
+    warmup: int = 5,
+) -> tuple[list[RouteResult], list[tuple[str, str]]]:
+    results, uncovered = [], []
+    for method, route in routes:
+        if (method, route) not in SCENARIOS:
+            uncovered.append((method, route))
+            continue
+        if warmup and method == 'GET':
+            await _run_route(client, state, method, route, warmup, 1)
+        results.append(await _run_route(client, state, method, route, requests, concurrency))
+    return results, uncovered
+
+
+def new_state(data, seed: int) -> ScenarioState:
+    return ScenarioState(data, random.Random(seed))
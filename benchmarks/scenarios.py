@@ -0,0 +1,131 @@
+import itertools
+import random
+from dataclasses import dataclass
+from typing import Callable
+
+from benchmarks.seed import SeedData
+
+
+@dataclass
+class Request:
+    method: str
+    url: str
+    params: dict | None = None
+    json: object | None = None
+
+
+class ScenarioState:
+    def __init__(self, data: SeedData, rng: random.Random) -> None:
+        self.data = data
+        self.rng = rng
+        self._cpfs = itertools.count(90_000_000_000)
+        self._names = itertools.count()
+        # Preenchido pelo runner com o Location dos 202 do write-behind.
+        self.job_urls: list[str] = []
+
+    def atleta_payload(self) -> dict:
+        _, categoria = self.rng.choice(self.data.categorias)
+        _, centro = self.rng.choice(self.data.centros)
+        return {
+            'nome': 'Atleta Benchmark',
+            'cpf': str(next(self._cpfs)),
+            'idade': self.rng.randint(14, 70),
+            'peso': round(self.rng.uniform(45, 130), 1),
+            'altura': round(self.rng.uniform(1.45, 2.1), 2),
+            'genero': self.rng.choice('MF'),
+            'categoria': {'nome': categoria},
+            'centro_treinamento': {'nome': centro},
+        }
+
+    def unique_name(self, prefix: str) -> str:
+        return f'{prefix}{next(self._names)}'
+
+    def atleta_id(self) -> str:
+        return str(self.rng.choice(self.data.atletas)[0])
+
+    def search_term(self) -> str:
+        return self.rng.choice(self.data.atletas)[1].split()[0][:4]
+
+
+def _job_status(s: ScenarioState) -> Request | None:
+    if not s.job_urls:
+        return None
+    return Request('GET', s.rng.choice(s.job_urls))
+
+
+def _delete_atleta(s: ScenarioState) -> Request | None:
+    if not s.data.spare_atletas:
+        return None
+    return Request('DELETE', f'/atletas/{s.data.spare_atletas.pop()}')
+
+
+# As rotas de categoria declaram {categoria_id} no path, mas o handler lê
+# o UUID do parâmetro de query `id`; o benchmark envia os dois.
+def _get_categoria(s: ScenarioState) -> Request:
+    id = str(s.rng.choice(s.data.categorias)[0])
+    return Request('GET', f'/categorias/{id}', params={'id': id})
+
+
+def _patch_categoria(s: ScenarioState) -> Request | None:
+    if not s.data.spare_categorias:
+        return None
+    id = str(s.rng.choice(s.data.spare_categorias))
+    return Request('PATCH', f'/categorias/{id}', params={'id': id}, json={'nome': s.unique_name('p')})
+
+
+def _delete_categoria(s: ScenarioState) -> Request | None:
+    if not s.data.spare_categorias:
+        return None
+    id = str(s.data.spare_categorias.pop())
+    return Request('DELETE', f'/categorias/{id}', params={'id': id})
+
+
+def _centro_payload(s: ScenarioState, prefix: str) -> dict:
+    return {'nome': s.unique_name(prefix), 'endereco': 'Rua A, 1', 'proprietario': 'Benchmark'}
+
+
+def _patch_centro(s: ScenarioState) -> Request | None:
+    if not s.data.spare_centros:
+        return None
+    return Request('PATCH', f'/centros_treinamento/{s.rng.choice(s.data.spare_centros)}', json=_centro_payload(s, 'CT P'))
+
+
+def _delete_centro(s: ScenarioState) -> Request | None:
+    if not s.data.spare_centros:
+        return None
+    return Request('DELETE', f'/centros_treinamento/{s.data.spare_centros.pop()}')
+
+
+# Rotas de escrita consomem registros "spare" do seed; quando eles acabam
+# a requisição é pulada em vez de contar como erro.
+SCENARIOS: dict[tuple[str, str], Callable[[ScenarioState], Request | None]] = {
+    ('POST', '/atletas/'): lambda s: Request('POST', '/atletas/', json=s.atleta_payload()),
+    ('POST', '/atletas/bulk'): lambda s: Request('POST', '/atletas/bulk', json=[s.atleta_payload() for _ in range(50)]),
+    ('GET', '/atletas/'): lambda s: Request('GET', '/atletas/', params={'limit': 50}),
+    ('GET', '/atletas/export'): lambda s: Request('GET', '/atletas/export'),
+    ('GET', '/atletas/search'): lambda s: Request('GET', '/atletas/search', params={'q': s.search_term(), 'modo': 'prefix'}),
+    ('GET', '/atletas/stats'): lambda s: Request('GET', '/atletas/stats', params={'group_by': 'categoria'}),
+    ('GET', '/atletas/jobs/{job_id}'): _job_status,
+    ('GET', '/atletas/{id}'): lambda s: Request('GET', f'/atletas/{s.atleta_id()}'),
+    # Lote em dry-run: mede o filtro/contagem sem esvaziar o banco entre rodadas.
+    ('PATCH', '/atletas/bulk'): lambda s: Request('PATCH', '/atletas/bulk', params={'dry_run': 'true'}, json={
+        'filtro': {'centro_treinamento': s.rng.choice(s.data.centros)[1]},
+        'alteracoes': {'categoria': s.rng.choice(s.data.categorias)[1]},
+    }),
+    ('DELETE', '/atletas/bulk'): lambda s: Request('DELETE', '/atletas/bulk', params={'dry_run': 'true'}, json={
+        'centro_treinamento': s.rng.choice(s.data.centros)[1],
+    }),
+    ('PATCH', '/atletas/{id}'): lambda s: Request('PATCH', f'/atletas/{s.atleta_id()}', json={'idade': s.rng.randint(14, 70)}),
+    ('DELETE', '/atletas/{id}'): _delete_atleta,
+    ('POST', '/categorias/'): lambda s: Request('POST', '/categorias/', json={'nome': s.unique_name('b')}),
+    ('GET', '/categorias/'): lambda s: Request('GET', '/categorias/'),
+    ('GET', '/categorias/{categoria_id}'): _get_categoria,
+    ('PATCH', '/categorias/{categoria_id}'): _patch_categoria,
+    ('DELETE', '/categorias/{categoria_id}'): _delete_categoria,
+    ('POST', '/centros_treinamento/'): lambda s: Request('POST', '/centros_treinamento/', json=_centro_payload(s, 'CT B')),
+    ('GET', '/centros_treinamento/'): lambda s: Request('GET', '/centros_treinamento/'),
+    ('GET', '/centros_treinamento/{ct_id}'): lambda s: Request('GET', f'/centros_treinamento/{s.rng.choice(s.data.centros)[0]}'),
+    ('PATCH', '/centros_treinamento/{ct_id}'): _patch_centro,
+    ('DELETE', '/centros_treinamento/{ct_id}'): _delete_centro,
+    ('GET', '/metrics'): lambda s: Request('GET', '/metrics'),
+}
@@ -0,0 +1,121 @@
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.stats import atletas_resumo
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.contrib.models import BaseModel
+
+FIRST_NAMES = ('Ana', 'Bruno', 'Carla', 'Diego', 'Eduarda', 'Felipe', 'Gabriela', 'Heitor', 'Isabela', 'João',
+               'Karina', 'Lucas', 'Mariana', 'Nicolas', 'Olívia', 'Pedro', 'Rafaela', 'Sérgio', 'Tatiane', 'Vinícius')
+LAST_NAMES = ('Silva', 'Santos', 'Oliveira', 'Souza', 'Rodrigues', 'Ferreira', 'Alves', 'Pereira', 'Lima', 'Gomes',
+              'Costa', 'Ribeiro', 'Martins', 'Carvalho', 'Almeida', 'Lopes', 'Soares', 'Fernandes', 'Vieira', 'Barbosa')
+CHUNK_SIZE = 1000
+
+
+@dataclass
+class SeedData:
+    categorias: list[tuple[UUID, str]] = field(default_factory=list)
+    centros: list[tuple[UUID, str]] = field(default_factory=list)
+    atletas: list[tuple[UUID, str]] = field(default_factory=list)
+    # Registros sem dependentes, consumidos pelos cenários de PATCH/DELETE.
+    spare_categorias: list[UUID] = field(default_factory=list)
+    spare_centros: list[UUID] = field(default_factory=list)
+    spare_atletas: list[UUID] = field(default_factory=list)
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+async def _insert(engine: AsyncEngine, model, rows: list[dict]) -> list[int]:
+    # pk_id fica a cargo do banco para não dessincronizar as sequences do Postgres.
+    stmt = insert(model).returning(model.pk_id, sort_by_parameter_order=True)
+    pk_ids: list[int] = []
+    async with engine.begin() as conn:
+        for start in range(0, len(rows), CHUNK_SIZE):
+            pk_ids.extend((await conn.execute(stmt, rows[start:start + CHUNK_SIZE])).scalars().all())
+    return pk_ids
+
+
+async def seed(
+    engine: AsyncEngine,
+    categorias: int,
+    centros: int,
+    atletas: int,
+    spare: int = 0,
+    seed: int = 42,
+    create_schema: bool = False,
+) -> SeedData:
+    rng = random.Random(seed)
+    data = SeedData()
+
+    if create_schema:
+        async with engine.begin() as conn:
+            if conn.dialect.name == 'postgresql':
+                # O índice trigram do nome exige a extensão, e a tabela de resumo das
+                # migrações tem FKs para categorias/centros que impedem o drop_all.
+                # Sem ela (e sem o trigger), as estatísticas usam a agregação direta.
+                await conn.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+                await conn.run_sync(atletas_resumo.drop, checkfirst=True)
+            await conn.run_sync(BaseModel.metadata.drop_all)
+            await conn.run_sync(BaseModel.metadata.create_all)
+
+    categoria_rows = [{'id': _uuid(rng), 'nome': f'cat{index}'} for index in range(categorias + spare)]
+    data.categorias = [(row['id'], row['nome']) for row in categoria_rows[:categorias]]
+    data.spare_categorias = [row['id'] for row in categoria_rows[categorias:]]
+    categoria_ids = (await _insert(engine, CategoriaModel, categoria_rows))[:categorias]
+
+    centro_rows = [
+        {
+            'id': _uuid(rng),
+            'nome': f'CT {index}',
+            'endereco': f'Rua {rng.choice(LAST_NAMES)}, {rng.randint(1, 999)}',
+            'proprietario': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+        }
+        for index in range(centros + spare)
+    ]
+    data.centros = [(row['id'], row['nome']) for row in centro_rows[:centros]]
+    data.spare_centros = [row['id'] for row in centro_rows[centros:]]
+    centro_ids = (await _insert(engine, CentroTreinamentoModel, centro_rows))[:centros]
+
+    start = datetime(2024, 1, 1)
+    atleta_rows = [
+        {
+            'id': _uuid(rng),
+            'nome': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'cpf': f'{index:011d}',
+            'idade': rng.randint(14, 70),
+            'peso': round(rng.uniform(45, 130), 1),
+            'altura': round(rng.uniform(1.45, 2.10), 2),
+            'genero': rng.choice('MF'),
+            'created_at': start + timedelta(seconds=index),
+            'categoria_id': rng.choice(categoria_ids),
+            'centro_treinamento_id': rng.choice(centro_ids),
+        }
+        for index in range(atletas + spare)
+    ]
+    data.atletas = [(row['id'], row['nome']) for row in atleta_rows[:atletas]]
+    data.spare_atletas = [row['id'] for row in atleta_rows[atletas:]]
+    await _insert(engine, AtletaModel, atleta_rows)
+
+    return data
+
+
+async def load_existing(engine: AsyncEngine, limit: int = 10_000) -> SeedData:
+    # Sem registros "spare", os cenários de DELETE/PATCH destrutivos são pulados.
+    async with engine.connect() as conn:
+        categorias = (await conn.execute(select(CategoriaModel.id, CategoriaModel.nome))).all()
+        centros = (await conn.execute(select(CentroTreinamentoModel.id, CentroTreinamentoModel.nome))).all()
+        atletas = (await conn.execute(select(AtletaModel.id, AtletaModel.nome).limit(limit))).all()
+    return SeedData(
+        categorias=[tuple(row) for row in categorias],
+        centros=[tuple(row) for row in centros],
+        atletas=[tuple(row) for row in atletas],
+    )
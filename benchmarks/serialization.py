@@ -0,0 +1,64 @@
+"""Compara o caminho padrão de resposta do FastAPI com o caminho rápido.
+
+    python -m benchmarks.serialization --rows 1000
+"""
+import argparse
+import json
+import random
+import timeit
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+
+from workout_api.atleta.schemas import AtletaListOut
+from workout_api.categorias.schemas import CategoriaOut
+from workout_api.contrib.responses import orjson, render, type_adapter
+
+
+def _atleta_rows(rows: int) -> list[dict]:
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            'id': uuid4(), 'nome': f'Atleta {index}', 'cpf': f'{index:011d}', 'idade': rng.randint(14, 70),
+            'peso': round(rng.uniform(45, 130), 1), 'altura': round(rng.uniform(1.45, 2.1), 2),
+            'genero': rng.choice('MF'), 'created_at': start + timedelta(seconds=index),
+            'categoria': 'cat1', 'centro_treinamento': 'CT 1',
+        }
+        for index in range(rows)
+    ]
+
+
+def _categorias(rows: int) -> list[CategoriaOut]:
+    return [CategoriaOut(id=uuid4(), nome=f'cat{index}') for index in range(rows)]
+
+
+def _default_path(tp, value) -> bytes:
+    # Equivalente ao que o FastAPI faz com response_model: valida, converte
+    # com jsonable_encoder e serializa com json da stdlib.
+    validated = type_adapter(tp).validate_python(value, from_attributes=True)
+    content = jsonable_encoder(type_adapter(tp).dump_python(validated, mode='json', exclude_unset=True))
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(',', ':')).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.serialization')
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    cases = [
+        ('atletas (dict rows)', list[AtletaListOut], _atleta_rows(args.rows), lambda value: render(value)),
+        ('categorias (cache)', list[CategoriaOut], _categorias(args.rows), lambda value: render(value, list[CategoriaOut])),
+    ]
+    print(f'{args.rows} linhas, {args.repeat} repetições, orjson={"sim" if orjson else "não"}')
+    print(f'{"caso":<22} {"padrão ms":>10} {"rápido ms":>10} {"ganho":>7}')
+    for name, tp, value, fast in cases:
+        default_ms = min(timeit.repeat(lambda: _default_path(tp, value), number=1, repeat=args.repeat)) * 1000
+        fast_ms = min(timeit.repeat(lambda: fast(value), number=1, repeat=args.repeat)) * 1000
+        print(f'{name:<22} {default_ms:10.3f} {fast_ms:10.3f} {default_ms / fast_ms:6.1f}x')
+
+
+if __name__ == '__main__':
+    main()
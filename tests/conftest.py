@@ -0,0 +1,76 @@
+import os
+import tempfile
+
+# A aplicação lê as configurações no import: o banco de teste precisa estar
+# definido antes de qualquer import de workout_api.
+_db_dir = tempfile.mkdtemp(prefix='workout-api-tests-')
+os.environ['DB_URL'] = f"sqlite+aiosqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ.setdefault('WARMUP_ENABLED', 'false')
+
+import httpx
+import pytest
+
+from workout_api.configs import database
+from workout_api.contrib import cache
+from workout_api.contrib.models import BaseModel
+from workout_api.main import app
+
+
+@pytest.fixture(scope='session')
+def anyio_backend():
+    return 'asyncio'
+
+
+@pytest.fixture
+async def db():
+    async with database.engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.drop_all)
+        await conn.run_sync(BaseModel.metadata.create_all)
+    for reference in cache.registry.values():
+        reference.clear()
+    yield database.engine
+    await database.engine.dispose()
+
+
+def make_client(asgi_app=app, **kwargs) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=asgi_app, **kwargs), base_url='http://testserver')
+
+
+@pytest.fixture
+async def client(db):
+    async with make_client() as c:
+        yield c
+
+
+def atleta_payload(i: int, **overrides) -> dict:
+    payload = {
+        'nome': f'Atleta {i}',
+        'cpf': f'{i:011d}',
+        'idade': 20 + i % 10,
+        'peso': 70.0 + i,
+        'altura': 1.75,
+        'genero': 'MF'[i % 2],
+        'categoria': {'nome': 'Scale'},
+        'centro_treinamento': {'nome': 'CT King'},
+    }
+    payload.update(overrides)
+    return payload
+
+
+@pytest.fixture
+async def referencias(client):
+    await client.post('/categorias/', json={'nome': 'Scale'})
+    await client.post('/categorias/', json={'nome': 'RX'})
+    await client.post('/centros_treinamento/', json={'nome': 'CT King', 'endereco': 'Rua X, 10', 'proprietario': 'Marcos'})
+    await client.post('/centros_treinamento/', json={'nome': 'CT Queen', 'endereco': 'Rua Y, 20', 'proprietario': 'Ana'})
+
+
+@pytest.fixture
+def seed(client, referencias):
+    async def seed(n: int = 5, **overrides) -> list[dict]:
+        payloads = [atleta_payload(i, **overrides) for i in range(n)]
+        response = await client.post('/atletas/bulk', json=payloads)
+        assert response.status_code == 200, response.text
+        return response.json()['results']
+
+    return seed
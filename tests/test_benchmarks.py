@@ -0,0 +1,33 @@
+import pytest
+
+from benchmarks.runner import app_routes, new_state, percentile, run
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.seed import seed
+from workout_api.main import app
+
+pytestmark = pytest.mark.anyio
+
+
+def test_every_route_has_a_scenario():
+    assert [route for route in app_routes(app) if route not in SCENARIOS] == []
+
+
+def test_deletes_run_last():
+    methods = [method for method, _ in app_routes(app)]
+
+    assert methods.index('DELETE') == len(methods) - methods.count('DELETE')
+
+
+def test_percentile_uses_nearest_rank():
+    samples = [float(value) for value in range(1, 101)]
+
+    assert (percentile(samples, 50), percentile(samples, 99), percentile([], 50)) == (50.0, 99.0, None)
+
+
+async def test_every_scenario_runs_without_errors(db, client):
+    data = await seed(db, categorias=3, centros=3, atletas=20, spare=4)
+
+    results, uncovered = await run(client, app_routes(app), new_state(data, 42), requests=4, concurrency=2, warmup=0)
+
+    assert uncovered == []
+    assert {f'{r.method} {r.route}': r.errors for r in results if r.errors} == {}
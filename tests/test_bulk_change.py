@@ -0,0 +1,102 @@
+from uuid import uuid4
+
+import pytest
+
+from tests.conftest import atleta_payload
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def atletas(client, referencias):
+    payload = [atleta_payload(i, centro_treinamento={'nome': 'CT King' if i < 3 else 'CT Queen'}) for i in range(5)]
+    return [r['id'] for r in (await client.post('/atletas/bulk', json=payload)).json()['results']]
+
+
+async def _categorias(client) -> dict[str, str]:
+    response = await client.get('/atletas/', params={'fields': 'cpf,categoria', 'limit': 100})
+    return {item['cpf']: item['categoria'] for item in response.json()['items']}
+
+
+async def test_patch_moves_every_matching_athlete(client, atletas):
+    response = await client.patch('/atletas/bulk', json={
+        'filtro': {'centro_treinamento': 'CT King'}, 'alteracoes': {'categoria': 'RX'},
+    })
+
+    assert response.json() == {'afetados': 3, 'dry_run': False}
+    assert list((await _categorias(client)).values()) == ['RX', 'RX', 'RX', 'Scale', 'Scale']
+
+
+async def test_dry_run_counts_without_writing(client, atletas):
+    response = await client.patch('/atletas/bulk', params={'dry_run': True}, json={
+        'filtro': {'categoria': 'Scale'}, 'alteracoes': {'categoria': 'RX'},
+    })
+
+    assert response.json() == {'afetados': 5, 'dry_run': True}
+    assert set((await _categorias(client)).values()) == {'Scale'}
+
+
+async def test_ids_are_listed_only_on_request(client, atletas):
+    response = await client.patch('/atletas/bulk', params={'listar_ids': True}, json={
+        'filtro': {'ids': atletas[:2]}, 'alteracoes': {'categoria': 'RX'},
+    })
+
+    assert sorted(response.json()['ids']) == sorted(atletas[:2])
+
+
+async def test_patch_invalidates_cached_athletes(client, atletas):
+    path = f'/atletas/{atletas[0]}'
+    etag = (await client.get(path)).headers['etag']
+
+    await client.patch('/atletas/bulk', json={'filtro': {'ids': [atletas[0]]}, 'alteracoes': {'categoria': 'RX'}})
+
+    response = await client.get(path, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.json()['categoria']['nome'] == 'RX'
+
+
+async def test_delete_by_filters(client, atletas):
+    response = await client.delete('/atletas/bulk', params={'centro_treinamento': 'CT Queen', 'listar_ids': True})
+
+    assert response.json()['afetados'] == 2
+    assert sorted(response.json()['ids']) == sorted(atletas[3:])
+    assert len(await _categorias(client)) == 3
+
+
+async def test_delete_by_ids_in_the_body(client, atletas):
+    ids = atletas[:2] + [str(uuid4()) for _ in range(998)]
+
+    response = await client.request('DELETE', '/atletas/bulk', params={'listar_ids': True}, json={'ids': ids})
+
+    assert response.json()['afetados'] == 2
+    assert sorted(response.json()['ids']) == sorted(atletas[:2])
+
+
+async def test_delete_rejects_filters_in_query_and_body(client, atletas):
+    response = await client.request(
+        'DELETE', '/atletas/bulk', params={'categoria': 'Scale'}, json={'centro_treinamento': 'CT Queen'},
+    )
+
+    assert response.status_code == 422
+
+
+async def test_delete_without_filter_is_rejected(client, atletas):
+    response = await client.delete('/atletas/bulk')
+
+    assert response.status_code == 422
+    assert response.json()['detail'] == 'Informe ao menos um filtro: centro_treinamento, categoria ou ids.'
+
+
+async def test_patch_without_changes_is_rejected(client, atletas):
+    response = await client.patch('/atletas/bulk', json={'filtro': {'categoria': 'Scale'}, 'alteracoes': {}})
+
+    assert response.status_code == 422
+
+
+async def test_unknown_reference_returns_404(client, atletas):
+    response = await client.patch('/atletas/bulk', json={
+        'filtro': {'categoria': 'Scale'}, 'alteracoes': {'centro_treinamento': 'CT Nenhum'},
+    })
+
+    assert response.status_code == 404
+    assert response.json()['detail'] == 'Centro de treinamento CT Nenhum não encontrado.'
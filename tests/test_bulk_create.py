@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from tests.conftest import atleta_payload
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_bulk_create_reports_each_item(client, referencias):
+    payload = [
+        atleta_payload(1),
+        atleta_payload(2),
+        atleta_payload(1, nome='Repetido'),
+        atleta_payload(3, categoria={'nome': 'Elite'}),
+        {'nome': 'Sem CPF'},
+    ]
+
+    response = await client.post('/atletas/bulk', json=payload)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body['created'], body['duplicates'], body['rejected']) == (2, 1, 2)
+    assert [r['status'] for r in body['results']] == ['created', 'created', 'duplicate', 'rejected', 'rejected']
+    assert body['results'][3]['detail'] == 'Categoria Elite não encontrada.'
+
+
+async def test_bulk_create_marks_existing_cpfs_as_duplicates(client, seed):
+    await seed(2)
+
+    response = await client.post('/atletas/bulk', json=[atleta_payload(0), atleta_payload(5)])
+
+    assert [r['status'] for r in response.json()['results']] == ['duplicate', 'created']
+
+
+async def test_bulk_create_accepts_ndjson(client, referencias):
+    body = '\n'.join(json.dumps(atleta_payload(i)) for i in range(3)) + '\n'
+
+    response = await client.post('/atletas/bulk', content=body, headers={'content-type': 'application/x-ndjson'})
+
+    assert response.json()['created'] == 3
+
+
+async def test_bulk_create_rejects_only_the_malformed_ndjson_line(client, referencias):
+    lines = [json.dumps(atleta_payload(0)), '{"nome": "Atleta 1", ', json.dumps(atleta_payload(2))]
+
+    response = await client.post(
+        '/atletas/bulk', content='\n'.join(lines), headers={'content-type': 'application/x-ndjson'},
+    )
+
+    assert response.status_code == 200
+    results = response.json()['results']
+    assert [r['status'] for r in results] == ['created', 'rejected', 'created']
+    assert results[1]['index'] == 1 and results[1]['detail'].startswith('JSON inválido')
+
+
+async def test_bulk_create_rejects_non_list_body(client, referencias):
+    response = await client.post('/atletas/bulk', json=atleta_payload(1))
+
+    assert response.status_code == 422
+    assert response.json()['detail'] == 'O corpo deve ser uma lista JSON ou um stream NDJSON de atletas.'
+
+
+async def test_bulk_create_rejects_invalid_json(client, referencias):
+    response = await client.post('/atletas/bulk', content=b'[{', headers={'content-type': 'application/json'})
+
+    assert response.status_code == 422
+    assert response.json()['detail'] == 'JSON inválido no corpo da requisição.'
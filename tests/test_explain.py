@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from benchmarks.explain import explain_hot_paths, seq_scans
+from benchmarks.seed import seed
+
+pytestmark = pytest.mark.anyio
+
+# Os planos só fazem sentido no PostgreSQL com as migrações aplicadas; no CI
+# o workflow sobe um serviço postgres e define esta variável.
+POSTGRES_URL = os.environ.get('TEST_POSTGRES_URL')
+ROOT = Path(__file__).resolve().parent.parent
+
+requires_postgres = pytest.mark.skipif(not POSTGRES_URL, reason='TEST_POSTGRES_URL não definido')
+
+
+def alembic(*args: str) -> None:
+    # Em subprocesso: as settings da app já foram carregadas com o SQLite dos testes.
+    subprocess.run(
+        [sys.executable, '-m', 'alembic', *args], cwd=ROOT, check=True, env={**os.environ, 'DB_URL': POSTGRES_URL},
+    )
+
+
+@pytest.fixture(scope='module')
+def postgres():
+    alembic('upgrade', 'head')
+    return POSTGRES_URL
+
+
+@pytest.fixture
+async def pg_engine(postgres):
+    engine = create_async_engine(postgres)
+    yield engine
+    await engine.dispose()
+
+
+def test_seq_scans_walks_the_whole_plan():
+    plan = {
+        'Node Type': 'Nested Loop',
+        'Plans': [
+            {'Node Type': 'Index Scan', 'Relation Name': 'atletas'},
+            {'Node Type': 'Hash', 'Plans': [{'Node Type': 'Seq Scan', 'Relation Name': 'categorias'}]},
+        ],
+    }
+
+    assert seq_scans(plan) == ['categorias']
+
+
+@requires_postgres
+async def test_hot_paths_use_indexes(pg_engine):
+    results = await explain_hot_paths(pg_engine, atletas=2000)
+
+    assert {name: scans for name, scans, _ in results if scans} == {}
+
+
+@requires_postgres
+async def test_upgrade_rebuilds_an_invalid_index(pg_engine):
+    # Simula um CREATE INDEX CONCURRENTLY interrompido na migração 0007.
+    alembic('downgrade', '0006')
+    async with pg_engine.begin() as conn:
+        await conn.execute(text('CREATE INDEX ix_atletas_categoria_id ON atletas (categoria_id)'))
+        await conn.execute(text(
+            "UPDATE pg_index SET indisvalid = false WHERE indexrelid = 'ix_atletas_categoria_id'::regclass"
+        ))
+
+    alembic('upgrade', 'head')
+
+    async with pg_engine.connect() as conn:
+        valid = (await conn.execute(text(
+            "SELECT indisvalid FROM pg_index WHERE indexrelid = 'ix_atletas_categoria_id'::regclass"
+        ))).scalar()
+    assert valid is True
+
+
+@requires_postgres
+async def test_seed_recreates_the_schema_of_a_migrated_database(pg_engine):
+    # Por último: recria o schema por fora das migrações.
+    data = await seed(pg_engine, categorias=2, centros=2, atletas=10, create_schema=True)
+
+    async with pg_engine.connect() as conn:
+        total = (await conn.execute(text('SELECT count(*) FROM atletas'))).scalar()
+    assert total == len(data.atletas) == 10
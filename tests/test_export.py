@@ -0,0 +1,57 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from workout_api.configs.settings import settings
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_ndjson_export_streams_every_athlete(client, seed, monkeypatch):
+    monkeypatch.setattr(settings, 'EXPORT_BATCH_SIZE', 2)
+    await seed(5)
+
+    response = await client.get('/atletas/export', params={'fields': 'nome,categoria'})
+
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {'nome': f'Atleta {i}', 'categoria': 'Scale'} for i in range(5)
+    ]
+
+
+async def test_csv_export_has_a_header_row(client, seed):
+    await seed(2)
+
+    response = await client.get('/atletas/export', params={'format': 'csv', 'fields': 'cpf,idade'})
+
+    assert response.headers['content-type'] == 'text/csv; charset=utf-8'
+    assert response.headers['content-disposition'] == 'attachment; filename="atletas.csv"'
+    assert list(csv.reader(io.StringIO(response.text))) == [['cpf', 'idade'], ['00000000000', '20'], ['00000000001', '21']]
+
+
+async def test_gzip_export_is_a_gz_file(client, seed):
+    await seed(3)
+
+    response = await client.get('/atletas/export', params={'gzip': True})
+
+    assert response.headers['content-type'] == 'application/gzip'
+    assert 'content-encoding' not in response.headers
+    assert response.headers['content-disposition'] == 'attachment; filename="atletas.ndjson.gz"'
+    lines = gzip.decompress(response.content).decode().splitlines()
+    assert [json.loads(line)['nome'] for line in lines] == ['Atleta 0', 'Atleta 1', 'Atleta 2']
+
+
+async def test_empty_table_exports_only_the_header(client, referencias):
+    response = await client.get('/atletas/export', params={'format': 'csv', 'fields': 'nome'})
+
+    assert response.status_code == 200
+    assert response.text.splitlines() == ['nome']
+
+
+async def test_invalid_field_returns_400(client, referencias):
+    response = await client.get('/atletas/export', params={'fields': 'senha'})
+
+    assert response.status_code == 400
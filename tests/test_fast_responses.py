@@ -0,0 +1,36 @@
+import pytest
+
+from workout_api.configs.settings import settings
+
+pytestmark = pytest.mark.anyio
+
+LISTINGS = [
+    ('/atletas/', {'limit': 2}),
+    ('/atletas/', {'paginacao': 'offset', 'fields': 'id,nome,created_at,peso'}),
+    ('/atletas/search', {'q': 'atleta'}),
+    ('/categorias/', {}),
+    ('/centros_treinamento/', {}),
+]
+
+
+@pytest.mark.parametrize('path, params', LISTINGS)
+async def test_fast_path_matches_the_default_path(client, seed, monkeypatch, path, params):
+    await seed(3)
+    default = await client.get(path, params=params)
+
+    monkeypatch.setattr(settings, 'FAST_RESPONSES', True)
+    fast = await client.get(path, params=params)
+
+    assert fast.status_code == default.status_code == 200
+    assert fast.headers['content-type'] == 'application/json'
+    assert fast.json() == default.json()
+
+
+async def test_fast_path_keeps_cache_headers(client, referencias, monkeypatch):
+    monkeypatch.setattr(settings, 'FAST_RESPONSES', True)
+
+    response = await client.get('/categorias/')
+
+    assert response.headers['etag']
+    assert response.headers['content-length'] == str(len(response.content))
+    assert (await client.get('/categorias/', headers={'If-None-Match': response.headers['etag']})).status_code == 304
@@ -0,0 +1,74 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_atleta_revalidation_returns_304(client, seed):
+    path = f"/atletas/{(await seed(1))[0]['id']}"
+
+    first = await client.get(path)
+    etag = first.headers['etag']
+    assert first.headers['cache-control'] == 'max-age=0, must-revalidate'
+
+    response = await client.get(path, headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.content == b''
+    assert response.headers['etag'] == etag
+
+
+async def test_atleta_etag_changes_after_update(client, seed):
+    path = f"/atletas/{(await seed(1))[0]['id']}"
+    etag = (await client.get(path)).headers['etag']
+
+    await client.patch(path, json={'idade': 40})
+    response = await client.get(path, headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert response.json()['idade'] == 40
+    assert response.headers['etag'] != etag
+
+
+async def test_atleta_etag_changes_when_its_categoria_is_renamed(client, seed):
+    path = f"/atletas/{(await seed(1))[0]['id']}"
+    etag = (await client.get(path)).headers['etag']
+    categoria = next(c for c in (await client.get('/categorias/')).json() if c['nome'] == 'Scale')
+
+    await client.patch(f"/categorias/{categoria['id']}", params={'id': categoria['id']}, json={'nome': 'Iniciante'})
+    response = await client.get(path, headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert response.json()['categoria']['nome'] == 'Iniciante'
+
+
+async def test_if_modified_since_uses_last_modified(client, seed):
+    path = f"/atletas/{(await seed(1))[0]['id']}"
+    last_modified = (await client.get(path)).headers['last-modified']
+
+    response = await client.get(path, headers={'If-Modified-Since': last_modified})
+
+    assert response.status_code == 304
+
+
+async def test_if_modified_since_without_timezone(client, seed):
+    path = f"/atletas/{(await seed(1))[0]['id']}"
+
+    response = await client.get(path, headers={'If-Modified-Since': 'Sat, 01 Jan 2000 00:00:00 -0000'})
+    categorias = await client.get('/categorias/', headers={'If-Modified-Since': 'Sat, 01 Jan 2000 00:00:00 -0000'})
+
+    assert (response.status_code, categorias.status_code) == (200, 200)
+
+
+async def test_conditional_request_for_missing_atleta_returns_404(client, referencias):
+    response = await client.get('/atletas/3fa85f64-5717-4562-b3fc-2c963f66afa6', headers={'If-None-Match': '"x"'})
+
+    assert response.status_code == 404
+
+
+async def test_reference_listing_revalidation(client, referencias):
+    first = await client.get('/categorias/')
+    assert first.headers['cache-control'] == 'max-age=60, must-revalidate'
+
+    assert (await client.get('/categorias/', headers={'If-None-Match': first.headers['etag']})).status_code == 304
+    await client.post('/categorias/', json={'nome': 'Master'})
+    assert (await client.get('/categorias/', headers={'If-None-Match': first.headers['etag']})).status_code == 200
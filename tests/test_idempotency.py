@@ -0,0 +1,100 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from tests.conftest import atleta_payload, make_client
+from workout_api.configs.settings import settings
+from workout_api.contrib.idempotency import DatabaseIdempotencyStore, StoredResponse
+from workout_api.main import app
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def key():
+    # As chaves em memória sobrevivem entre testes; cada teste usa uma nova.
+    return {'Idempotency-Key': str(uuid4())}
+
+
+async def _total_atletas(client) -> int:
+    response = await client.get('/atletas/', params={'limit': 100})
+    return len(response.json()['items']) if response.status_code == 200 else 0
+
+
+async def test_retry_replays_the_stored_response(client, referencias, key):
+    first = await client.post('/atletas/', json=atleta_payload(1), headers=key)
+    retry = await client.post('/atletas/', json=atleta_payload(1), headers=key)
+
+    assert (first.status_code, retry.status_code) == (201, 201)
+    assert retry.json() == first.json()
+    assert retry.headers['idempotent-replayed'] == 'true'
+    assert await _total_atletas(client) == 1
+
+
+async def test_same_key_with_another_body_returns_422(client, referencias, key):
+    await client.post('/atletas/', json=atleta_payload(1), headers=key)
+
+    response = await client.post('/atletas/', json=atleta_payload(2), headers=key)
+
+    assert response.status_code == 422
+    assert response.json()['detail'] == 'Idempotency-Key já utilizada com outro corpo de requisição.'
+
+
+async def test_concurrent_duplicates_run_once(client, referencias, key):
+    responses = await asyncio.gather(*(client.post('/atletas/', json=atleta_payload(1), headers=key) for _ in range(3)))
+
+    assert [r.status_code for r in responses] == [201, 201, 201]
+    assert sum('idempotent-replayed' in r.headers for r in responses) == 2
+    assert await _total_atletas(client) == 1
+
+
+async def test_keys_are_scoped_per_client(client, referencias, key, monkeypatch):
+    monkeypatch.setattr(settings, 'RATE_LIMIT_API_KEYS', {'cliente-b'})
+    await client.post('/atletas/', json=atleta_payload(1), headers=key)
+
+    async with make_client(app, client=('10.0.0.2', 5000)) as other:
+        response = await other.post('/atletas/', json=atleta_payload(1), headers=key)
+    with_api_key = await client.post('/atletas/', json=atleta_payload(1), headers={**key, 'X-API-Key': 'cliente-b'})
+
+    # Executadas de novo: o CPF já existe, em vez de devolver o 201 do primeiro cliente.
+    assert (response.status_code, with_api_key.status_code) == (303, 303)
+
+
+async def test_unknown_api_key_shares_the_ip_scope(client, referencias, key):
+    first = await client.post('/atletas/', json=atleta_payload(1), headers=key)
+    replay = await client.post('/atletas/', json=atleta_payload(1), headers={**key, 'X-API-Key': 'qualquer'})
+
+    assert (first.status_code, replay.status_code) == (201, 201)
+    assert 'idempotent-replayed' in replay.headers
+
+
+async def test_failed_precondition_is_not_stored(client, key):
+    await client.post('/centros_treinamento/', json={'nome': 'CT King', 'endereco': 'Rua X, 10', 'proprietario': 'Marcos'})
+    missing = await client.post('/atletas/', json=atleta_payload(1), headers=key)
+    await client.post('/categorias/', json={'nome': 'Scale'})
+
+    retry = await client.post('/atletas/', json=atleta_payload(1), headers=key)
+
+    assert (missing.status_code, retry.status_code) == (404, 201)
+    assert 'idempotent-replayed' not in retry.headers
+
+
+async def test_key_length_is_validated(client, referencias):
+    response = await client.post('/atletas/', json=atleta_payload(1), headers={'Idempotency-Key': 'k' * 256})
+
+    assert response.status_code == 400
+
+
+async def test_database_store_round_trip(db):
+    store = DatabaseIdempotencyStore(ttl=60)
+    stored = StoredResponse('abc', 201, [(b'content-type', b'application/json')], b'{}')
+
+    await store.set('chave', stored)
+    await store.set('chave', stored)
+
+    assert await store.get('chave') == stored
+
+    expired = DatabaseIdempotencyStore(ttl=-1)
+    await expired.set('expirada', stored)
+    assert await expired.get('expirada') is None
@@ -0,0 +1,56 @@
+import re
+
+import pytest
+
+from workout_api.contrib.instrumentation import http_request_db_queries, http_request_duration
+from workout_api.contrib.metrics import _Metric
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_server_timing_reports_queries(client, referencias):
+    response = await client.get('/atletas/')
+
+    assert re.fullmatch(r'db;desc="[1-9]\d* queries";dur=[\d.]+, app;dur=[\d.]+', response.headers['server-timing'])
+
+
+async def test_requests_are_labelled_with_the_route_template(client, seed):
+    results = await seed(1)
+    before = http_request_duration.labels('GET', '/atletas/{id}', '200').count
+
+    await client.get(f"/atletas/{results[0]['id']}")
+
+    assert http_request_duration.labels('GET', '/atletas/{id}', '200').count == before + 1
+    assert http_request_db_queries.labels('GET', '/atletas/{id}').count > 0
+
+
+async def test_idempotent_replays_keep_the_route_label(client):
+    before = http_request_duration.labels('POST', '/categorias/', '201').count
+
+    for _ in range(2):
+        response = await client.post('/categorias/', json={'nome': 'Scale'}, headers={'Idempotency-Key': 'replay-label'})
+
+    assert response.headers['idempotent-replayed'] == 'true'
+    assert http_request_duration.labels('POST', '/categorias/', '201').count == before + 2
+
+
+async def test_unknown_paths_share_one_label(client):
+    before = http_request_duration.labels('GET', 'unmatched', '404').count
+
+    await client.get('/nao-existe/123')
+
+    assert http_request_duration.labels('GET', 'unmatched', '404').count == before + 1
+
+
+async def test_metrics_endpoint_exposes_the_registry(client, referencias):
+    await client.get('/categorias/')
+
+    response = await client.get('/metrics')
+
+    assert response.status_code == 200
+    assert 'http_request_duration_seconds_count{method="GET",route="/categorias/",status="200"}' in response.text
+
+
+def test_metric_base_is_abstract():
+    with pytest.raises(TypeError):
+        _Metric('incompleta', 'Métrica sem amostras')
@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from workout_api.contrib.pagination import encode_cursor
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_cursor_pages_cover_every_athlete_once(client, seed):
+    await seed(7)
+
+    nomes, cursor = [], None
+    while True:
+        params = {'limit': 3, **({'cursor': cursor} if cursor else {})}
+        page = (await client.get('/atletas/', params=params)).json()
+        nomes += [item['nome'] for item in page['items']]
+        if not page['has_more']:
+            assert page['next_cursor'] is None
+            break
+        cursor = page['next_cursor']
+
+    assert nomes == [f'Atleta {i}' for i in range(7)]
+
+
+async def test_last_page_has_no_cursor(client, seed):
+    await seed(2)
+
+    page = (await client.get('/atletas/', params={'limit': 2})).json()
+
+    assert len(page['items']) == 2
+    assert (page['has_more'], page['next_cursor']) == (False, None)
+
+
+async def test_invalid_cursor_returns_400(client, seed):
+    await seed(1)
+
+    response = await client.get('/atletas/', params={'cursor': 'não-é-um-cursor'})
+
+    assert response.status_code == 400
+    assert response.json()['detail'] == 'Cursor de paginação inválido.'
+
+
+async def test_cursor_with_timezone_returns_400(client, seed):
+    await seed(1)
+    cursor = encode_cursor(datetime(2024, 1, 1, tzinfo=timezone.utc), 1)
+
+    response = await client.get('/atletas/', params={'cursor': cursor})
+
+    assert response.status_code == 400
+
+
+async def test_offset_mode_keeps_the_legacy_list(client, seed):
+    await seed(4)
+
+    response = await client.get('/atletas/', params={'paginacao': 'offset', 'limit': 2, 'offset': 2})
+
+    assert [item['nome'] for item in response.json()] == ['Atleta 2', 'Atleta 3']
+
+
+async def test_empty_listing_returns_404(client, referencias):
+    response = await client.get('/atletas/')
+
+    assert response.status_code == 404
+    assert response.json()['detail'] == 'Nenhum atleta encontrado.'
@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from workout_api.configs.database import InstrumentedQueuePool, engine_options, pool_timeouts, pool_wait_seconds
+from workout_api.contrib.metrics import Counter, Registry
+
+pytestmark = pytest.mark.anyio
+
+
+def _instrumented_engine(url: str, name: str):
+    engine = create_async_engine(url, poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.05)
+    engine.sync_engine.pool.pool_name = name
+    return engine
+
+
+def test_engine_options_apply_pool_settings():
+    options = engine_options('postgresql+asyncpg://u:p@localhost/db')
+
+    assert options['poolclass'] is InstrumentedQueuePool
+    assert options['connect_args'] == {'statement_cache_size': 100}
+    assert engine_options('sqlite+aiosqlite:///x.db') == {}
+
+
+async def test_checkout_timeout_is_counted(tmp_path):
+    engine = _instrumented_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", 'test-timeout')
+    try:
+        async with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+    finally:
+        await engine.dispose()
+
+    assert pool_timeouts.labels('test-timeout').value == 1
+    # A espera pela conexão ocupada vai para o histograma.
+    assert pool_wait_seconds.labels('test-timeout').sum >= 0.05
+
+
+async def test_connect_errors_are_not_pool_timeouts(tmp_path):
+    engine = _instrumented_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'pool.db'}", 'test-connect')
+    try:
+        with pytest.raises(OperationalError):
+            async with engine.connect():
+                pass
+    finally:
+        await engine.dispose()
+
+    assert pool_timeouts.labels('test-connect').value == 0
+
+
+def test_counter_family_matches_its_samples(monkeypatch):
+    monkeypatch.setattr('workout_api.contrib.metrics.registry', Registry())
+    counter = Counter('jobs', 'Jobs processados', labelnames=('status',))
+    counter.labels('ok').inc(2)
+
+    assert counter.render().splitlines() == [
+        '# HELP jobs_total Jobs processados',
+        '# TYPE jobs_total counter',
+        'jobs_total{status="ok"} 2.0',
+    ]
@@ -0,0 +1,37 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_default_fields(client, seed):
+    await seed(1)
+
+    item = (await client.get('/atletas/')).json()['items'][0]
+
+    assert item == {'nome': 'Atleta 0', 'centro_treinamento': 'CT King', 'categoria': 'Scale'}
+
+
+async def test_selected_fields_only(client, seed):
+    await seed(1)
+
+    item = (await client.get('/atletas/', params={'fields': 'cpf, nome,cpf'})).json()['items'][0]
+
+    assert item == {'cpf': '00000000000', 'nome': 'Atleta 0'}
+
+
+async def test_selected_fields_work_with_cursor_pages(client, seed):
+    await seed(3)
+
+    first = (await client.get('/atletas/', params={'fields': 'idade', 'limit': 2})).json()
+    second = (await client.get('/atletas/', params={'fields': 'idade', 'limit': 2, 'cursor': first['next_cursor']})).json()
+
+    assert [item['idade'] for item in first['items'] + second['items']] == [20, 21, 22]
+
+
+async def test_invalid_field_returns_400(client, seed):
+    await seed(1)
+
+    response = await client.get('/atletas/', params={'fields': 'nome,senha'})
+
+    assert response.status_code == 400
+    assert response.json()['detail'].startswith('Campos inválidos: senha.')
@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+from tests.conftest import make_client
+from workout_api.configs.settings import settings
+from workout_api.contrib import ratelimit
+from workout_api.contrib.ratelimit import (
+    AdmissionMiddleware, InMemoryRateLimitStore, Rate, RateLimitMiddleware, RateLimitStore, parse_rate,
+)
+from workout_api.main import app
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('100/s', Rate(100, 100.0)), ('60/m:10', Rate(10, 1.0)), ('3600/h', Rate(3600, 1.0)),
+])
+def test_parse_rate(value, expected):
+    assert parse_rate(value) == expected
+
+
+@pytest.mark.parametrize('value', ['100', '100/d', 'x/s', '10/s:y'])
+def test_parse_rate_rejects_invalid_values(value):
+    with pytest.raises(ValueError, match='Limite inválido'):
+        parse_rate(value)
+
+
+def test_rate_limit_store_is_abstract():
+    with pytest.raises(TypeError):
+        RateLimitStore()
+
+
+async def test_token_bucket_refills_over_time(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(ratelimit.time, 'monotonic', lambda: now[0])
+    store, rate = InMemoryRateLimitStore(max_keys=10), Rate(capacity=2, per_second=1.0)
+
+    assert [(await store.take('a', rate)).allowed for _ in range(3)] == [True, True, False]
+    assert (await store.take('a', rate)).retry_after == pytest.approx(1.0)
+
+    now[0] = 1.5
+    assert [(await store.take('a', rate)).allowed for _ in range(2)] == [True, False]
+
+
+async def test_least_recently_used_buckets_are_dropped():
+    store, rate = InMemoryRateLimitStore(max_keys=2), Rate(capacity=1, per_second=0.001)
+    for key in ('a', 'b', 'c'):
+        await store.take(key, rate)
+
+    # 'a' foi descartado e recomeça com o bucket cheio.
+    assert (await store.take('a', rate)).allowed is True
+    assert (await store.take('c', rate)).allowed is False
+
+
+@pytest.fixture
+def limited(monkeypatch):
+    monkeypatch.setattr(settings, 'RATE_LIMIT_API_KEYS', {'chave-valida'})
+    return RateLimitMiddleware(app, limits={'/atletas': '2/m', '/categorias': '100/s'})
+
+
+async def test_client_over_the_limit_gets_429(limited, referencias):
+    async with make_client(limited) as c:
+        responses = [await c.get('/atletas/') for _ in range(3)]
+        categorias = await c.get('/categorias/')
+
+    assert [r.status_code for r in responses] == [404, 404, 429]
+    assert responses[0].headers['x-ratelimit-limit'] == '2'
+    assert responses[1].headers['x-ratelimit-remaining'] == '0'
+    assert responses[2].headers['retry-after'] == '30'
+    assert responses[2].json()['detail'] == 'Limite de requisições excedido. Tente novamente mais tarde.'
+    assert categorias.status_code == 200
+
+
+async def test_unknown_api_keys_count_against_the_ip(limited, referencias):
+    async with make_client(limited) as c:
+        statuses = [(await c.get('/atletas/', headers={'X-API-Key': f'rotativa-{i}'})).status_code for i in range(3)]
+        valid = await c.get('/atletas/', headers={'X-API-Key': 'chave-valida'})
+
+    assert statuses == [404, 404, 429]
+    assert valid.status_code == 404
+
+
+async def test_paths_outside_the_groups_are_not_limited(limited, db):
+    async with make_client(limited) as c:
+        responses = [await c.get('/metrics') for _ in range(5)]
+
+    assert {r.status_code for r in responses} == {200}
+    assert 'x-ratelimit-limit' not in responses[0].headers
+
+
+def _streaming_app(started: asyncio.Event, finish: asyncio.Event):
+    async def endpoint(scope, receive, send):
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b'inicio', 'more_body': True})
+        started.set()
+        await finish.wait()
+        await send({'type': 'http.response.body', 'body': b'fim'})
+
+    return endpoint
+
+
+async def test_admission_sheds_requests_above_the_limit():
+    release = asyncio.Event()
+
+    async def slow(scope, receive, send):
+        await release.wait()
+        await send({'type': 'http.response.start', 'status': 204, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    admission = AdmissionMiddleware(slow, max_in_flight=1, wait=0)
+    async with make_client(admission) as c:
+        first = asyncio.create_task(c.get('/atletas/'))
+        await asyncio.sleep(0.01)
+        shed = await c.get('/atletas/')
+        release.set()
+        await first
+
+    assert shed.status_code == 503
+    assert shed.headers['retry-after'] == str(settings.ADMISSION_RETRY_AFTER)
+    assert admission.in_flight == 0
+
+
+async def test_streaming_response_holds_its_slot_until_the_last_chunk():
+    started, finish = asyncio.Event(), asyncio.Event()
+    admission = AdmissionMiddleware(_streaming_app(started, finish), max_in_flight=1, wait=0)
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+        if message['type'] == 'http.response.body' and not message.get('more_body', False):
+            # A vaga é devolvida logo depois da última parte do corpo.
+            assert admission.in_flight == 1
+
+    scope = {'type': 'http', 'method': 'GET', 'path': '/atletas/export', 'headers': []}
+    streaming = asyncio.create_task(admission(scope, receive, send))
+    await started.wait()
+
+    # Cabeçalhos enviados, corpo em transmissão: a conexão do pool segue em uso.
+    assert admission.in_flight == 1
+    async with make_client(admission) as c:
+        assert (await c.get('/atletas/export')).status_code == 503
+    finish.set()
+    await streaming
+    assert admission.in_flight == 0
+    assert not admission._slots.locked()
+
+
+def test_admission_control_is_off_by_default():
+    assert settings.ADMISSION_CONTROL_ENABLED is False
+    assert all(middleware.cls is not AdmissionMiddleware for middleware in app.user_middleware)
@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.responses import JSONResponse
+
+from tests.conftest import make_client
+from workout_api.configs import database
+from workout_api.configs.database import READ_PRIMARY_COOKIE, ReadYourWritesMiddleware, ReplicaHealth, ReplicaSession
+from workout_api.configs.settings import settings
+from workout_api.contrib.models import BaseModel
+from workout_api.main import app
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def use_replica(monkeypatch, db):
+    engines = []
+
+    async def use_replica(url: str, create_schema: bool = False):
+        engine = create_async_engine(url)
+        engines.append(engine)
+        if create_schema:
+            async with engine.begin() as conn:
+                await conn.run_sync(BaseModel.metadata.create_all)
+        health = ReplicaHealth(engine)
+        monkeypatch.setattr(database, 'replica_session', sessionmaker(engine, class_=ReplicaSession, expire_on_commit=False))
+        monkeypatch.setattr(database, 'replica_health', health)
+        return health
+
+    yield use_replica
+    for engine in engines:
+        await engine.dispose()
+
+
+async def test_failed_replica_read_is_retried_on_the_primary(client, seed, use_replica, tmp_path):
+    await seed(3)
+    health = await use_replica(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}")
+
+    response = await client.get('/atletas/')
+
+    assert response.status_code == 200
+    assert len(response.json()['items']) == 3
+    assert health.healthy is False
+
+
+async def test_reads_go_to_the_replica_unless_the_client_just_wrote(client, seed, use_replica, tmp_path):
+    results = await seed(1)
+    # Réplica com o schema mas sem dados: simula o atraso de replicação.
+    await use_replica(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}", create_schema=True)
+    path = f"/atletas/{results[0]['id']}"
+
+    assert (await client.get(path)).status_code == 404
+    assert (await client.get(path, headers={'X-Read-Consistency': 'strong'})).status_code == 200
+
+    client.cookies.set(READ_PRIMARY_COOKIE, str(int(time.time()) + 60))
+    assert (await client.get(path)).status_code == 200
+
+
+async def test_writes_set_the_sticky_cookie(db):
+    async def endpoint(scope, receive, send):
+        status_code = {'/aceito': 202, '/erro': 404}.get(scope['path'], 200)
+        await JSONResponse({}, status_code=status_code)(scope, receive, send)
+
+    async with make_client(ReadYourWritesMiddleware(endpoint)) as c:
+        # Respostas montadas pelo próprio endpoint (202 do write-behind) também recebem o cookie.
+        assert READ_PRIMARY_COOKIE in (await c.post('/aceito')).headers['set-cookie']
+        assert 'set-cookie' not in (await c.post('/erro')).headers
+        assert 'set-cookie' not in (await c.get('/aceito')).headers
+
+
+async def test_health_probe_never_blocks_reads(monkeypatch, tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    health = ReplicaHealth(engine)
+    release = asyncio.Event()
+
+    async def stuck_select_one():
+        await release.wait()
+
+    monkeypatch.setattr(health, '_select_one', stuck_select_one)
+
+    assert await asyncio.wait_for(health.is_healthy(), 0.1) is True
+    assert await asyncio.wait_for(health.is_healthy(), 0.1) is True
+    release.set()
+    await health._probe
+    await engine.dispose()
+
+
+async def test_health_ping_times_out_on_unreachable_replica(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, 'DB_REPLICA_HEALTH_TIMEOUT', 0.05)
+    health = ReplicaHealth(create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"))
+
+    async def unreachable():
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(health, '_select_one', unreachable)
+    started = time.monotonic()
+
+    assert await health._ping() is False
+    assert time.monotonic() - started < 1
+
+
+def test_app_without_replica_has_no_sticky_middleware():
+    assert all(middleware.cls is not ReadYourWritesMiddleware for middleware in app.user_middleware)
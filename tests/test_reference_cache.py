@@ -0,0 +1,176 @@
+import asyncio
+import sys
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from workout_api.categorias.cache import categoria_cache
+from workout_api.categorias.models import CategoriaModel
+from workout_api.configs.database import ReplicaSession, async_session
+from workout_api.contrib import cache
+from workout_api.contrib.cache import InvalidationBackend, PostgresInvalidationBackend, TTLCache
+
+pytestmark = pytest.mark.anyio
+
+
+async def _insert_categoria(nome: str) -> None:
+    # Grava direto no banco, sem passar pela invalidação das rotas.
+    async with async_session() as session:
+        session.add(CategoriaModel(id=uuid4(), nome=nome))
+        await session.commit()
+
+
+async def test_listing_is_served_from_cache_until_invalidated(client):
+    await client.post('/categorias/', json={'nome': 'Scale'})
+    assert [c['nome'] for c in (await client.get('/categorias/')).json()] == ['Scale']
+
+    await _insert_categoria('RX')
+    assert [c['nome'] for c in (await client.get('/categorias/')).json()] == ['Scale']
+
+    await client.post('/categorias/', json={'nome': 'Master'})
+    assert {c['nome'] for c in (await client.get('/categorias/')).json()} == {'Scale', 'RX', 'Master'}
+
+
+async def test_backend_message_clears_the_namespace(client):
+    await client.post('/categorias/', json={'nome': 'Scale'})
+    await client.get('/categorias/')
+    await _insert_categoria('RX')
+
+    cache._on_invalidate('categorias')
+
+    assert len((await client.get('/categorias/')).json()) == 2
+
+
+async def test_empty_listing_returns_404(client):
+    response = await client.get('/categorias/')
+
+    assert response.status_code == 404
+    assert response.json()['detail'] == 'Nenhuma categoria encontrada.'
+
+
+async def test_cache_is_filled_from_the_primary(db, tmp_path):
+    await _insert_categoria('Scale')
+    async with async_session() as session:
+        categoria = (await categoria_cache.snapshot(session)).items[0]
+    categoria_cache.clear()
+
+    # Réplica vazia: o cache compartilhado não pode guardar o que ela devolve.
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    try:
+        async with ReplicaSession(bind=replica) as session:
+            assert (await categoria_cache.by_id(session, categoria.id)).nome == 'Scale'
+            assert [c.nome for c in await categoria_cache.all(session)] == ['Scale']
+    finally:
+        await replica.dispose()
+
+
+def test_ttl_cache_expires_and_evicts_least_recently_used(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache.time, 'monotonic', lambda: now[0])
+    ttl_cache = TTLCache(maxsize=2, ttl=10)
+
+    ttl_cache.set('a', 1)
+    ttl_cache.set('b', 2)
+    ttl_cache.get('a')
+    ttl_cache.set('c', 3)
+    assert (ttl_cache.get('a'), ttl_cache.get('b'), ttl_cache.get('c')) == (1, None, 3)
+
+    now[0] += 11
+    assert ttl_cache.get('a') is None
+
+
+def test_invalidation_backend_is_abstract():
+    with pytest.raises(TypeError):
+        InvalidationBackend()
+
+
+async def test_postgres_backend_publishes_one_notify_at_a_time():
+    class FakeConnection:
+        def __init__(self):
+            self.active = 0
+            self.calls = []
+
+        async def execute(self, query, *args):
+            self.active += 1
+            assert self.active == 1, 'NOTIFY concorrente na mesma conexão'
+            await asyncio.sleep(0.01)
+            self.calls.append(args)
+            self.active -= 1
+
+    backend = PostgresInvalidationBackend('postgresql+asyncpg://u:p@localhost/db')
+    backend._conn = FakeConnection()
+
+    await asyncio.gather(*(backend.publish(f'categorias:{i}') for i in range(5)))
+
+    assert len(backend._conn.calls) == 5
+
+
+class FakeAsyncpg:
+    def __init__(self):
+        self.connections = []
+        self.failures = 0
+
+    async def connect(self, dsn):
+        if self.failures:
+            self.failures -= 1
+            raise OSError('connection refused')
+        conn = FakeListenConnection()
+        self.connections.append(conn)
+        return conn
+
+
+class FakeListenConnection:
+    def __init__(self):
+        self.listeners = {}
+        self.on_termination = None
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    def add_termination_listener(self, callback):
+        self.on_termination = callback
+
+    async def execute(self, query, *args):
+        if self.closed:
+            raise ConnectionError('connection is closed')
+
+    async def close(self):
+        self.closed = True
+
+    def terminate(self):
+        self.closed = True
+        self.on_termination(self)
+
+
+async def test_postgres_backend_logs_publish_failures(monkeypatch, caplog):
+    fake = FakeAsyncpg()
+    monkeypatch.setitem(sys.modules, 'asyncpg', fake)
+    backend = PostgresInvalidationBackend('postgresql+asyncpg://u:p@localhost/db')
+    await backend.start(lambda message: None)
+    backend._conn.closed = True
+
+    await backend.publish('categorias')
+
+    assert 'Falha ao publicar a invalidação' in caplog.text
+    await backend.stop()
+
+
+async def test_postgres_backend_reconnects_and_clears_caches(monkeypatch):
+    fake = FakeAsyncpg()
+    monkeypatch.setitem(sys.modules, 'asyncpg', fake)
+    monkeypatch.setattr(PostgresInvalidationBackend, 'reconnect_delay', 0.01)
+    received = []
+    backend = PostgresInvalidationBackend('postgresql+asyncpg://u:p@localhost/db')
+    await backend.start(received.append)
+
+    fake.failures = 2
+    fake.connections[0].terminate()
+    await backend._reconnect_task
+
+    assert len(fake.connections) == 2 and backend._conn is fake.connections[1]
+    assert received == ['*']
+    fake.connections[1].listeners[backend.channel](None, 1, backend.channel, 'categorias')
+    assert received == ['*', 'categorias']
+    await backend.stop()
@@ -0,0 +1,50 @@
+import pytest
+
+from tests.conftest import atleta_payload
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def atletas(client, referencias):
+    nomes = ['Ana Souza', 'Mariana Lima', 'João Santana', 'Pedro 100%', 'Pedro_Alves']
+    payload = [atleta_payload(i, nome=nome) for i, nome in enumerate(nomes)]
+    await client.post('/atletas/bulk', json=payload)
+
+
+async def _nomes(client, **params) -> list[str]:
+    response = await client.get('/atletas/search', params=params)
+    assert response.status_code == 200, response.text
+    return [item['nome'] for item in response.json()]
+
+
+async def test_contains_ranks_earlier_matches_first(client, atletas):
+    assert await _nomes(client, q='ana') == ['Ana Souza', 'Mariana Lima', 'João Santana']
+
+
+async def test_prefix_matches_only_the_start_of_the_name(client, atletas):
+    assert await _nomes(client, q='ana', modo='prefix') == ['Ana Souza']
+
+
+async def test_fuzzy_matches_any_word(client, atletas):
+    assert set(await _nomes(client, q='souza lima', modo='fuzzy')) == {'Ana Souza', 'Mariana Lima'}
+
+
+async def test_like_wildcards_are_matched_literally(client, atletas):
+    assert await _nomes(client, q='%') == ['Pedro 100%']
+    assert await _nomes(client, q='_') == ['Pedro_Alves']
+
+
+async def test_limit_caps_results(client, atletas):
+    assert len(await _nomes(client, q='a', limit=2)) == 2
+
+
+async def test_no_match_returns_404(client, atletas):
+    response = await client.get('/atletas/search', params={'q': 'xyz'})
+
+    assert response.status_code == 404
+    assert response.json()['detail'] == 'Nenhum atleta encontrado.'
+
+
+async def test_empty_term_is_rejected(client, atletas):
+    assert (await client.get('/atletas/search', params={'q': ''})).status_code == 422
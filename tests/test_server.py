@@ -0,0 +1,78 @@
+import builtins
+import io
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from workout_api import server
+from workout_api.categorias.cache import categoria_cache
+from workout_api.configs import database
+from workout_api.configs.settings import settings
+from workout_api.contrib import startup
+from workout_api.main import app
+
+
+def _cgroup(monkeypatch, content: str | None):
+    real_open = builtins.open
+
+    def fake_open(path, *args, **kwargs):
+        if path == '/sys/fs/cgroup/cpu.max':
+            if content is None:
+                raise FileNotFoundError(path)
+            return io.StringIO(content)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, 'open', fake_open)
+    monkeypatch.setattr(server.os, 'sched_getaffinity', lambda pid: set(range(8)), raising=False)
+
+
+@pytest.mark.parametrize('cpu_max, expected', [('max 100000', 8), ('150000 100000', 2), ('50000 100000', 1), (None, 8)])
+def test_available_cpus_respects_the_cgroup_quota(monkeypatch, cpu_max, expected):
+    _cgroup(monkeypatch, cpu_max)
+
+    assert server.available_cpus() == expected
+
+
+def test_main_starts_one_worker_per_cpu(monkeypatch):
+    calls = []
+    monkeypatch.setitem(sys.modules, 'uvicorn', SimpleNamespace(run=lambda target, **options: calls.append((target, options))))
+    monkeypatch.setattr(server, 'available_cpus', lambda: 3)
+
+    server.main(['--port', '9000', '--no-access-log'])
+
+    [(target, options)] = calls
+    assert target == 'workout_api.main:app'
+    assert (options['workers'], options['port'], options['access_log']) == (3, 9000, False)
+    assert options['timeout_graceful_shutdown'] == settings.SERVER_GRACEFUL_TIMEOUT
+
+
+@pytest.mark.anyio
+async def test_warmup_fills_reference_caches(client, referencias):
+    categoria_cache.clear()
+
+    await startup.warmup()
+
+    assert {c.nome for c in categoria_cache._all.get(None).items} == {'Scale', 'RX'}
+    assert {'warmup_pool', 'warmup_cache'} <= startup.phases.keys()
+
+
+@pytest.mark.anyio
+async def test_warmup_failure_does_not_stop_the_worker(monkeypatch, db, caplog):
+    async def unreachable(engine, connections):
+        raise OSError('banco indisponível')
+
+    monkeypatch.setattr(startup, 'warm_pool', unreachable)
+
+    await startup.warmup()
+
+    assert 'Falha no aquecimento do pool/caches.' in caplog.text
+
+
+@pytest.mark.anyio
+async def test_lifespan_records_startup_phases(monkeypatch, db):
+    monkeypatch.setattr(settings, 'WARMUP_ENABLED', True)
+
+    async with app.router.lifespan_context(app):
+        assert {'import', 'warmup_pool', 'lifespan'} <= startup.phases.keys()
+        assert database.engine.sync_engine.pool.checkedin() >= 1
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from workout_api.contrib.cache import LookupCache, registry
+from workout_api.contrib.singleflight import SingleFlight, cache_lookups
+
+pytestmark = pytest.mark.anyio
+
+
+def _loader(calls: list, value='valor', delay=0.01, error: Exception | None = None):
+    async def load():
+        calls.append(value)
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return value
+
+    return load
+
+
+@pytest.fixture
+def lookup_cache():
+    cache = LookupCache('teste', ttl=60, maxsize=10)
+    yield cache
+    registry.pop('teste', None)
+
+
+async def test_concurrent_calls_share_one_load():
+    flight, calls = SingleFlight('teste'), []
+
+    results = await asyncio.gather(*(flight.do('a', _loader(calls)) for _ in range(5)))
+
+    assert results == ['valor'] * 5
+    assert len(calls) == 1
+
+
+async def test_errors_reach_every_waiter_and_are_not_cached():
+    flight, calls = SingleFlight('teste'), []
+
+    results = await asyncio.gather(
+        *(flight.do('a', _loader(calls, error=LookupError('falhou'))) for _ in range(3)), return_exceptions=True,
+    )
+
+    assert [type(result) for result in results] == [LookupError] * 3
+    assert await flight.do('a', _loader(calls)) == 'valor'
+    assert len(calls) == 2
+
+
+async def test_waiter_takes_over_when_the_leader_is_cancelled():
+    flight, calls = SingleFlight('teste'), []
+    leader = asyncio.create_task(flight.do('a', _loader(calls, 'líder', delay=1)))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(flight.do('a', _loader(calls, 'substituto')))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+
+    assert await waiter == 'substituto'
+    assert calls == ['líder', 'substituto']
+
+
+async def test_forget_starts_a_new_load():
+    flight, calls = SingleFlight('teste'), []
+    first = asyncio.create_task(flight.do('a', _loader(calls, 'antes')))
+    await asyncio.sleep(0)
+
+    flight.forget('a')
+
+    assert await flight.do('a', _loader(calls, 'depois')) == 'depois'
+    assert await first == 'antes'
+
+
+async def test_consistent_reads_never_join_replica_reads(lookup_cache):
+    calls = []
+
+    replica, primary = await asyncio.gather(
+        lookup_cache.get('a', _loader(calls, 'réplica')),
+        lookup_cache.get('a', _loader(calls, 'primário'), consistent=True),
+    )
+
+    assert (replica, primary) == ('réplica', 'primário')
+    # Leituras consistentes ignoram o cache; o valor do primário o atualiza.
+    assert await lookup_cache.get('a', _loader(calls, 'primário novo'), consistent=True) == 'primário novo'
+    assert await lookup_cache.get('a', _loader(calls)) == 'primário novo'
+
+
+async def test_discard_drops_cached_values(lookup_cache):
+    calls = []
+    await lookup_cache.get('a', _loader(calls, 'antigo'))
+
+    lookup_cache.discard('a')
+
+    assert await lookup_cache.get('a', _loader(calls, 'novo')) == 'novo'
+
+
+async def test_concurrent_get_by_id_is_coalesced(client, seed):
+    path = f"/atletas/{(await seed(1))[0]['id']}"
+    coalesced = cache_lookups.labels('atletas', 'coalesced')
+    before = coalesced.value
+
+    responses = await asyncio.gather(*(client.get(path) for _ in range(5)))
+
+    assert {response.status_code for response in responses} == {200}
+    assert coalesced.value > before
@@ -0,0 +1,55 @@
+import pytest
+
+from tests.conftest import atleta_payload
+from workout_api.contrib.models import BaseModel
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def atletas(client, referencias):
+    payload = [
+        atleta_payload(0, idade=20, peso=50.0, altura=1.8, genero='F'),
+        atleta_payload(1, idade=30, peso=70.0, altura=1.75, genero='M'),
+        atleta_payload(2, idade=40, peso=90.0, altura=1.75, genero='M', categoria={'nome': 'RX'}),
+        atleta_payload(3, idade=50, peso=110.0, altura=1.75, genero='F', categoria={'nome': 'RX'}),
+    ]
+    assert (await client.post('/atletas/bulk', json=payload)).json()['created'] == 4
+
+
+async def test_overall_stats(client, atletas):
+    [stats] = (await client.get('/atletas/stats')).json()
+
+    assert stats['grupo'] == {}
+    assert stats['total'] == 4
+    assert stats['genero'] == {'M': 2, 'F': 2}
+    assert stats['idade'] == {'media': 35.0, 'p50': None, 'p90': None}
+    assert stats['peso']['media'] == 80.0
+    assert stats['imc_faixas'] == {'abaixo': 1, 'normal': 1, 'sobrepeso': 1, 'obesidade': 1}
+
+
+async def test_grouped_stats(client, atletas):
+    response = await client.get('/atletas/stats', params={'group_by': ['categoria', 'centro_treinamento', 'categoria']})
+
+    assert [(s['grupo'], s['total']) for s in response.json()] == [
+        ({'categoria': 'RX', 'centro_treinamento': 'CT King'}, 2),
+        ({'categoria': 'Scale', 'centro_treinamento': 'CT King'}, 2),
+    ]
+
+
+async def test_summary_without_trigger_falls_back_to_live_aggregation(client, atletas):
+    assert 'atletas_resumo' not in BaseModel.metadata.tables
+
+    [stats] = (await client.get('/atletas/stats', params={'resumo': True})).json()
+
+    assert stats['total'] == 4
+
+
+async def test_empty_table(client, referencias):
+    [stats] = (await client.get('/atletas/stats')).json()
+
+    assert (stats['total'], stats['idade']['media']) == (0, None)
+
+
+async def test_invalid_group_returns_422(client, referencias):
+    assert (await client.get('/atletas/stats', params={'group_by': 'genero'})).status_code == 422
@@ -0,0 +1,136 @@
+import asyncio
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from tests.conftest import atleta_payload
+from workout_api.atleta.write_behind import write_behind
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def queue(monkeypatch):
+    async def queue(**options):
+        for name, value in options.items():
+            monkeypatch.setattr(write_behind, name, value)
+        await write_behind.start()
+        return write_behind
+
+    yield queue
+    await write_behind.stop(timeout=5)
+
+
+async def _wait(client, location: str) -> dict:
+    for _ in range(100):
+        job = (await client.get(location)).json()
+        if job['status'] != 'pending':
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f'Job {location} não concluído.')
+
+
+async def test_create_is_accepted_and_written(client, referencias, queue):
+    await queue(flush_interval=0.01)
+
+    response = await client.post('/atletas/', json=atleta_payload(1))
+
+    assert response.status_code == 202
+    assert response.headers['location'] == f"/atletas/jobs/{response.json()['id']}"
+    job = await _wait(client, response.headers['location'])
+    assert (job['tipo'], job['status']) == ('create', 'done')
+    assert (await client.get(f"/atletas/{job['atleta_id']}")).json()['nome'] == 'Atleta 1'
+
+
+async def test_update_is_accepted_and_written(client, seed, queue):
+    atleta_id = (await seed(1))[0]['id']
+    await queue(flush_interval=0.01)
+
+    response = await client.patch(f'/atletas/{atleta_id}', json={'idade': 41})
+
+    assert response.status_code == 202
+    assert (await _wait(client, response.headers['location']))['status'] == 'done'
+    assert (await client.get(f'/atletas/{atleta_id}')).json()['idade'] == 41
+
+
+async def test_duplicate_cpf_fails_the_job(client, seed, queue):
+    await seed(1)
+    await queue(flush_interval=0.01)
+
+    response = await client.post('/atletas/', json=atleta_payload(0, nome='Outro'))
+
+    job = await _wait(client, response.headers['location'])
+    assert (job['status'], job['detail']) == ('failed', 'Atleta com CPF 00000000000 já existe.')
+
+
+async def test_failing_job_does_not_fail_its_batch(client, seed, queue):
+    atleta_id = UUID((await seed(1))[0]['id'])
+    queue = await queue(flush_interval=0.05)
+
+    # nome é NOT NULL: o UPDATE falha no banco e aborta a transação do lote.
+    poison = await queue.submit('update', atleta_id, {'nome': None})
+    good = await queue.submit('update', atleta_id, {'idade': 33})
+    values = {key: value for key, value in atleta_payload(9).items() if key not in ('categoria', 'centro_treinamento')}
+    new_id = uuid4()
+    created = await queue.submit('create', new_id, {
+        **values, 'id': new_id, 'created_at': datetime.utcnow(), 'categoria_id': 1, 'centro_treinamento_id': 1,
+    })
+    await queue.stop(timeout=5)
+
+    assert (poison.status, poison.detail) == ('failed', 'Falha ao gravar no banco de dados.')
+    assert (good.status, created.status) == ('done', 'done')
+    assert queue._pending == {}
+    assert (await client.get(f'/atletas/{atleta_id}')).json()['idade'] == 33
+
+
+async def test_full_queue_returns_503(client, referencias, queue):
+    # O worker segura o primeiro job por flush_interval enquanto o segundo
+    # ocupa a única vaga da fila.
+    await queue(maxsize=1, flush_interval=0.3)
+
+    statuses = [(await client.post('/atletas/', json=atleta_payload(i))).status_code for i in range(3)]
+
+    assert statuses == [202, 202, 503]
+
+
+async def test_unknown_job_returns_404(client):
+    response = await client.get('/atletas/jobs/3fa85f64-5717-4562-b3fc-2c963f66afa6')
+
+    assert response.status_code == 404
+
+
+async def test_stopped_queue_writes_synchronously(client, referencias):
+    assert (await client.post('/atletas/', json=atleta_payload(1))).status_code == 201
+
+
+async def test_worker_survives_errors_after_the_write(client, seed, queue, monkeypatch):
+    atleta_id = UUID((await seed(1))[0]['id'])
+    queue = await queue(flush_interval=0.01)
+
+    async def publish_failed(key=None):
+        raise ConnectionError('LISTEN perdido')
+
+    monkeypatch.setattr('workout_api.atleta.write_behind.atleta_cache.invalidate', publish_failed)
+    updated = await queue.submit('update', atleta_id, {'idade': 50})
+    await asyncio.sleep(0.1)
+
+    async def flush_failed(batch):
+        raise RuntimeError('falha inesperada')
+
+    monkeypatch.setattr(queue, '_flush', flush_failed)
+    lost = await queue.submit('update', atleta_id, {'idade': 60})
+    await asyncio.sleep(0.1)
+
+    assert updated.status == 'done'
+    assert (lost.status, lost.detail) == ('failed', 'Falha ao gravar no banco de dados.')
+    assert queue.running
+
+
+async def test_dead_worker_stops_accepting_jobs(client, referencias, queue):
+    queue = await queue(flush_interval=0.01)
+    queue._worker.cancel()
+    await asyncio.sleep(0)
+
+    assert not queue.running
+    assert (await client.post('/atletas/', json=atleta_payload(1))).status_code == 201
@@ -1,3 +1,4 @@
+from workout_api.contrib import startup
 from workout_api.categorias.models import CategoriaModel
 from workout_api.atleta.models import AtletaModel
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
\ No newline at end of file
@@ -0,0 +1,237 @@
+import json
+from datetime import datetime
+from typing import NamedTuple
+from uuid import uuid4
+
+from pydantic import ValidationError
+from fastapi import HTTPException, status
+from sqlalchemy import delete, func, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.schemas import AtletaBulkAlteracao, AtletaBulkChangeOut, AtletaBulkFiltro, AtletaBulkOut, AtletaBulkResult, AtletaIn
+from workout_api.categorias.cache import categoria_cache
+from workout_api.centro_treinamento.cache import centro_treinamento_cache
+from workout_api.configs.settings import settings
+
+
+class InvalidLine(NamedTuple):
+    detail: str
+
+
+def _parse_line(line: bytes):
+    # Uma linha malformada vira "rejected" no resultado em vez de derrubar o stream.
+    try:
+        return json.loads(line)
+    except ValueError as exc:
+        return InvalidLine(f'JSON inválido: {exc}')
+
+
+def parse_payload(raw: bytes, content_type: str) -> list:
+    if 'ndjson' in content_type or 'jsonl' in content_type:
+        return [_parse_line(line) for line in raw.splitlines() if line.strip()]
+
+    payload = json.loads(raw)
+    if not isinstance(payload, list):
+        raise ValueError('O corpo deve ser uma lista JSON ou um stream NDJSON de atletas.')
+    return payload
+
+
+def insert_stmt(dialect_name: str):
+    # ON CONFLICT DO NOTHING garante que um CPF inserido por outra requisição
+    # entre a checagem e o INSERT vire "duplicate" em vez de abortar o lote.
+    if dialect_name == 'postgresql':
+        return postgresql.insert(AtletaModel).on_conflict_do_nothing(index_elements=['cpf'])
+    if dialect_name == 'sqlite':
+        return sqlite.insert(AtletaModel).on_conflict_do_nothing(index_elements=['cpf'])
+    return insert(AtletaModel)
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+async def _existing_cpfs(db_session: AsyncSession, cpfs: list[str], chunk_size: int) -> set[str]:
+    existing: set[str] = set()
+    for chunk in _chunks(cpfs, chunk_size):
+        rows = await db_session.execute(select(AtletaModel.cpf).where(AtletaModel.cpf.in_(chunk)))
+        existing.update(rows.scalars().all())
+    return existing
+
+
+async def bulk_create(db_session: AsyncSession, payload: list, chunk_size: int | None = None) -> AtletaBulkOut:
+    chunk_size = chunk_size or settings.BULK_CHUNK_SIZE
+    results: list[AtletaBulkResult | None] = [None] * len(payload)
+    valid: list[tuple[int, AtletaIn]] = []
+
+    for index, item in enumerate(payload):
+        if isinstance(item, InvalidLine):
+            results[index] = AtletaBulkResult(index=index, status='rejected', detail=item.detail)
+            continue
+        try:
+            valid.append((index, AtletaIn.model_validate(item)))
+        except ValidationError as exc:
+            cpf = item.get('cpf') if isinstance(item, dict) else None
+            results[index] = AtletaBulkResult(
+                index=index, status='rejected', cpf=cpf if isinstance(cpf, str) else None,
+                detail='; '.join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in exc.errors()),
+            )
+
+    categorias = await categoria_cache.pk_by_names(db_session, {a.categoria.nome for _, a in valid})
+    centros = await centro_treinamento_cache.pk_by_names(db_session, {a.centro_treinamento.nome for _, a in valid})
+    existing = await _existing_cpfs(db_session, list({a.cpf for _, a in valid}), chunk_size)
+
+    rows: list[dict] = []
+    pending: dict[str, AtletaBulkResult] = {}
+    for index, atleta_in in valid:
+        categoria_id = categorias.get(atleta_in.categoria.nome)
+        centro_treinamento_id = centros.get(atleta_in.centro_treinamento.nome)
+
+        if categoria_id is None:
+            results[index] = AtletaBulkResult(
+                index=index, status='rejected', cpf=atleta_in.cpf,
+                detail=f'Categoria {atleta_in.categoria.nome} não encontrada.'
+            )
+        elif centro_treinamento_id is None:
+            results[index] = AtletaBulkResult(
+                index=index, status='rejected', cpf=atleta_in.cpf,
+                detail=f'Centro de treinamento {atleta_in.centro_treinamento.nome} não encontrado.'
+            )
+        elif atleta_in.cpf in existing or atleta_in.cpf in pending:
+            results[index] = AtletaBulkResult(
+                index=index, status='duplicate', cpf=atleta_in.cpf,
+                detail=f'Atleta com CPF {atleta_in.cpf} já existe.'
+            )
+        else:
+            atleta_id = uuid4()
+            rows.append({
+                **atleta_in.model_dump(exclude={'categoria', 'centro_treinamento'}),
+                'id': atleta_id,
+                'created_at': datetime.utcnow(),
+                'categoria_id': categoria_id,
+                'centro_treinamento_id': centro_treinamento_id,
+            })
+            pending[atleta_in.cpf] = results[index] = AtletaBulkResult(
+                index=index, status='created', cpf=atleta_in.cpf, id=atleta_id
+            )
+
+    stmt = insert_stmt(db_session.bind.dialect.name).returning(AtletaModel.cpf)
+    inserted: set[str] = set()
+    for chunk in _chunks(rows, chunk_size):
+        inserted.update((await db_session.execute(stmt.values(chunk))).scalars().all())
+    await db_session.commit()
+
+    for cpf, result in pending.items():
+        if cpf not in inserted:
+            result.status = 'duplicate'
+            result.id = None
+            result.detail = f'Atleta com CPF {cpf} já existe.'
+
+    return AtletaBulkOut(
+        created=sum(r.status == 'created' for r in results),
+        rejected=sum(r.status == 'rejected' for r in results),
+        duplicates=sum(r.status == 'duplicate' for r in results),
+        results=results,
+    )
+
+
+async def _categoria_pk(db_session: AsyncSession, nome: str) -> int:
+    pk_id = await categoria_cache.pk_by_name(db_session, nome)
+    if pk_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'Categoria {nome} não encontrada.')
+    return pk_id
+
+
+async def _centro_treinamento_pk(db_session: AsyncSession, nome: str) -> int:
+    pk_id = await centro_treinamento_cache.pk_by_name(db_session, nome)
+    if pk_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'Centro de treinamento {nome} não encontrado.')
+    return pk_id
+
+
+async def _where(db_session: AsyncSession, filtro: AtletaBulkFiltro) -> list:
+    conditions = []
+    if filtro.centro_treinamento is not None:
+        conditions.append(AtletaModel.centro_treinamento_id == await _centro_treinamento_pk(db_session, filtro.centro_treinamento))
+    if filtro.categoria is not None:
+        conditions.append(AtletaModel.categoria_id == await _categoria_pk(db_session, filtro.categoria))
+    if filtro.ids is not None:
+        conditions.append(AtletaModel.id.in_(filtro.ids))
+
+    # Sem filtro o UPDATE/DELETE atingiria a tabela inteira.
+    if not conditions:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail='Informe ao menos um filtro: centro_treinamento, categoria ou ids.'
+        )
+    return conditions
+
+
+async def _changes(db_session: AsyncSession, alteracoes: AtletaBulkAlteracao) -> dict:
+    values = {}
+    if alteracoes.centro_treinamento is not None:
+        values['centro_treinamento_id'] = await _centro_treinamento_pk(db_session, alteracoes.centro_treinamento)
+    if alteracoes.categoria is not None:
+        values['categoria_id'] = await _categoria_pk(db_session, alteracoes.categoria)
+    if not values:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail='Informe ao menos uma alteração: centro_treinamento ou categoria.'
+        )
+    return values
+
+
+async def _matching(db_session: AsyncSession, conditions: list, listar_ids: bool) -> tuple[int, list | None]:
+    if listar_ids:
+        ids = (await db_session.execute(select(AtletaModel.id).where(*conditions))).scalars().all()
+        return len(ids), ids
+    return (await db_session.execute(select(func.count()).select_from(AtletaModel).where(*conditions))).scalar(), None
+
+
+async def _apply(db_session: AsyncSession, stmt, listar_ids: bool) -> tuple[int, list | None]:
+    # Os IDs só voltam (via RETURNING) quando pedidos: remover um centro
+    # inteiro não deve montar uma lista sem limite em memória e na resposta.
+    options = {'synchronize_session': False}
+    if listar_ids:
+        ids = (await db_session.execute(stmt.returning(AtletaModel.id), execution_options=options)).scalars().all()
+        afetados = len(ids)
+    else:
+        ids = None
+        afetados = (await db_session.execute(stmt, execution_options=options)).rowcount
+    await db_session.commit()
+    return afetados, ids
+
+
+def _change_out(afetados: int, dry_run: bool, ids: list | None) -> AtletaBulkChangeOut:
+    if ids is None:
+        return AtletaBulkChangeOut(afetados=afetados, dry_run=dry_run)
+    return AtletaBulkChangeOut(afetados=afetados, dry_run=dry_run, ids=ids)
+
+
+async def bulk_update(
+    db_session: AsyncSession, filtro: AtletaBulkFiltro, alteracoes: AtletaBulkAlteracao, dry_run: bool, listar_ids: bool = False
+) -> AtletaBulkChangeOut:
+    conditions = await _where(db_session, filtro)
+    values = await _changes(db_session, alteracoes)
+
+    if dry_run:
+        afetados, ids = await _matching(db_session, conditions, listar_ids)
+    else:
+        # Um único UPDATE ... WHERE, sem carregar os objetos no ORM.
+        afetados, ids = await _apply(db_session, update(AtletaModel).where(*conditions).values(**values), listar_ids)
+
+    return _change_out(afetados, dry_run, ids)
+
+
+async def bulk_delete(db_session: AsyncSession, filtro: AtletaBulkFiltro, dry_run: bool, listar_ids: bool = False) -> AtletaBulkChangeOut:
+    conditions = await _where(db_session, filtro)
+
+    if dry_run:
+        afetados, ids = await _matching(db_session, conditions, listar_ids)
+    else:
+        afetados, ids = await _apply(db_session, delete(AtletaModel).where(*conditions), listar_ids)
+
+    return _change_out(afetados, dry_run, ids)
@@ -0,0 +1,4 @@
+from workout_api.configs.settings import settings
+from workout_api.contrib.cache import LookupCache
+
+atleta_cache = LookupCache('atletas', settings.ATLETA_CACHE_TTL_SECONDS, settings.CACHE_MAX_ENTRIES)
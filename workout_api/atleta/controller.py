@@ -1,25 +1,64 @@
-from sqlite3 import IntegrityError
+import asyncio
+import json
+from sqlalchemy.exc import IntegrityError
+from typing import Literal
 from uuid import uuid4
-from fastapi import APIRouter, Body, HTTPException, Query, status
+from fastapi import APIRouter, Body, HTTPException, Query, Request, Response, status
 from datetime import datetime
 
 from fastapi.params import Depends
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi_pagination import LimitOffsetParams
 from pydantic import UUID4
+from workout_api.atleta import bulk, export, projection, search, stats
+from workout_api.atleta.cache import atleta_cache
+from workout_api.atleta.write_behind import Job, JobKind, write_behind
 from workout_api.atleta.models import AtletaModel
-from workout_api.atleta.schemas import AtletaIn, AtletaOut, AtletaUpdate
+from workout_api.atleta.schemas import AtletaBulkChangeOut, AtletaBulkFiltro, AtletaBulkOut, AtletaBulkUpdate, AtletaIn, AtletaJobOut, AtletaListOut, AtletaOut, AtletaPage, AtletaSearchOut, AtletaStatsOut, AtletaUpdate
+from workout_api.categorias.cache import categoria_cache
 from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.cache import centro_treinamento_cache
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
-from workout_api.contrib.dependencies import DataBaseDependency
+from workout_api.configs.database import is_consistent_read, read_sessionmaker
+from workout_api.configs.settings import settings
+from workout_api.contrib.dependencies import DataBaseDependency, ReadDataBaseDependency
+from workout_api.contrib.http_cache import cache_headers, conditional_response, is_conditional, make_etag
+from workout_api.contrib.responses import trusted_response
+from workout_api.contrib.pagination import keyset, next_page
 from sqlalchemy.future import select
 
 router = APIRouter()
 
+
+async def _enqueue(kind: JobKind, atleta_id, values: dict) -> JSONResponse:
+    try:
+        job = await write_behind.submit(kind, atleta_id, values, timeout=settings.WRITE_BEHIND_ENQUEUE_TIMEOUT)
+    except asyncio.QueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Fila de escrita cheia. Tente novamente em instantes.',
+            headers={'Retry-After': '1'},
+        )
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=jsonable_encoder(_job_out(job)),
+        headers={'Location': f'/atletas/jobs/{job.id}'},
+    )
+
+
+def _job_out(job: Job) -> AtletaJobOut:
+    return AtletaJobOut(
+        id=job.id, tipo=job.kind, status=job.status, atleta_id=job.atleta_id,
+        detail=job.detail, created_at=job.created_at, finished_at=job.finished_at,
+    )
+
 @router.post(
         path='/', 
         summary='Criar novo atleta', 
         status_code=status.HTTP_201_CREATED,
-        response_model=AtletaOut
+        response_model=AtletaOut,
+        responses={status.HTTP_202_ACCEPTED: {'model': AtletaJobOut, 'description': 'Criação enfileirada (WRITE_BEHIND_ENABLED)'}},
 )
 
 async def post(
@@ -28,11 +67,9 @@ async def post(
 ):
     categoria_name = atleta_in.categoria.nome
 
-    categoria = (await db_session.execute(
-        select(CategoriaModel).filter_by(nome=categoria_name))
-        ).scalars().first()
-    
-    if not categoria:
+    categoria_id = await categoria_cache.pk_by_name(db_session, categoria_name)
+
+    if categoria_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail=f'Categoria {categoria_name} não encontrada.'
@@ -40,11 +77,9 @@ async def post(
 
     centro_treinamento_name = atleta_in.centro_treinamento.nome
 
-    centro_treinamento = (await db_session.execute(
-        select(CentroTreinamentoModel).filter_by(nome=centro_treinamento_name))
-        ).scalars().first()
+    centro_treinamento_id = await centro_treinamento_cache.pk_by_name(db_session, centro_treinamento_name)
 
-    if not centro_treinamento:
+    if centro_treinamento_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f'Centro de treinamento {centro_treinamento_name} não encontrado.'
@@ -52,14 +87,19 @@ async def post(
     try:
         atleta_out = AtletaOut(id=uuid4(), created_at=datetime.utcnow(), **atleta_in.model_dump())
         atleta_model = AtletaModel(**atleta_out.model_dump(exclude={'categoria', 'centro_treinamento'}))
-        atleta_model.categoria_id = categoria.pk_id
-        atleta_model.centro_treinamento_id = centro_treinamento.pk_id
+        atleta_model.categoria_id = categoria_id
+        atleta_model.centro_treinamento_id = centro_treinamento_id
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail='Dados inválidos para criação do atleta.'
         )
 
+    if write_behind.running:
+        values = atleta_out.model_dump(exclude={'categoria', 'centro_treinamento'})
+        values.update(categoria_id=categoria_id, centro_treinamento_id=centro_treinamento_id)
+        return await _enqueue('create', atleta_out.id, values)
+
     db_session.add(atleta_model)
 
     try:
@@ -73,44 +113,221 @@ async def post(
 
     return atleta_out
 
+@router.post(
+        path='/bulk',
+        summary='Criar atletas em lote',
+        status_code=status.HTTP_200_OK,
+        response_model=AtletaBulkOut,
+        openapi_extra={
+            'requestBody': {
+                'required': True,
+                'content': {
+                    'application/json': {'schema': {'type': 'array', 'items': {'$ref': '#/components/schemas/AtletaIn'}}},
+                    'application/x-ndjson': {'schema': {'type': 'string'}},
+                },
+            },
+        },
+)
+async def post_bulk(db_session: DataBaseDependency, request: Request) -> AtletaBulkOut:
+    try:
+        payload = bulk.parse_payload(await request.body(), request.headers.get('content-type', ''))
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc) if not isinstance(exc, json.JSONDecodeError) else 'JSON inválido no corpo da requisição.'
+        )
+
+    return await bulk.bulk_create(db_session, payload)
+
+@router.patch(
+    '/bulk',
+    summary='Alterar atletas em lote',
+    status_code=status.HTTP_200_OK,
+    response_model=AtletaBulkChangeOut,
+    response_model_exclude_unset=True,
+)
+async def patch_bulk(
+    db_session: DataBaseDependency,
+    atleta_bulk: AtletaBulkUpdate = Body(...),
+    dry_run: bool = Query(default=False, description="Apenas conta os atletas afetados, sem gravar"),
+    listar_ids: bool = Query(default=False, description="Inclui os IDs dos atletas afetados na resposta"),
+) -> AtletaBulkChangeOut:
+    result = await bulk.bulk_update(db_session, atleta_bulk.filtro, atleta_bulk.alteracoes, dry_run, listar_ids)
+    if result.afetados and not dry_run:
+        await atleta_cache.invalidate()
+    return result
+
+@router.delete(
+    '/bulk',
+    summary='Deletar atletas em lote',
+    status_code=status.HTTP_200_OK,
+    response_model=AtletaBulkChangeOut,
+    response_model_exclude_unset=True,
+)
+async def delete_bulk(
+    db_session: DataBaseDependency,
+    filtro: AtletaBulkFiltro | None = Body(default=None, description="Filtro no corpo, como o `filtro` do PATCH; necessário para listas de `ids`"),
+    centro_treinamento: str | None = Query(default=None, description="Nome do centro de treinamento"),
+    categoria: str | None = Query(default=None, description="Nome da categoria"),
+    dry_run: bool = Query(default=False, description="Apenas conta os atletas afetados, sem remover"),
+    listar_ids: bool = Query(default=False, description="Inclui os IDs dos atletas afetados na resposta"),
+) -> AtletaBulkChangeOut:
+    # ids só vêm no corpo: mil UUIDs na query string estouram o limite da linha de requisição.
+    if filtro is None:
+        filtro = AtletaBulkFiltro(centro_treinamento=centro_treinamento, categoria=categoria)
+    elif centro_treinamento or categoria:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail='Informe os filtros na query string ou no corpo, não em ambos.'
+        )
+    result = await bulk.bulk_delete(db_session, filtro, dry_run, listar_ids)
+    if result.afetados and not dry_run:
+        await atleta_cache.invalidate()
+    return result
+
 @router.get(
     '/',
     summary='Listar todos os atletas',
     status_code=status.HTTP_200_OK,
-    response_model=list[AtletaOut],
+    response_model=AtletaPage | list[AtletaListOut],
+    response_model_exclude_unset=True,
 )
 async def query(
-    db_session: DataBaseDependency,
+    db_session: ReadDataBaseDependency,
     nome: str | None = Query(default=None, description="Filtrar por nome do atleta"),
     cpf: str | None = Query(default=None, description="Filtrar por CPF do atleta"),
+    cursor: str | None = Query(default=None, description="Cursor retornado em `next_cursor` pela página anterior"),
+    paginacao: Literal['cursor', 'offset'] = Query(default='cursor', description="Modo de paginação; `offset` mantém o formato legado (lista simples)"),
+    fields: str | None = Query(default=None, description="Campos retornados, separados por vírgula (ex.: `nome,cpf,categoria`)"),
     params: LimitOffsetParams = Depends(LimitOffsetParams),
-    ) -> list[dict]:
+    ) -> AtletaPage | list[dict]:
 
-    stmt = select(AtletaModel).options(
-        selectinload(AtletaModel.categoria),
-        selectinload(AtletaModel.centro_treinamento)
-    )
+    selected = projection.parse_fields(fields)
+    stmt = projection.list_stmt(selected)
 
     if nome:
-        stmt = stmt.filter(AtletaModel.nome.ilike(f'%{nome}%'))
+        stmt = stmt.filter(search.name_filter(nome))
     if cpf:
         stmt = stmt.filter(AtletaModel.cpf == cpf)
 
-    stmt = stmt.limit(params.limit).offset(params.offset)
+    if paginacao == 'offset':
+        stmt = stmt.order_by(AtletaModel.pk_id).limit(params.limit).offset(params.offset)
+    else:
+        stmt = keyset(stmt, AtletaModel, cursor, params.limit)
 
-    atletas: list[AtletaModel] = (await db_session.execute(stmt)).scalars().all()
+    rows = (await db_session.execute(stmt)).all()
 
-    if not atletas:
+    if not rows and (paginacao == 'offset' or not cursor):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Nenhum atleta encontrado.')
-    
-    response = []
-    for atleta in atletas:
-        response.append({
-            "nome": getattr(atleta, "nome", None),
-            "centro_treinamento": getattr(atleta.centro_treinamento, "nome", None),
-            "categoria": getattr(atleta.categoria, "nome", None),
-        })
-    return response
+
+    next_cursor, has_more = None, False
+    if paginacao == 'cursor' and rows:
+        rows, next_cursor, has_more = next_page(rows, params.limit, key=projection.cursor_key)
+
+    response = projection.to_dicts(rows, selected)
+
+    if settings.FAST_RESPONSES:
+        if paginacao == 'offset':
+            return trusted_response(response)
+        return trusted_response({'items': response, 'next_cursor': next_cursor, 'has_more': has_more})
+
+    if paginacao == 'offset':
+        return response
+    return AtletaPage(items=response, next_cursor=next_cursor, has_more=has_more)
+
+@router.get(
+    '/export',
+    summary='Exportar todos os atletas (NDJSON ou CSV)',
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def export_roster(
+    request: Request,
+    format: export.ExportFormat = Query(default='ndjson', description="Formato do arquivo: `ndjson` ou `csv`"),
+    fields: str | None = Query(default=None, description="Campos exportados, separados por vírgula; padrão: todos"),
+    gzip: bool = Query(default=False, description="Comprime a resposta com gzip"),
+) -> StreamingResponse:
+    selected = projection.parse_fields(fields) if fields else tuple(projection.FIELDS)
+    factory = await read_sessionmaker(request)
+
+    # Com gzip o arquivo baixado é o próprio .gz: sem Content-Encoding, para
+    # que clientes HTTP não descompactem o corpo por conta própria.
+    return StreamingResponse(
+        export.stream(factory, selected, format, gzip),
+        media_type='application/gzip' if gzip else export.MEDIA_TYPES[format],
+        headers={'Content-Disposition': f'attachment; filename="atletas.{format}{".gz" if gzip else ""}"'},
+    )
+
+@router.get(
+    '/stats',
+    summary='Estatísticas agregadas dos atletas',
+    status_code=status.HTTP_200_OK,
+    response_model=list[AtletaStatsOut],
+)
+async def statistics(
+    db_session: ReadDataBaseDependency,
+    group_by: list[stats.GroupBy] = Query(default=[], description="Agrupar por `categoria` e/ou `centro_treinamento`"),
+    resumo: bool | None = Query(default=None, description="Usa a tabela de resumo mantida por trigger (padrão: `STATS_USE_SUMMARY`)"),
+) -> list[AtletaStatsOut]:
+    groups = tuple(dict.fromkeys(group_by))
+    postgres = db_session.bind.dialect.name == 'postgresql'
+    use_summary = settings.STATS_USE_SUMMARY if resumo is None else resumo
+
+    if use_summary and await stats.summary_available(db_session):
+        stmt = stats.summary_stmt(groups)
+    else:
+        stmt = stats.live_stmt(groups, percentis=postgres)
+
+    rows = (await db_session.execute(stmt)).all()
+    return stats.to_dicts(rows, groups)
+
+@router.get(
+    '/search',
+    summary='Buscar atletas pelo nome',
+    status_code=status.HTTP_200_OK,
+    response_model=list[AtletaSearchOut],
+    response_model_exclude_unset=True,
+)
+async def search_by_name(
+    db_session: ReadDataBaseDependency,
+    q: str = Query(..., min_length=1, max_length=50, description="Termo de busca"),
+    modo: search.SearchMode = Query(default='contains', description="`contains`, `prefix` ou `fuzzy` (similaridade por trigramas)"),
+    limit: int = Query(default=20, ge=1, le=100, description="Quantidade máxima de resultados"),
+) -> list[AtletaSearchOut]:
+    stmt = search.search_stmt(db_session.bind.dialect.name, q, modo, limit)
+    rows = (await db_session.execute(stmt)).all()
+
+    if not rows:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Nenhum atleta encontrado.')
+    if settings.FAST_RESPONSES:
+        return trusted_response([dict(row._mapping) for row in rows])
+    return [AtletaSearchOut(**row._mapping) for row in rows]
+
+@router.get(
+    '/jobs/{job_id}',
+    summary='Consultar o status de uma escrita enfileirada',
+    status_code=status.HTTP_200_OK,
+    response_model=AtletaJobOut,
+)
+async def job_status(job_id: UUID4) -> AtletaJobOut:
+    job = write_behind.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'Job não encontrado com o ID {job_id}.')
+    return _job_out(job)
+
+def _version_stmt(id):
+    return (
+        select(AtletaModel.updated_at, CategoriaModel.updated_at, CentroTreinamentoModel.updated_at)
+        .join(CategoriaModel, AtletaModel.categoria_id == CategoriaModel.pk_id)
+        .join(CentroTreinamentoModel, AtletaModel.centro_treinamento_id == CentroTreinamentoModel.pk_id)
+        .where(AtletaModel.id == id)
+    )
+
+
+def _version(id, *updated_at: datetime) -> tuple[str, datetime]:
+    # O corpo traz os nomes da categoria e do centro: renomeá-los também
+    # muda a versão do atleta.
+    return make_etag(id, *(value.isoformat() for value in updated_at)), max(updated_at)
 
 @router.get(
     '/{id}',
@@ -118,11 +335,41 @@ async def query(
     status_code=status.HTTP_200_OK,
     response_model=AtletaOut,
 )
-async def query(id: UUID4, db_session: DataBaseDependency) -> AtletaOut:
-    atleta: AtletaOut = (await db_session.execute(select(AtletaModel).filter_by(id=id))).scalars().first()
+async def query(id: UUID4, db_session: ReadDataBaseDependency, request: Request, response: Response) -> AtletaOut:
+    key = str(id)
+    consistent = is_consistent_read(db_session)
+    if is_conditional(request):
+        # Revalidação: lê só os carimbos de versão e evita carregar o atleta
+        # e suas relações quando o cliente já tem a versão atual.
+        cached = None if consistent else atleta_cache.peek(key)
+        if cached is not None:
+            _, etag, last_modified = cached
+        else:
+            row = (await db_session.execute(_version_stmt(id))).first()
+            if row is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'Atleta não encontrado com o ID {id}.')
+            etag, last_modified = _version(id, *row)
+        not_modified = conditional_response(request, response, etag, last_modified, settings.HTTP_CACHE_MAX_AGE)
+        if not_modified:
+            return not_modified
 
-    if not atleta:
+    async def load():
+        atleta = (await db_session.execute(select(AtletaModel).filter_by(id=id))).scalars().first()
+        if atleta is None:
+            return None
+        # O resultado é compartilhado entre requisições, então sai da sessão como schema.
+        etag, last_modified = _version(
+            id, atleta.updated_at, atleta.categoria.updated_at, atleta.centro_treinamento.updated_at
+        )
+        return AtletaOut.model_validate(atleta), etag, last_modified
+
+    cached = await atleta_cache.get(key, load, consistent)
+
+    if not cached:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'Atleta não encontrado com o ID {id}.')
+
+    atleta, etag, last_modified = cached
+    response.headers.update(cache_headers(etag, last_modified, settings.HTTP_CACHE_MAX_AGE))
     return atleta
 
 @router.patch(
@@ -130,14 +377,19 @@ async def query(id: UUID4, db_session: DataBaseDependency) -> AtletaOut:
     summary='Editar um atleta pelo ID',
     status_code=status.HTTP_200_OK,
     response_model=AtletaOut,
+    responses={status.HTTP_202_ACCEPTED: {'model': AtletaJobOut, 'description': 'Alteração enfileirada (WRITE_BEHIND_ENABLED)'}},
 )
 async def query(id: UUID4, db_session: DataBaseDependency, atleta_up: AtletaUpdate = Body(...)) -> AtletaOut:
+    atleta_update = atleta_up.model_dump(exclude_unset=True)
+    if write_behind.running and atleta_update:
+        # A existência do atleta é verificada pelo worker; se não existir o job falha.
+        return await _enqueue('update', id, atleta_update)
+
     atleta: AtletaOut = (await db_session.execute(select(AtletaModel).filter_by(id=id))).scalars().first()
 
     if not atleta:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'Atleta não encontrado com o ID {id}.')
 
-    atleta_update = atleta_up.model_dump(exclude_unset=True)
     for key, value in atleta_update.items():
         setattr(atleta, key, value)
 
@@ -151,6 +403,7 @@ async def query(id: UUID4, db_session: DataBaseDependency, atleta_up: AtletaUpda
             detail=f'Já existe um atleta cadastrado com o cpf: {cpf_value}'
         )
 
+    await atleta_cache.invalidate(str(id))
     await db_session.refresh(atleta)
     
     return atleta
@@ -167,4 +420,5 @@ async def delete(id: UUID4, db_session: DataBaseDependency) -> None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'Atleta não encontrado com o ID {id}.')
 
     await db_session.delete(atleta)
-    await db_session.commit()
\ No newline at end of file
+    await db_session.commit()
+    await atleta_cache.invalidate(str(id))
\ No newline at end of file
@@ -0,0 +1,77 @@
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import AsyncIterator, Literal
+from uuid import UUID
+
+from sqlalchemy.orm import sessionmaker
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.projection import select_fields
+from workout_api.configs.settings import settings
+
+ExportFormat = Literal['ndjson', 'csv']
+
+MEDIA_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+def _json_default(value):
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f'Tipo não serializável: {type(value).__name__}')
+
+
+def _encode_ndjson(rows, fields: tuple[str, ...]) -> bytes:
+    return ''.join(
+        json.dumps(dict(zip(fields, row)), default=_json_default, ensure_ascii=False) + '\n' for row in rows
+    ).encode()
+
+
+def _encode_csv(rows) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+
+def _csv_header(fields: tuple[str, ...]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(fields)
+    return buffer.getvalue().encode()
+
+
+async def _chunks(factory: sessionmaker, fields: tuple[str, ...], formato: ExportFormat) -> AsyncIterator[bytes]:
+    # A sessão é aberta aqui, e não via dependência, para viver exatamente
+    # enquanto o corpo da resposta é transmitido.
+    stmt = (
+        select_fields(fields)
+        .order_by(AtletaModel.pk_id)
+        .execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+    )
+    if formato == 'csv':
+        yield _csv_header(fields)
+
+    async with factory() as session:
+        result = await session.stream(stmt)
+        async for rows in result.partitions():
+            yield _encode_ndjson(rows, fields) if formato == 'ndjson' else _encode_csv(rows)
+
+
+async def stream(factory: sessionmaker, fields: tuple[str, ...], formato: ExportFormat, compress: bool) -> AsyncIterator[bytes]:
+    if not compress:
+        async for chunk in _chunks(factory, fields, formato):
+            yield chunk
+        return
+
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in _chunks(factory, fields, formato):
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
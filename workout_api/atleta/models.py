@@ -1,11 +1,15 @@
 from datetime import UTC, datetime
-from sqlalchemy import Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Index, Integer, String, Float, DateTime, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from workout_api.contrib.models import BaseModel
 
 
 class AtletaModel(BaseModel):
     __tablename__ = "atletas"
+    __table_args__ = (
+        Index("ix_atletas_created_at_pk_id", "created_at", "pk_id"),
+        Index("ix_atletas_nome_trgm", "nome", postgresql_using="gin", postgresql_ops={"nome": "gin_trgm_ops"}),
+    )
 
     pk_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     nome: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -16,8 +20,8 @@ class AtletaModel(BaseModel):
     genero: Mapped[str] = mapped_column(String(1), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now(UTC), nullable=False)
 
-    categoria_id: Mapped[int] = mapped_column(ForeignKey("categorias.pk_id"))
+    categoria_id: Mapped[int] = mapped_column(ForeignKey("categorias.pk_id"), index=True)
     categoria: Mapped["CategoriaModel"] = relationship(back_populates="atleta", lazy='selectin')
 
-    centro_treinamento_id: Mapped[int] = mapped_column(ForeignKey("centro_treinamento.pk_id"))
+    centro_treinamento_id: Mapped[int] = mapped_column(ForeignKey("centro_treinamento.pk_id"), index=True)
     centro_treinamento: Mapped["CentroTreinamentoModel"] = relationship("CentroTreinamentoModel", back_populates="atleta", lazy='selectin')
@@ -0,0 +1,60 @@
+from fastapi import HTTPException, status
+from sqlalchemy.future import select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+
+FIELDS = {
+    'id': AtletaModel.id,
+    'nome': AtletaModel.nome,
+    'cpf': AtletaModel.cpf,
+    'idade': AtletaModel.idade,
+    'peso': AtletaModel.peso,
+    'altura': AtletaModel.altura,
+    'genero': AtletaModel.genero,
+    'created_at': AtletaModel.created_at,
+    'categoria': CategoriaModel.nome,
+    'centro_treinamento': CentroTreinamentoModel.nome,
+}
+
+DEFAULT_FIELDS = ('nome', 'centro_treinamento', 'categoria')
+
+
+def parse_fields(fields: str | None) -> tuple[str, ...]:
+    if not fields:
+        return DEFAULT_FIELDS
+    selected = tuple(dict.fromkeys(field.strip() for field in fields.split(',') if field.strip()))
+    invalid = [field for field in selected if field not in FIELDS]
+    if invalid or not selected:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f'Campos inválidos: {", ".join(invalid) or fields}. Permitidos: {", ".join(FIELDS)}.'
+        )
+    return selected
+
+
+def select_fields(fields: tuple[str, ...], *extra_columns):
+    # Um único SELECT com JOIN apenas nas tabelas necessárias; as linhas
+    # voltam como Row, sem hidratar objetos nem passar pelo identity map.
+    columns = [FIELDS[field].label(field) for field in fields]
+    stmt = select(*columns, *extra_columns).select_from(AtletaModel)
+    if 'categoria' in fields:
+        stmt = stmt.join(CategoriaModel, AtletaModel.categoria_id == CategoriaModel.pk_id)
+    if 'centro_treinamento' in fields:
+        stmt = stmt.join(CentroTreinamentoModel, AtletaModel.centro_treinamento_id == CentroTreinamentoModel.pk_id)
+    return stmt
+
+
+def list_stmt(fields: tuple[str, ...]):
+    # created_at e pk_id vão ao final da linha apenas para montar o cursor.
+    return select_fields(fields, AtletaModel.created_at.label('cursor_created_at'), AtletaModel.pk_id.label('cursor_pk_id'))
+
+
+def cursor_key(row) -> tuple:
+    return row.cursor_created_at, row.cursor_pk_id
+
+
+def to_dicts(rows, fields: tuple[str, ...]) -> list[dict]:
+    # zip descarta as colunas extras do cursor no fim de cada linha.
+    return [dict(zip(fields, row)) for row in rows]
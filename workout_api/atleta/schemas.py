@@ -1,6 +1,7 @@
 from __future__ import annotations
-from pydantic import Field, PositiveFloat
-from typing import Annotated, Optional
+from datetime import datetime
+from pydantic import UUID4, Field, PositiveFloat
+from typing import Annotated, Literal, Optional
 from workout_api.categorias.schemas import CategoriaIn
 from workout_api.centro_treinamento.schemas import CentroTreinamentoAtleta
 from workout_api.contrib.schemas import BaseSchema, OutMixIn
@@ -25,4 +26,79 @@ class AtletaUpdate(BaseSchema):
     nome: Annotated[Optional[str], Field(description="Nome do atleta", example="João Silva", max_length=50)] = None
     idade: Annotated[Optional[int], Field(description="Idade do atleta", example=25)] = None
 
+class AtletaListOut(BaseSchema):
+    id: Annotated[Optional[UUID4], Field(description="Identificador único", example="123e4567-e89b-12d3-a456-426614174000")] = None
+    nome: Annotated[Optional[str], Field(description="Nome do atleta", example="João Silva", max_length=50)] = None
+    cpf: Annotated[Optional[str], Field(description="CPF do atleta", example="12345678900", max_length=11)] = None
+    idade: Annotated[Optional[int], Field(description="Idade do atleta", example=25)] = None
+    peso: Annotated[Optional[float], Field(description="Peso do atleta em kg", example=70.5)] = None
+    altura: Annotated[Optional[float], Field(description="Altura do atleta em metros", example=1.75)] = None
+    genero: Annotated[Optional[str], Field(description="Gênero do atleta", example="M", max_length=1)] = None
+    created_at: Annotated[Optional[datetime], Field(description="Data de criação", example="2023-01-01T00:00:00Z")] = None
+    centro_treinamento: Annotated[Optional[str], Field(description="Nome do centro de treinamento", example="Academia XYZ")] = None
+    categoria: Annotated[Optional[str], Field(description="Nome da categoria", example="Força")] = None
+
+class AtletaSearchOut(AtletaListOut):
+    score: Annotated[float, Field(description="Relevância do resultado na busca", example=0.82)]
+
+class AtletaPage(BaseSchema):
+    items: Annotated[list[AtletaListOut], Field(description="Atletas da página")]
+    next_cursor: Annotated[Optional[str], Field(description="Cursor opaco para a próxima página", example="WyIyMDI1LTAxLTAxVDAwOjAwOjAwIiwgNDJd")] = None
+    has_more: Annotated[bool, Field(description="Indica se existem mais páginas", example=True)]
+
+class EstatisticaOut(BaseSchema):
+    media: Annotated[Optional[float], Field(description="Média", example=72.4)] = None
+    p50: Annotated[Optional[float], Field(description="Mediana (apenas no cálculo direto no PostgreSQL)", example=71.0)] = None
+    p90: Annotated[Optional[float], Field(description="Percentil 90 (apenas no cálculo direto no PostgreSQL)", example=88.5)] = None
+
+class AtletaStatsOut(BaseSchema):
+    grupo: Annotated[dict[str, str], Field(description="Valores das colunas de agrupamento", example={"categoria": "Força"})]
+    total: Annotated[int, Field(description="Quantidade de atletas", example=120)]
+    genero: Annotated[dict[str, int], Field(description="Quantidade por gênero", example={"M": 70, "F": 50})]
+    idade: Annotated[EstatisticaOut, Field(description="Idade em anos")]
+    peso: Annotated[EstatisticaOut, Field(description="Peso em kg")]
+    altura: Annotated[EstatisticaOut, Field(description="Altura em metros")]
+    imc: Annotated[EstatisticaOut, Field(description="Índice de massa corporal")]
+    imc_faixas: Annotated[dict[str, int], Field(description="Distribuição por faixa de IMC", example={"abaixo": 3, "normal": 80, "sobrepeso": 30, "obesidade": 7})]
+
+class AtletaJobOut(BaseSchema):
+    id: Annotated[UUID4, Field(description="Identificador do job", example="0f8fad5b-d9cb-469f-a165-70867728950e")]
+    tipo: Annotated[Literal['create', 'update'], Field(description="Operação enfileirada", example="create")]
+    status: Annotated[Literal['pending', 'done', 'failed'], Field(description="Situação do job", example="pending")]
+    atleta_id: Annotated[UUID4, Field(description="ID do atleta criado ou alterado", example="123e4567-e89b-12d3-a456-426614174000")]
+    detail: Annotated[Optional[str], Field(description="Motivo da falha", example="Atleta com CPF 12345678900 já existe.")] = None
+    created_at: Annotated[datetime, Field(description="Momento em que o job foi aceito")]
+    finished_at: Annotated[Optional[datetime], Field(description="Momento em que o job foi gravado ou falhou")] = None
+
+class AtletaBulkResult(BaseSchema):
+    index: Annotated[int, Field(description="Posição do registro no lote", example=0)]
+    status: Annotated[Literal['created', 'rejected', 'duplicate'], Field(description="Resultado do processamento", example="created")]
+    cpf: Annotated[Optional[str], Field(description="CPF do atleta", example="12345678900")] = None
+    id: Annotated[Optional[UUID4], Field(description="ID do atleta criado", example="123e4567-e89b-12d3-a456-426614174000")] = None
+    detail: Annotated[Optional[str], Field(description="Motivo da rejeição", example="Categoria Força não encontrada.")] = None
+
+class AtletaBulkOut(BaseSchema):
+    created: Annotated[int, Field(description="Quantidade de atletas criados", example=10)]
+    rejected: Annotated[int, Field(description="Quantidade de registros rejeitados", example=0)]
+    duplicates: Annotated[int, Field(description="Quantidade de CPFs duplicados", example=0)]
+    results: Annotated[list[AtletaBulkResult], Field(description="Resultado por registro")]
+
+class AtletaBulkFiltro(BaseSchema):
+    centro_treinamento: Annotated[Optional[str], Field(description="Nome do centro de treinamento atual", example="CT King")] = None
+    categoria: Annotated[Optional[str], Field(description="Nome da categoria atual", example="Scale")] = None
+    ids: Annotated[Optional[list[UUID4]], Field(description="IDs dos atletas", max_length=1000)] = None
+
+class AtletaBulkAlteracao(BaseSchema):
+    centro_treinamento: Annotated[Optional[str], Field(description="Novo centro de treinamento", example="CT Queen")] = None
+    categoria: Annotated[Optional[str], Field(description="Nova categoria", example="RX")] = None
+
+class AtletaBulkUpdate(BaseSchema):
+    filtro: Annotated[AtletaBulkFiltro, Field(description="Atletas afetados (critérios combinados com E)")]
+    alteracoes: Annotated[AtletaBulkAlteracao, Field(description="Valores aplicados a todos os atletas filtrados")]
+
+class AtletaBulkChangeOut(BaseSchema):
+    afetados: Annotated[int, Field(description="Quantidade de atletas alterados ou removidos", example=42)]
+    dry_run: Annotated[bool, Field(description="Se verdadeiro, nada foi gravado", example=False)]
+    ids: Annotated[Optional[list[UUID4]], Field(description="IDs dos atletas afetados (apenas com `listar_ids=true`)")] = None
+
 AtletaOut.model_rebuild()
\ No newline at end of file
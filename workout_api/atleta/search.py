@@ -0,0 +1,63 @@
+from typing import Literal
+
+from sqlalchemy import case, func, literal
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.atleta.projection import DEFAULT_FIELDS, select_fields
+
+SearchMode = Literal['contains', 'prefix', 'fuzzy']
+
+
+def escape_like(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def name_filter(termo: str, modo: SearchMode = 'contains'):
+    # ILIKE '%termo%' e 'termo%' são atendidos pelo índice GIN pg_trgm
+    # (ix_atletas_nome_trgm) no Postgres; no SQLite viram LIKE.
+    pattern = escape_like(termo)
+    if modo == 'prefix':
+        return AtletaModel.nome.ilike(f'{pattern}%', escape='\\')
+    return AtletaModel.nome.ilike(f'%{pattern}%', escape='\\')
+
+
+def _postgres_rank(termo: str, modo: SearchMode):
+    score = func.similarity(AtletaModel.nome, termo)
+    if modo == 'fuzzy':
+        # Operador de similaridade do pg_trgm, também servido pelo índice GIN.
+        return AtletaModel.nome.op('%')(termo), score
+    return name_filter(termo, modo), score
+
+
+def _sqlite_rank(termo: str, modo: SearchMode):
+    # Sem pg_trgm: o modo fuzzy casa qualquer palavra do termo e o ranking
+    # privilegia ocorrências mais próximas do início do nome.
+    if modo == 'fuzzy':
+        words = [word for word in termo.split() if word] or [termo]
+        condition = name_filter(words[0])
+        for word in words[1:]:
+            condition = condition | name_filter(word)
+    else:
+        condition = name_filter(termo, modo)
+
+    position = func.instr(func.lower(AtletaModel.nome), termo.lower())
+    score = case(
+        (func.lower(AtletaModel.nome) == termo.lower(), literal(1.0)),
+        (position > 0, 1.0 / (position + 1)),
+        else_=literal(0.0),
+    )
+    return condition, score
+
+
+def search_stmt(dialect_name: str, termo: str, modo: SearchMode, limit: int):
+    if dialect_name == 'postgresql':
+        condition, score = _postgres_rank(termo, modo)
+    else:
+        condition, score = _sqlite_rank(termo, modo)
+
+    return (
+        select_fields(DEFAULT_FIELDS, score.label('score'))
+        .where(condition)
+        .order_by(score.desc(), AtletaModel.pk_id)
+        .limit(limit)
+    )
@@ -0,0 +1,143 @@
+from typing import Literal
+
+from sqlalchemy import Column, Float, Integer, MetaData, PrimaryKeyConstraint, Table, case, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from workout_api.atleta.models import AtletaModel
+from workout_api.categorias.models import CategoriaModel
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+
+GroupBy = Literal['categoria', 'centro_treinamento']
+
+# Faixas de IMC da OMS.
+IMC_FAIXAS = (('abaixo', None, 18.5), ('normal', 18.5, 25.0), ('sobrepeso', 25.0, 30.0), ('obesidade', 30.0, None))
+
+# Resumo por (categoria, centro) mantido por trigger no Postgres (migração
+# 0005): cada escrita em atletas aplica só o delta da linha alterada. O
+# upsert trava a linha do grupo, então inserções simultâneas na mesma
+# categoria/centro são serializadas até o commit.
+#
+# Fica fora do BaseModel.metadata: um create_all criaria a tabela sem o
+# trigger, vazia e sem nunca ser atualizada. Tabela e FKs vêm da migração.
+atletas_resumo = Table(
+    'atletas_resumo',
+    MetaData(),
+    Column('categoria_id', Integer, nullable=False),
+    Column('centro_treinamento_id', Integer, nullable=False),
+    Column('total', Integer, nullable=False, default=0),
+    Column('masculino', Integer, nullable=False, default=0),
+    Column('feminino', Integer, nullable=False, default=0),
+    Column('soma_idade', Float, nullable=False, default=0),
+    Column('soma_peso', Float, nullable=False, default=0),
+    Column('soma_altura', Float, nullable=False, default=0),
+    Column('soma_imc', Float, nullable=False, default=0),
+    *(Column(f'imc_{nome}', Integer, nullable=False, default=0) for nome, _, _ in IMC_FAIXAS),
+    PrimaryKeyConstraint('categoria_id', 'centro_treinamento_id'),
+)
+
+_summary_available: bool | None = None
+
+_GROUP_COLUMNS = {
+    'categoria': CategoriaModel.nome,
+    'centro_treinamento': CentroTreinamentoModel.nome,
+}
+
+
+def _imc(model=AtletaModel):
+    return model.peso / (model.altura * model.altura)
+
+
+def _faixa(imc, minimo, maximo):
+    if minimo is None:
+        return imc < maximo
+    if maximo is None:
+        return imc >= minimo
+    return (imc >= minimo) & (imc < maximo)
+
+
+def _count_if(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _grouped(stmt, group_by: tuple[GroupBy, ...], categoria_id, centro_treinamento_id):
+    if 'categoria' in group_by:
+        stmt = stmt.join(CategoriaModel, categoria_id == CategoriaModel.pk_id)
+    if 'centro_treinamento' in group_by:
+        stmt = stmt.join(CentroTreinamentoModel, centro_treinamento_id == CentroTreinamentoModel.pk_id)
+    columns = [_GROUP_COLUMNS[group] for group in group_by]
+    return stmt.group_by(*columns).order_by(*columns) if columns else stmt
+
+
+async def summary_available(db_session: AsyncSession) -> bool:
+    # Sem o trigger da migração 0005 (SQLite, banco criado por create_all) a
+    # tabela de resumo não reflete os atletas e a agregação é feita ao vivo.
+    global _summary_available
+    if _summary_available is None:
+        _summary_available = db_session.bind.dialect.name == 'postgresql' and (await db_session.execute(
+            text("SELECT 1 FROM pg_trigger WHERE tgname = 'atletas_resumo_delta' AND NOT tgisinternal")
+        )).first() is not None
+    return _summary_available
+
+
+def live_stmt(group_by: tuple[GroupBy, ...], percentis: bool):
+    imc = _imc()
+    columns = [
+        func.count().label('total'),
+        _count_if(AtletaModel.genero == 'M').label('masculino'),
+        _count_if(AtletaModel.genero == 'F').label('feminino'),
+        func.avg(AtletaModel.idade).label('idade_media'),
+        func.avg(AtletaModel.peso).label('peso_media'),
+        func.avg(AtletaModel.altura).label('altura_media'),
+        func.avg(imc).label('imc_media'),
+    ]
+    columns += [_count_if(_faixa(imc, minimo, maximo)).label(f'imc_{nome}') for nome, minimo, maximo in IMC_FAIXAS]
+    if percentis:
+        for campo, expr in (('idade', AtletaModel.idade), ('peso', AtletaModel.peso), ('altura', AtletaModel.altura), ('imc', imc)):
+            for pct in (50, 90):
+                columns.append(func.percentile_cont(pct / 100).within_group(expr).label(f'{campo}_p{pct}'))
+
+    stmt = select(*(_GROUP_COLUMNS[group].label(group) for group in group_by), *columns).select_from(AtletaModel)
+    return _grouped(stmt, group_by, AtletaModel.categoria_id, AtletaModel.centro_treinamento_id)
+
+
+def summary_stmt(group_by: tuple[GroupBy, ...]):
+    resumo = atletas_resumo.c
+    total = func.sum(resumo.total)
+    media = lambda soma: func.sum(soma) / func.nullif(total, 0)
+    columns = [
+        func.coalesce(total, 0).label('total'),
+        func.coalesce(func.sum(resumo.masculino), 0).label('masculino'),
+        func.coalesce(func.sum(resumo.feminino), 0).label('feminino'),
+        media(resumo.soma_idade).label('idade_media'),
+        media(resumo.soma_peso).label('peso_media'),
+        media(resumo.soma_altura).label('altura_media'),
+        media(resumo.soma_imc).label('imc_media'),
+    ]
+    columns += [func.coalesce(func.sum(resumo[f'imc_{nome}']), 0).label(f'imc_{nome}') for nome, _, _ in IMC_FAIXAS]
+
+    stmt = select(*(_GROUP_COLUMNS[group].label(group) for group in group_by), *columns).select_from(atletas_resumo)
+    stmt = _grouped(stmt, group_by, resumo.categoria_id, resumo.centro_treinamento_id)
+    return stmt.having(total > 0) if group_by else stmt
+
+
+def to_dicts(rows, group_by: tuple[GroupBy, ...]) -> list[dict]:
+    result = []
+    for row in rows:
+        data = row._mapping
+        estatistica = lambda campo: {
+            'media': data[f'{campo}_media'],
+            'p50': data.get(f'{campo}_p50'),
+            'p90': data.get(f'{campo}_p90'),
+        }
+        result.append({
+            'grupo': {group: data[group] for group in group_by},
+            'total': data['total'],
+            'genero': {'M': data['masculino'], 'F': data['feminino']},
+            'idade': estatistica('idade'),
+            'peso': estatistica('peso'),
+            'altura': estatistica('altura'),
+            'imc': estatistica('imc'),
+            'imc_faixas': {nome: data[f'imc_{nome}'] for nome, _, _ in IMC_FAIXAS},
+        })
+    return result
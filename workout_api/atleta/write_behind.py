@@ -0,0 +1,205 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Literal
+from uuid import UUID, uuid4
+
+from sqlalchemy import update
+from sqlalchemy.orm import sessionmaker
+
+from workout_api.atleta.bulk import insert_stmt
+from workout_api.atleta.cache import atleta_cache
+from workout_api.atleta.models import AtletaModel
+from workout_api.configs.database import async_session
+from workout_api.configs.settings import settings
+from workout_api.contrib.cache import TTLCache
+from workout_api.contrib.metrics import Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+JobKind = Literal['create', 'update']
+JobStatus = Literal['pending', 'done', 'failed']
+
+write_behind_jobs = Counter('write_behind_jobs', 'Jobs de escrita processados pela fila', labelnames=('kind', 'status'))
+write_behind_rejected = Counter('write_behind_rejected', 'Escritas recusadas por fila cheia')
+
+
+@dataclass
+class Job:
+    kind: JobKind
+    atleta_id: UUID
+    values: dict
+    id: UUID = field(default_factory=uuid4)
+    status: JobStatus = 'pending'
+    detail: str | None = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: datetime | None = None
+
+
+class WriteBehindQueue:
+    def __init__(self, factory: sessionmaker, maxsize: int, batch_size: int, flush_interval: float, job_ttl: float) -> None:
+        self.factory = factory
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue[Job] | None = None
+        self._worker: asyncio.Task | None = None
+        self._closing = False
+        # Jobs pendentes ficam fora do LRU para nunca serem despejados antes
+        # de gravados; os concluídos expiram após job_ttl.
+        self._pending: dict[UUID, Job] = {}
+        self._finished = TTLCache(maxsize=max(maxsize * 10, 1), ttl=job_ttl)
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done() and not self._closing
+
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._closing = False
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float) -> None:
+        if self._worker is None:
+            return
+        # Para de aceitar escritas e espera o worker gravar o que já foi aceito.
+        self._closing = True
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.error('Fila de escrita não drenada em %ss; %d jobs descartados.', timeout, self._queue.qsize())
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def submit(self, kind: JobKind, atleta_id: UUID, values: dict, timeout: float = 0) -> Job:
+        if not self.running:
+            write_behind_rejected.inc()
+            raise asyncio.QueueFull
+        job = Job(kind=kind, atleta_id=atleta_id, values=values)
+        # Registrado antes de entrar na fila: o worker pode concluir o job
+        # antes de put() retornar, e o registro tardio nunca seria removido.
+        self._pending[job.id] = job
+        try:
+            if timeout > 0:
+                await asyncio.wait_for(self._queue.put(job), timeout)
+            else:
+                self._queue.put_nowait(job)
+        except (asyncio.QueueFull, asyncio.TimeoutError):
+            self._pending.pop(job.id, None)
+            write_behind_rejected.inc()
+            raise asyncio.QueueFull
+        return job
+
+    def get(self, job_id: UUID) -> Job | None:
+        return self._pending.get(job_id) or self._finished.get(job_id)
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            if self._queue.qsize() < self.batch_size - 1 and not self._closing:
+                await asyncio.sleep(self.flush_interval)
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._flush(batch)
+            except Exception:
+                # O worker não pode morrer: os jobs seguintes ficariam pendentes para sempre.
+                logger.exception('Falha ao processar lote de %d jobs da fila de escrita.', len(batch))
+                for job in batch:
+                    if job.status == 'pending':
+                        self._finish(job, 'failed', 'Falha ao gravar no banco de dados.')
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: list[Job]) -> None:
+        try:
+            outcomes = await self._write(batch)
+        except Exception:
+            # Um job inválido (FK, estouro de coluna) não pode derrubar o lote
+            # inteiro, já confirmado com 202: cada job é refeito isoladamente.
+            logger.exception('Falha ao gravar lote de %d jobs da fila de escrita; gravando um a um.', len(batch))
+            outcomes = await self._write_each(batch)
+
+        for job, status, detail in outcomes:
+            self._finish(job, status, detail)
+            if job.kind == 'update' and status == 'done':
+                try:
+                    await atleta_cache.invalidate(str(job.atleta_id))
+                except Exception:
+                    logger.exception('Falha ao invalidar o cache do atleta %s.', job.atleta_id)
+
+    async def _write_each(self, batch: list[Job]) -> list[tuple[Job, JobStatus, str | None]]:
+        outcomes = []
+        for job in batch:
+            try:
+                outcomes += await self._write([job])
+            except Exception:
+                logger.exception('Falha ao gravar o job %s da fila de escrita.', job.id)
+                outcomes.append((job, 'failed', 'Falha ao gravar no banco de dados.'))
+        return outcomes
+
+    async def _write(self, batch: list[Job]) -> list[tuple[Job, JobStatus, str | None]]:
+        creates = [job for job in batch if job.kind == 'create']
+        updates = [job for job in batch if job.kind == 'update']
+        outcomes: list[tuple[Job, JobStatus, str | None]] = []
+
+        async with self.factory() as session:
+            if creates:
+                # Um único INSERT multi-row por lote; CPFs repetidos são
+                # ignorados pelo ON CONFLICT e o job correspondente falha.
+                stmt = insert_stmt(session.bind.dialect.name).returning(AtletaModel.id)
+                inserted = set((await session.execute(stmt.values([job.values for job in creates]))).scalars().all())
+                for job in creates:
+                    if job.atleta_id in inserted:
+                        outcomes.append((job, 'done', None))
+                    else:
+                        outcomes.append((job, 'failed', f'Atleta com CPF {job.values["cpf"]} já existe.'))
+
+            for job in updates:
+                result = await session.execute(
+                    update(AtletaModel).where(AtletaModel.id == job.atleta_id).values(**job.values)
+                )
+                if result.rowcount:
+                    outcomes.append((job, 'done', None))
+                else:
+                    outcomes.append((job, 'failed', f'Atleta não encontrado com o ID {job.atleta_id}.'))
+
+            await session.commit()
+        return outcomes
+
+    def _finish(self, job: Job, status: JobStatus, detail: str | None) -> None:
+        job.status = status
+        job.detail = detail
+        job.finished_at = datetime.utcnow()
+        self._pending.pop(job.id, None)
+        self._finished.set(job.id, job)
+        write_behind_jobs.labels(job.kind, status).inc()
+
+
+write_behind = WriteBehindQueue(
+    async_session,
+    maxsize=settings.WRITE_BEHIND_QUEUE_SIZE,
+    batch_size=settings.WRITE_BEHIND_BATCH_SIZE,
+    flush_interval=settings.WRITE_BEHIND_FLUSH_INTERVAL,
+    job_ttl=settings.WRITE_BEHIND_JOB_TTL_SECONDS,
+)
+
+Gauge('write_behind_queue_depth', 'Jobs aguardando gravação na fila de escrita', function=lambda: float(write_behind.depth()))
+
+
+async def start() -> None:
+    if settings.WRITE_BEHIND_ENABLED:
+        await write_behind.start()
+
+
+async def stop() -> None:
+    await write_behind.stop(settings.WRITE_BEHIND_DRAIN_TIMEOUT)
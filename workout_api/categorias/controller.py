@@ -1,9 +1,14 @@
 from uuid import uuid4
-from fastapi import APIRouter, Body, HTTPException, status
+from fastapi import APIRouter, Body, HTTPException, Request, Response, status
 from pydantic import UUID4
+from workout_api.atleta.cache import atleta_cache
+from workout_api.categorias.cache import categoria_cache
 from workout_api.categorias.models import CategoriaModel
 from workout_api.categorias.schemas import CategoriaIn, CategoriaOut
-from workout_api.contrib.dependencies import DataBaseDependency
+from workout_api.configs.settings import settings
+from workout_api.contrib.http_cache import conditional_response
+from workout_api.contrib.responses import trusted_response
+from workout_api.contrib.dependencies import DataBaseDependency, ReadDataBaseDependency
 from sqlalchemy.future import select
 
 router = APIRouter()
@@ -25,6 +30,7 @@ async def post(
     
     db_session.add(categoria_model)
     await db_session.commit()
+    await categoria_cache.invalidate()
 
     return categoria_out
 
@@ -34,11 +40,20 @@ async def post(
     status_code=status.HTTP_200_OK,
     response_model=list[CategoriaOut],
 )
-async def query(db_session: DataBaseDependency) -> list[CategoriaOut]:
-    categorias: list[CategoriaOut] = (await db_session.execute(select(CategoriaModel))).scalars().all()
+async def query(db_session: ReadDataBaseDependency, request: Request, response: Response) -> list[CategoriaOut]:
+    snapshot = await categoria_cache.snapshot(db_session)
+    categorias: list[CategoriaOut] = snapshot.items
 
     if not categorias:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Nenhuma categoria encontrada.')
+
+    not_modified = conditional_response(
+        request, response, snapshot.etag, snapshot.last_modified, settings.HTTP_CACHE_MAX_AGE_REFERENCE
+    )
+    if not_modified:
+        return not_modified
+    if settings.FAST_RESPONSES:
+        return trusted_response(categorias, list[CategoriaOut], response)
     return categorias
 
 @router.get(
@@ -47,8 +62,8 @@ async def query(db_session: DataBaseDependency) -> list[CategoriaOut]:
     status_code=status.HTTP_200_OK,
     response_model=CategoriaOut,
 )
-async def query(id: UUID4, db_session: DataBaseDependency) -> CategoriaOut:
-    categoria: CategoriaOut = (await db_session.execute(select(CategoriaModel).filter_by(id=id))).scalars().first()
+async def query(id: UUID4, db_session: ReadDataBaseDependency) -> CategoriaOut:
+    categoria: CategoriaOut = await categoria_cache.by_id(db_session, id)
 
     if not categoria:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'Categoria não encontrada com o ID {id}.')
@@ -67,6 +82,7 @@ async def delete(id: UUID4, db_session: DataBaseDependency) -> None:
 
     await db_session.delete(categoria)
     await db_session.commit()
+    await categoria_cache.invalidate()
 
 @router.patch(
     '/{categoria_id}',
@@ -88,6 +104,9 @@ async def query(id: UUID4, db_session: DataBaseDependency, categoria_in: Categor
         setattr(categoria, key, value)
 
     await db_session.commit()
+    await categoria_cache.invalidate()
+    # Atletas em cache trazem o nome antigo.
+    await atleta_cache.invalidate()
     await db_session.refresh(categoria)
 
     return categoria
\ No newline at end of file
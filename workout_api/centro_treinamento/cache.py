@@ -0,0 +1,5 @@
+from workout_api.centro_treinamento.models import CentroTreinamentoModel
+from workout_api.centro_treinamento.schemas import CentroTreinamentoOut
+from workout_api.contrib.cache import ReferenceCache
+
+centro_treinamento_cache = ReferenceCache('centro_treinamento', CentroTreinamentoModel, CentroTreinamentoOut)
@@ -1,9 +1,14 @@
 from uuid import uuid4
-from fastapi import APIRouter, Body, HTTPException, status
+from fastapi import APIRouter, Body, HTTPException, Request, Response, status
 from pydantic import UUID4
+from workout_api.atleta.cache import atleta_cache
+from workout_api.centro_treinamento.cache import centro_treinamento_cache
 from workout_api.centro_treinamento.models import CentroTreinamentoModel
 from workout_api.centro_treinamento.schemas import CentroTreinamentoIn, CentroTreinamentoOut
-from workout_api.contrib.dependencies import DataBaseDependency
+from workout_api.configs.settings import settings
+from workout_api.contrib.http_cache import conditional_response
+from workout_api.contrib.responses import trusted_response
+from workout_api.contrib.dependencies import DataBaseDependency, ReadDataBaseDependency
 from sqlalchemy.future import select
 from uuid import UUID as _UUID
 
@@ -26,6 +31,7 @@ async def post(
 
     db_session.add(centro_treinamento_model)
     await db_session.commit()
+    await centro_treinamento_cache.invalidate()
 
     return centro_treinamento_out
 
@@ -35,11 +41,20 @@ async def post(
     status_code=status.HTTP_200_OK,
     response_model=list[CentroTreinamentoOut],
 )
-async def query(db_session: DataBaseDependency) -> list[CentroTreinamentoOut]:
-    centros: list[CentroTreinamentoOut] = (await db_session.execute(select(CentroTreinamentoModel))).scalars().all()
+async def query(db_session: ReadDataBaseDependency, request: Request, response: Response) -> list[CentroTreinamentoOut]:
+    snapshot = await centro_treinamento_cache.snapshot(db_session)
+    centros: list[CentroTreinamentoOut] = snapshot.items
 
     if not centros:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Nenhum centro de treinamento encontrado.')
+
+    not_modified = conditional_response(
+        request, response, snapshot.etag, snapshot.last_modified, settings.HTTP_CACHE_MAX_AGE_REFERENCE
+    )
+    if not_modified:
+        return not_modified
+    if settings.FAST_RESPONSES:
+        return trusted_response(centros, list[CentroTreinamentoOut], response)
     return centros
 
 @router.get(
@@ -48,11 +63,11 @@ async def query(db_session: DataBaseDependency) -> list[CentroTreinamentoOut]:
     status_code=status.HTTP_200_OK,
     response_model=CentroTreinamentoOut,
 )
-async def query(ct_id: UUID4, db_session: DataBaseDependency) -> CentroTreinamentoOut:
-    centro: CentroTreinamentoOut = (await db_session.execute(select(CentroTreinamentoModel).filter_by(id=id))).scalars().first()
+async def query(ct_id: UUID4, db_session: ReadDataBaseDependency) -> CentroTreinamentoOut:
+    centro: CentroTreinamentoOut = await centro_treinamento_cache.by_id(db_session, ct_id)
 
     if not centro:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'Centro de treinamento não encontrado com o ID {id}.')
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'Centro de treinamento não encontrado com o ID {ct_id}.')
     return centro
 
 @router.delete(
@@ -72,6 +87,7 @@ async def delete(ct_id: UUID4, db_session: DataBaseDependency) -> None:
 
     await db_session.delete(centro)
     await db_session.commit()
+    await centro_treinamento_cache.invalidate()
 
 @router.patch(
     '/{ct_id}',
@@ -93,6 +109,9 @@ async def query(ct_id: UUID4, db_session: DataBaseDependency, centro_treinamento
         setattr(centro, key, value)
 
     await db_session.commit()
+    await centro_treinamento_cache.invalidate()
+    # Atletas em cache trazem o nome antigo.
+    await atleta_cache.invalidate()
     await db_session.refresh(centro)
 
     return centro
\ No newline at end of file
@@ -1,13 +1,284 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from uuid import uuid4
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import InterfaceError, OperationalError, TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.util.queue import AsyncAdaptedQueue
 from workout_api.configs.settings import settings
+from workout_api.contrib.metrics import Counter, Gauge, Histogram
 
-engine = create_async_engine(settings.DB_URL, echo=False)
+logger = logging.getLogger(__name__)
+
+READ_PRIMARY_COOKIE = 'read_primary_until'
+
+pool_wait_seconds = Histogram(
+    'db_pool_wait_seconds', 'Tempo aguardando uma conexão do pool',
+    labelnames=('pool',), buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+pool_waiting = Gauge('db_pool_waiting', 'Requisições aguardando uma conexão do pool', labelnames=('pool',))
+pool_timeouts = Counter('db_pool_timeouts', 'Tentativas de checkout que estouraram o pool_timeout', labelnames=('pool',))
+
+
+class _TimedQueue(AsyncAdaptedQueue):
+    # Mede só a espera na fila de conexões ociosas; abrir uma conexão nova
+    # (overflow) acontece fora daqui e não entra no histograma.
+    pool_name = 'primary'
+
+    def get(self, block=True, timeout=None):
+        waiting = pool_waiting.labels(self.pool_name)
+        if block:
+            waiting.inc()
+        start = time.perf_counter()
+        try:
+            return super().get(block, timeout)
+        finally:
+            if block:
+                waiting.dec()
+            pool_wait_seconds.labels(self.pool_name).observe(time.perf_counter() - start)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    _queue_class = _TimedQueue
+
+    @property
+    def pool_name(self) -> str:
+        return self._pool.pool_name
+
+    @pool_name.setter
+    def pool_name(self, value: str) -> None:
+        self._pool.pool_name = value
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.pool_name = self.pool_name
+        return pool
+
+    def _do_get(self):
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            # Falhas ao conectar (DNS, autenticação, recusa) não são timeout do pool.
+            pool_timeouts.labels(self.pool_name).inc()
+            raise
+
+
+def engine_options(db_url: str) -> dict:
+    url = make_url(db_url)
+    if url.get_backend_name() == 'sqlite':
+        return {}
+
+    options = {
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': settings.DB_POOL_SIZE,
+        'max_overflow': settings.DB_MAX_OVERFLOW,
+        'pool_timeout': settings.DB_POOL_TIMEOUT,
+        'pool_recycle': settings.DB_POOL_RECYCLE,
+        'pool_pre_ping': settings.DB_POOL_PRE_PING,
+    }
+    if url.get_driver_name() == 'asyncpg':
+        connect_args = {'statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE}
+        if settings.DB_PGBOUNCER:
+            # PgBouncer em modo transaction não mantém prepared statements
+            # entre transações: desliga os caches do asyncpg e do SQLAlchemy.
+            connect_args = {
+                'statement_cache_size': 0,
+                'prepared_statement_cache_size': 0,
+                'prepared_statement_name_func': lambda: f'__asyncpg_{uuid4()}__',
+            }
+        options['connect_args'] = connect_args
+    return options
+
+
+def create_engine(db_url: str, pool_name: str = 'primary') -> AsyncEngine:
+    engine = create_async_engine(db_url, echo=False, **engine_options(db_url))
+    if isinstance(engine.sync_engine.pool, InstrumentedQueuePool):
+        engine.sync_engine.pool.pool_name = pool_name
+    engines[pool_name] = engine
+    return engine
+
+
+def _pool_stat(stat) -> dict:
+    values = {}
+    for name, engine in engines.items():
+        pool = engine.sync_engine.pool
+        if isinstance(pool, QueuePool):
+            values[(name,)] = stat(pool)
+    return values
+
+
+engines: dict[str, AsyncEngine] = {}
+
+Gauge('db_pool_size', 'Tamanho configurado do pool', labelnames=('pool',), function=lambda: _pool_stat(lambda p: p.size()))
+Gauge('db_pool_checked_out', 'Conexões em uso', labelnames=('pool',), function=lambda: _pool_stat(lambda p: p.checkedout()))
+Gauge('db_pool_checked_in', 'Conexões ociosas no pool', labelnames=('pool',), function=lambda: _pool_stat(lambda p: p.checkedin()))
+Gauge('db_pool_overflow', 'Conexões de overflow abertas', labelnames=('pool',), function=lambda: _pool_stat(lambda p: max(p.overflow(), 0)))
+
+engine = create_engine(settings.DB_URL)
 async_session = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
     )
 
+_REPLICA_ERRORS = (OperationalError, InterfaceError, OSError)
+
+
+class ReplicaSession(AsyncSession):
+    # Se a réplica falhar no meio da requisição, ela é marcada como
+    # indisponível e a operação é refeita uma vez no primário, numa sessão
+    # nova que atende o restante da requisição.
+    fallback: AsyncSession | None = None
+
+    async def _run(self, method: str, *args, **kwargs):
+        if self.fallback is None:
+            try:
+                return await getattr(super(), method)(*args, **kwargs)
+            except _REPLICA_ERRORS:
+                logger.warning('Falha na réplica de leitura; refazendo a leitura no primário.', exc_info=True)
+                replica_health.mark_unhealthy()
+                self.fallback = async_session()
+        return await getattr(self.fallback, method)(*args, **kwargs)
+
+    async def execute(self, *args, **kwargs):
+        return await self._run('execute', *args, **kwargs)
+
+    async def scalar(self, *args, **kwargs):
+        return await self._run('scalar', *args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        return await self._run('get', *args, **kwargs)
+
+    async def stream(self, *args, **kwargs):
+        return await self._run('stream', *args, **kwargs)
+
+    async def close(self) -> None:
+        if self.fallback is not None:
+            await self.fallback.close()
+        await super().close()
+
+
+replica_engine = create_engine(settings.DB_REPLICA_URL, 'replica') if settings.DB_REPLICA_URL else None
+replica_session = sessionmaker(
+    replica_engine, class_=ReplicaSession, expire_on_commit=False
+    ) if replica_engine else None
+
+
+class ReplicaHealth:
+    # O resultado do ping fica em cache por DB_REPLICA_HEALTH_INTERVAL para
+    # não adicionar um round-trip a cada leitura.
+    def __init__(self, engine: AsyncEngine | None) -> None:
+        self.engine = engine
+        self.healthy = engine is not None
+        self.checked_at = 0.0
+        self._probe: asyncio.Task | None = None
+
+    async def _select_one(self) -> None:
+        async with self.engine.connect() as conn:
+            await conn.execute(text('SELECT 1'))
+
+    async def _ping(self) -> bool:
+        try:
+            # O timeout cobre também a abertura da conexão; uma réplica
+            # inalcançável não segura o ping pelo connect timeout do driver.
+            await asyncio.wait_for(self._select_one(), settings.DB_REPLICA_HEALTH_TIMEOUT)
+            return True
+        except Exception:
+            logger.warning('Réplica de leitura indisponível; leituras voltam para o primário.', exc_info=True)
+            return False
+
+    async def _check(self) -> None:
+        self.healthy = await self._ping()
+        self.checked_at = time.monotonic()
+
+    async def is_healthy(self) -> bool:
+        if self.engine is None:
+            return False
+        stale = time.monotonic() - self.checked_at >= settings.DB_REPLICA_HEALTH_INTERVAL
+        if stale and (self._probe is None or self._probe.done()):
+            # O ping roda em segundo plano e nenhuma leitura espera por ele;
+            # até terminar vale o último resultado, e se a réplica tiver caído
+            # a ReplicaSession refaz a leitura no primário.
+            self._probe = asyncio.create_task(self._check())
+        return self.healthy
+
+    def mark_unhealthy(self) -> None:
+        self.healthy = False
+        self.checked_at = time.monotonic()
+
+
+replica_health = ReplicaHealth(replica_engine)
+Gauge('db_replica_healthy', 'Réplica de leitura saudável (1) ou não (0)', function=lambda: float(replica_health.healthy))
+
+
 async def get_session() -> AsyncGenerator:
     async with async_session() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+
+@asynccontextmanager
+async def primary_session(db_session: AsyncSession) -> AsyncGenerator:
+    # A própria sessão se ela já está no primário; senão uma sessão nova nele.
+    if not isinstance(db_session, ReplicaSession):
+        yield db_session
+        return
+    async with async_session() as session:
+        yield session
+
+
+def is_consistent_read(db_session: AsyncSession) -> bool:
+    # Leitura roteada ao primário apesar de haver réplica (read-your-writes,
+    # X-Read-Consistency: strong ou réplica fora): não pode reaproveitar
+    # dados lidos na réplica.
+    return replica_session is not None and not isinstance(db_session, ReplicaSession)
+
+
+class ReadYourWritesMiddleware:
+    # Após uma escrita o cliente fica "grudado" no primário por alguns
+    # segundos, garantindo read-your-writes apesar do atraso da réplica. O
+    # cookie é posto aqui para valer também nas respostas que os endpoints
+    # montam por conta própria (como o 202 do write-behind).
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] in ('GET', 'HEAD', 'OPTIONS'):
+            return await self.app(scope, receive, send)
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start' and message['status'] < 400:
+                until = int(time.time() + settings.DB_REPLICA_STICKY_SECONDS)
+                cookie = (
+                    f'{READ_PRIMARY_COOKIE}={until}; HttpOnly; Max-Age={settings.DB_REPLICA_STICKY_SECONDS}; '
+                    'Path=/; SameSite=lax'
+                )
+                message = {**message, 'headers': [*message.get('headers', []), (b'set-cookie', cookie.encode())]}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _wants_primary(request: Request) -> bool:
+    if request.headers.get('x-read-consistency', '').lower() == 'strong':
+        return True
+    try:
+        return int(request.cookies.get(READ_PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+async def read_sessionmaker(request: Request) -> sessionmaker:
+    if replica_session is None or _wants_primary(request) or not await replica_health.is_healthy():
+        return async_session
+    return replica_session
+
+
+async def get_read_session(request: Request) -> AsyncGenerator:
+    factory = await read_sessionmaker(request)
+    async with factory() as session:
+        yield session
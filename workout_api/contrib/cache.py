@@ -0,0 +1,349 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Hashable, NamedTuple
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from workout_api.configs.database import primary_session
+from workout_api.configs.settings import settings
+from workout_api.contrib.http_cache import make_etag
+from workout_api.contrib.singleflight import SingleFlight, cache_lookups
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING:
+            return default
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class InvalidationBackend(ABC):
+    @abstractmethod
+    async def start(self, on_invalidate: Callable[[str], None]) -> None:
+        ...
+
+    @abstractmethod
+    async def publish(self, namespace: str) -> None:
+        ...
+
+    async def stop(self) -> None:
+        pass
+
+
+class InMemoryInvalidationBackend(InvalidationBackend):
+    def __init__(self) -> None:
+        self._subscribers: list[Callable[[str], None]] = []
+
+    async def start(self, on_invalidate: Callable[[str], None]) -> None:
+        self._subscribers.append(on_invalidate)
+
+    async def publish(self, namespace: str) -> None:
+        for subscriber in self._subscribers:
+            subscriber(namespace)
+
+    async def stop(self) -> None:
+        self._subscribers.clear()
+
+
+class PostgresInvalidationBackend(InvalidationBackend):
+    # Usa LISTEN/NOTIFY para que todos os workers uvicorn recebam a invalidação.
+    channel = 'workout_api_cache'
+    reconnect_delay = 0.5
+
+    def __init__(self, db_url: str) -> None:
+        self.dsn = make_url(db_url).set(drivername='postgresql').render_as_string(hide_password=False)
+        self._conn = None
+        self._on_invalidate: Callable[[str], None] | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._stopping = False
+        # A conexão do LISTEN é única e o asyncpg não aceita duas operações
+        # simultâneas nela; publicações concorrentes passam uma de cada vez.
+        self._publish_lock = asyncio.Lock()
+
+    async def start(self, on_invalidate: Callable[[str], None]) -> None:
+        self._on_invalidate = on_invalidate
+        self._stopping = False
+        await self._connect()
+
+    async def _connect(self) -> None:
+        import asyncpg
+
+        conn = await asyncpg.connect(self.dsn)
+        await conn.add_listener(self.channel, lambda *args: self._on_invalidate(args[-1]))
+        conn.add_termination_listener(self._connection_lost)
+        self._conn = conn
+
+    def _connection_lost(self, conn) -> None:
+        if self._stopping or conn is not self._conn:
+            return
+        logger.warning('Conexão do LISTEN do cache perdida; reconectando.')
+        self._conn = None
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = self.reconnect_delay
+        while not self._stopping:
+            try:
+                await self._connect()
+            except Exception:
+                logger.warning('Falha ao reconectar o LISTEN do cache; nova tentativa em %.1fs.', delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+            else:
+                # Notificações enviadas enquanto a conexão estava caída se perderam.
+                self._on_invalidate('*')
+                return
+
+    async def publish(self, namespace: str) -> None:
+        # A escrita já foi confirmada: uma falha aqui não deve virar 500.
+        if self._conn is None:
+            logger.warning('Invalidação %r não publicada: sem conexão com o Postgres.', namespace)
+            return
+        try:
+            async with self._publish_lock:
+                await self._conn.execute('SELECT pg_notify($1, $2)', self.channel, namespace)
+        except Exception:
+            logger.exception('Falha ao publicar a invalidação %r do cache.', namespace)
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+
+def _build_backend() -> InvalidationBackend:
+    if settings.CACHE_BACKEND == 'postgres':
+        return PostgresInvalidationBackend(settings.DB_URL)
+    return InMemoryInvalidationBackend()
+
+
+backend: InvalidationBackend = _build_backend()
+registry: dict[str, 'ReferenceCache | LookupCache'] = {}
+
+
+def _on_invalidate(message: str) -> None:
+    # 'namespace' limpa o cache inteiro; 'namespace:chave' descarta uma entrada;
+    # '*' limpa todos os caches.
+    if message == '*':
+        for cache in registry.values():
+            cache.clear()
+        return
+    namespace, _, key = message.partition(':')
+    cache = registry.get(namespace)
+    if cache is None:
+        return
+    if key:
+        cache.discard(key)
+    else:
+        cache.clear()
+
+
+async def start() -> None:
+    try:
+        await backend.start(_on_invalidate)
+    except Exception:
+        logger.exception('Falha ao iniciar o backend de invalidação do cache; usando apenas invalidação local.')
+
+
+async def stop() -> None:
+    await backend.stop()
+
+
+class Snapshot(NamedTuple):
+    items: list
+    etag: str
+    last_modified: datetime | None
+
+
+class ReferenceCache:
+    # O cache é compartilhado por todos os clientes durante CACHE_TTL_SECONDS;
+    # por isso é sempre preenchido pelo primário, nunca por uma réplica
+    # atrasada logo depois de uma escrita.
+    def __init__(self, namespace: str, model, schema) -> None:
+        self.namespace = namespace
+        self.model = model
+        self.schema = schema
+        self._pk_by_name = TTLCache(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+        self._by_id = TTLCache(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+        self._all = TTLCache(1, settings.CACHE_TTL_SECONDS)
+        self._flight = SingleFlight(namespace)
+        # Incrementado a cada invalidação; evita gravar no cache um valor lido
+        # antes de uma escrita concorrente.
+        self._generation = 0
+        registry[namespace] = self
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._pk_by_name.clear()
+        self._by_id.clear()
+        self._all.clear()
+        self._flight.clear()
+
+    async def invalidate(self) -> None:
+        self.clear()
+        await backend.publish(self.namespace)
+
+    async def _fill(self, cache: TTLCache, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        generation = self._generation
+        value = await loader()
+        if value is not None and generation == self._generation:
+            cache.set(key, value)
+        return value
+
+    async def pk_by_names(self, db_session: AsyncSession, names: set[str]) -> dict[str, int]:
+        found = {nome: pk_id for nome in names if (pk_id := self._pk_by_name.get(nome)) is not None}
+        missing = names - found.keys()
+        if missing:
+            generation = self._generation
+            rows = await db_session.execute(
+                select(self.model.nome, self.model.pk_id).where(self.model.nome.in_(missing))
+            )
+            for nome, pk_id in rows.all():
+                found[nome] = pk_id
+                if generation == self._generation:
+                    self._pk_by_name.set(nome, pk_id)
+        return found
+
+    async def pk_by_name(self, db_session: AsyncSession, nome: str) -> int | None:
+        return (await self.pk_by_names(db_session, {nome})).get(nome)
+
+    async def by_id(self, db_session: AsyncSession, id) -> Any:
+        cached = self._by_id.get(id)
+        if cached is not None:
+            cache_lookups.labels(self.namespace, 'hit').inc()
+            return cached
+
+        async def load():
+            async with primary_session(db_session) as session:
+                row = (await session.execute(select(self.model).filter_by(id=id))).scalars().first()
+            return self.schema.model_validate(row) if row else None
+
+        return await self._fill(self._by_id, id, lambda: self._flight.do(('id', id), load))
+
+    async def snapshot(self, db_session: AsyncSession) -> Snapshot:
+        cached = self._all.get(None)
+        if cached is not None:
+            return cached
+
+        async def load():
+            async with primary_session(db_session) as session:
+                rows = (await session.execute(select(self.model))).scalars().all()
+            return self._snapshot(rows)
+
+        return await self._fill(self._all, None, lambda: self._flight.do('all', load))
+
+    def _snapshot(self, rows) -> Snapshot:
+        items = [self.schema.model_validate(row) for row in rows]
+        # O ETag deriva do conteúdo, então é o mesmo em todos os workers.
+        etag = make_etag(self.namespace, *(item.model_dump_json() for item in items))
+        last_modified = max((row.updated_at for row in rows), default=None)
+        return Snapshot(items, etag, last_modified)
+
+    async def warm(self, db_session: AsyncSession) -> None:
+        # Uma única leitura preenche a listagem e os lookups por nome e por ID.
+        generation = self._generation
+        rows = (await db_session.execute(select(self.model))).scalars().all()
+        if generation != self._generation:
+            return
+        snapshot = self._snapshot(rows)
+        for row, item in zip(rows, snapshot.items):
+            self._pk_by_name.set(row.nome, row.pk_id)
+            self._by_id.set(row.id, item)
+        self._all.set(None, snapshot)
+
+    async def all(self, db_session: AsyncSession) -> list:
+        return (await self.snapshot(db_session)).items
+
+
+class LookupCache:
+    # Cache por chave com TTL curto opcional (ttl <= 0 desliga) sobre uma
+    # camada de single-flight, que vale mesmo com o cache desligado.
+    def __init__(self, namespace: str, ttl: float, maxsize: int) -> None:
+        self.namespace = namespace
+        self._cache = TTLCache(maxsize, ttl) if ttl > 0 else None
+        self._flight = SingleFlight(namespace)
+        self._generation = 0
+        registry[namespace] = self
+
+    def peek(self, key: Hashable) -> Any:
+        if self._cache is None:
+            return None
+        return self._cache.get(key)
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[Any]], consistent: bool = False) -> Any:
+        # Leituras consistentes (no primário) ignoram o cache e só se juntam
+        # a outras leituras consistentes, nunca a uma que está na réplica.
+        if not consistent:
+            cached = self.peek(key)
+            if cached is not None:
+                cache_lookups.labels(self.namespace, 'hit').inc()
+                return cached
+
+        generation = self._generation
+        value = await self._flight.do((key, consistent), loader)
+        if value is not None and self._cache is not None and generation == self._generation:
+            self._cache.set(key, value)
+        return value
+
+    def discard(self, key: Hashable) -> None:
+        self._generation += 1
+        self._flight.forget((key, False))
+        self._flight.forget((key, True))
+        if self._cache is not None:
+            self._cache.pop(key)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._flight.clear()
+        if self._cache is not None:
+            self._cache.clear()
+
+    async def invalidate(self, key: str | None = None) -> None:
+        # Sem chave (escritas em lote) o cache inteiro é descartado.
+        if key is None:
+            self.clear()
+        else:
+            self.discard(key)
+        if self._cache is not None:
+            await backend.publish(self.namespace if key is None else f'{self.namespace}:{key}')
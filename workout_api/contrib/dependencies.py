@@ -2,7 +2,8 @@ from typing import Annotated
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastapi import Depends
-from workout_api.configs.database import get_session
+from workout_api.configs.database import get_read_session, get_session
 
 
-DataBaseDependency = Annotated[AsyncSession, Depends(get_session)]
\ No newline at end of file
+DataBaseDependency = Annotated[AsyncSession, Depends(get_session)]
+ReadDataBaseDependency = Annotated[AsyncSession, Depends(get_read_session)]
\ No newline at end of file
@@ -0,0 +1,59 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.blake2b('|'.join(map(str, parts)).encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def _http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def is_conditional(request: Request) -> bool:
+    return 'if-none-match' in request.headers or 'if-modified-since' in request.headers
+
+
+def not_modified(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        # If-None-Match tem precedência sobre If-Modified-Since (RFC 9110).
+        candidates = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+        return '*' in candidates or etag in candidates
+
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            # parsedate_to_datetime devolve datetime naive para o fuso '-0000'.
+            since = since.replace(tzinfo=timezone.utc)
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def cache_headers(etag: str, last_modified: datetime | None, max_age: int) -> dict[str, str]:
+    headers = {'ETag': etag, 'Cache-Control': f'max-age={max_age}, must-revalidate'}
+    if last_modified is not None:
+        headers['Last-Modified'] = _http_date(last_modified)
+    return headers
+
+
+def conditional_response(
+    request: Request, response: Response, etag: str, last_modified: datetime | None, max_age: int
+) -> Response | None:
+    headers = cache_headers(etag, last_modified, max_age)
+    if not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
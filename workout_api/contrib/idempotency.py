@@ -0,0 +1,243 @@
+import asyncio
+import hashlib
+import json
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String, Table, Text, delete, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.future import select
+
+from workout_api.configs.database import async_session
+from workout_api.configs.settings import settings
+from workout_api.contrib.cache import TTLCache
+from workout_api.contrib.metrics import Counter
+from workout_api.contrib.models import BaseModel
+from workout_api.contrib.ratelimit import client_identity
+
+logger = logging.getLogger(__name__)
+
+HEADER = b'idempotency-key'
+MAX_KEY_LENGTH = 255
+# Respostas reaproveitáveis: sucesso e erros que dependem só do corpo. Os
+# demais 4xx (404 de categoria inexistente, por exemplo) liberam a chave
+# para o cliente repetir depois de corrigir a pré-condição.
+REPLAYABLE_ERRORS = (409, 422)
+
+idempotency_requests = Counter(
+    'idempotency_requests', 'Requisições com Idempotency-Key por resultado', labelnames=('result',),
+)
+
+idempotency_keys = Table(
+    'idempotency_keys',
+    BaseModel.metadata,
+    Column('key', String(MAX_KEY_LENGTH + 64), primary_key=True),
+    Column('fingerprint', String(64), nullable=False),
+    Column('status_code', Integer, nullable=False),
+    Column('headers', Text, nullable=False),
+    Column('body', LargeBinary, nullable=False),
+    Column('expires_at', DateTime, nullable=False, index=True),
+)
+
+
+@dataclass
+class StoredResponse:
+    fingerprint: str
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+
+class IdempotencyStore(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> StoredResponse | None:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, stored: StoredResponse) -> None:
+        ...
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> StoredResponse | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, stored: StoredResponse) -> None:
+        self._cache.set(key, stored)
+
+
+class DatabaseIdempotencyStore(IdempotencyStore):
+    # Compartilha as chaves entre workers e sobrevive a reinícios; exige a
+    # tabela idempotency_keys (migração 0006).
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+
+    async def get(self, key: str) -> StoredResponse | None:
+        async with async_session() as session:
+            row = (await session.execute(
+                select(idempotency_keys).where(
+                    idempotency_keys.c.key == key, idempotency_keys.c.expires_at > datetime.utcnow()
+                )
+            )).first()
+        if row is None:
+            return None
+        headers = [(name.encode('latin-1'), value.encode('latin-1')) for name, value in json.loads(row.headers)]
+        return StoredResponse(row.fingerprint, row.status_code, headers, row.body)
+
+    async def set(self, key: str, stored: StoredResponse) -> None:
+        now = datetime.utcnow()
+        values = {
+            'key': key,
+            'fingerprint': stored.fingerprint,
+            'status_code': stored.status_code,
+            'headers': json.dumps([(name.decode('latin-1'), value.decode('latin-1')) for name, value in stored.headers]),
+            'body': stored.body,
+            'expires_at': now + timedelta(seconds=self.ttl),
+        }
+        async with async_session() as session:
+            dialect = session.bind.dialect.name
+            if dialect in ('postgresql', 'sqlite'):
+                stmt = (postgresql if dialect == 'postgresql' else sqlite).insert(idempotency_keys).values(values)
+                stmt = stmt.on_conflict_do_update(index_elements=['key'], set_={k: v for k, v in values.items() if k != 'key'})
+            else:
+                stmt = insert(idempotency_keys).values(values)
+            await session.execute(delete(idempotency_keys).where(idempotency_keys.c.expires_at <= now))
+            await session.execute(stmt)
+            await session.commit()
+
+
+def _build_store() -> IdempotencyStore:
+    if settings.IDEMPOTENCY_BACKEND == 'database':
+        return DatabaseIdempotencyStore(settings.IDEMPOTENCY_TTL_SECONDS)
+    return InMemoryIdempotencyStore(settings.IDEMPOTENCY_MAX_ENTRIES, settings.IDEMPOTENCY_TTL_SECONDS)
+
+
+async def _send_json(send, status_code: int, detail: str) -> None:
+    body = json.dumps({'detail': detail}, ensure_ascii=False).encode()
+    await send({
+        'type': 'http.response.start',
+        'status': status_code,
+        'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _replay(send, stored: StoredResponse, fingerprint: str) -> None:
+    if stored.fingerprint != fingerprint:
+        idempotency_requests.labels('mismatch').inc()
+        return await _send_json(send, 422, 'Idempotency-Key já utilizada com outro corpo de requisição.')
+    idempotency_requests.labels('replayed').inc()
+    await send({
+        'type': 'http.response.start',
+        'status': stored.status_code,
+        'headers': [*stored.headers, (b'idempotent-replayed', b'true')],
+    })
+    await send({'type': 'http.response.body', 'body': stored.body})
+
+
+def _storage_key(scope, raw_key: bytes) -> str:
+    # A chave vale por cliente, com a mesma identidade do rate limit: clientes
+    # diferentes com a mesma Idempotency-Key não veem a resposta um do outro.
+    parts = (client_identity(scope).encode(), scope['method'].encode(), scope['path'].encode(), raw_key)
+    return hashlib.sha256(b'\n'.join(parts)).hexdigest()
+
+
+def _replayed_body(body: bytes, receive):
+    delivered = False
+
+    async def wrapper():
+        nonlocal delivered
+        if not delivered:
+            delivered = True
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+        return await receive()
+
+    return wrapper
+
+
+class IdempotencyMiddleware:
+    def __init__(self, app, store: IdempotencyStore | None = None) -> None:
+        self.app = app
+        self.store = store or _build_store()
+        # Execuções em andamento por chave: duplicatas concorrentes aguardam a
+        # primeira em vez de repetir lookups e transação.
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] != 'POST':
+            return await self.app(scope, receive, send)
+
+        raw_key = dict(scope['headers']).get(HEADER)
+        if raw_key is None:
+            return await self.app(scope, receive, send)
+        if not raw_key or len(raw_key) > MAX_KEY_LENGTH:
+            return await _send_json(send, 400, f'Idempotency-Key deve ter entre 1 e {MAX_KEY_LENGTH} caracteres.')
+
+        key = _storage_key(scope, raw_key)
+
+        # O corpo é lido por inteiro para compor a impressão digital e depois
+        # reentregue à aplicação.
+        body = b''
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+            body += message.get('body', b'')
+            more_body = message.get('more_body', False)
+        fingerprint = hashlib.sha256(body).hexdigest()
+
+        while (pending := self._in_flight.get(key)) is not None:
+            idempotency_requests.labels('coalesced').inc()
+            # shield: o cancelamento de uma duplicata não afeta a execução original.
+            stored = await asyncio.shield(pending)
+            if stored is not None:
+                return await _replay(send, stored, fingerprint)
+            # A execução original não gerou resposta reutilizável (5xx); tenta de novo.
+
+        stored = await self.store.get(key)
+        if stored is not None:
+            return await _replay(send, stored, fingerprint)
+        if key in self._in_flight:
+            # Outra duplicata assumiu a execução enquanto o store era consultado.
+            return await self(scope, _replayed_body(body, receive), send)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        idempotency_requests.labels('executed').inc()
+
+        receive_wrapper = _replayed_body(body, receive)
+        status_code = 500
+        headers: list[tuple[bytes, bytes]] = []
+        chunks: list[bytes] = []
+
+        async def send_wrapper(message):
+            nonlocal status_code, headers
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                headers = list(message.get('headers', []))
+            elif message['type'] == 'http.response.body':
+                chunks.append(message.get('body', b''))
+            await send(message)
+
+        result: StoredResponse | None = None
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+            if 200 <= status_code < 300 or status_code in REPLAYABLE_ERRORS:
+                result = StoredResponse(
+                    fingerprint, status_code,
+                    [(name, value) for name, value in headers if name.lower() != b'set-cookie'],
+                    b''.join(chunks),
+                )
+                try:
+                    await self.store.set(key, result)
+                except Exception:
+                    logger.exception('Falha ao gravar a resposta da Idempotency-Key %s.', key)
+        finally:
+            self._in_flight.pop(key, None)
+            future.set_result(result)
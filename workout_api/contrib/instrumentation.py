@@ -0,0 +1,134 @@
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.routing import Match
+
+from workout_api.configs.settings import settings
+from workout_api.contrib.metrics import Counter, Gauge, Histogram
+
+logger = logging.getLogger('workout_api.slow')
+
+http_request_duration = Histogram(
+    'http_request_duration_seconds', 'Latência das requisições HTTP por rota',
+    labelnames=('method', 'route', 'status'),
+)
+http_requests_in_flight = Gauge('http_requests_in_flight', 'Requisições HTTP em andamento', labelnames=('method',))
+http_request_db_queries = Histogram(
+    'http_request_db_queries', 'Quantidade de queries SQL executadas por requisição',
+    labelnames=('method', 'route'), buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100),
+)
+http_request_db_seconds = Histogram(
+    'http_request_db_seconds', 'Tempo gasto no banco por requisição',
+    labelnames=('method', 'route'),
+)
+db_query_duration = Histogram('db_query_duration_seconds', 'Latência de cada query SQL')
+db_slow_queries = Counter('db_slow_queries', 'Queries acima de SLOW_QUERY_THRESHOLD_MS')
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar('request_stats', default=None)
+
+
+def current_stats() -> RequestStats | None:
+    return _request_stats.get()
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_start'].pop()
+    db_query_duration.observe(elapsed)
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+
+    threshold = settings.SLOW_QUERY_THRESHOLD_MS
+    if threshold is not None and elapsed * 1000 >= threshold:
+        db_slow_queries.inc()
+        logger.warning('Query lenta (%.1f ms): %s', elapsed * 1000, ' '.join(statement.split()))
+
+
+def _route_template(scope) -> str:
+    # O roteador do Starlette grava a rota casada no scope; usar o template
+    # (/atletas/{id}) evita uma série de métricas por UUID.
+    route = scope.get('route')
+    if route is None:
+        # Respostas dadas antes do roteamento (replays de idempotência,
+        # 429/503 de admissão) não passam pelo roteador: casa a rota aqui.
+        route = _match_route(scope)
+    return getattr(route, 'path', None) or 'unmatched'
+
+
+def _match_route(scope):
+    app = scope.get('app')
+    partial = None
+    for route in getattr(getattr(app, 'router', None), 'routes', ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route
+        if match == Match.PARTIAL and partial is None:
+            partial = route
+    return partial
+
+
+class InstrumentationMiddleware:
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        method = scope['method']
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                total_ms = (time.perf_counter() - start) * 1000
+                headers = list(message.get('headers', []))
+                headers.append((
+                    b'server-timing',
+                    f'db;desc="{stats.queries} queries";dur={stats.db_seconds * 1000:.2f}, app;dur={total_ms:.2f}'.encode(),
+                ))
+                message = {**message, 'headers': headers}
+            await send(message)
+
+        in_flight = http_requests_in_flight.labels(method)
+        in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight.dec()
+            _request_stats.reset(token)
+            elapsed = time.perf_counter() - start
+            route = _route_template(scope)
+            http_request_duration.labels(method, route, status_code).observe(elapsed)
+            http_request_db_queries.labels(method, route).observe(stats.queries)
+            http_request_db_seconds.labels(method, route).observe(stats.db_seconds)
+
+            threshold = settings.SLOW_REQUEST_THRESHOLD_MS
+            if threshold is not None and elapsed * 1000 >= threshold:
+                logger.warning(
+                    'Requisição lenta (%.1f ms, %d queries, %.1f ms no banco): %s %s',
+                    elapsed * 1000, stats.queries, stats.db_seconds * 1000, method, scope['path'],
+                )
@@ -0,0 +1,192 @@
+import math
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(labelnames: tuple[str, ...], values: tuple[str, ...], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    type = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        registry.register(self)
+
+    def labels(self, *values, **kwargs):
+        if kwargs:
+            values = tuple(kwargs[name] for name in self.labelnames)
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _default(self):
+        return self.labels()
+
+    @abstractmethod
+    def _new_child(self):
+        ...
+
+    @abstractmethod
+    def _samples(self) -> Iterable[str]:
+        ...
+
+    @property
+    def family(self) -> str:
+        return self.name
+
+    def render(self) -> str:
+        lines = [f'# HELP {self.family} {self.documentation}', f'# TYPE {self.family} {self.type}']
+        lines.extend(self._samples())
+        return '\n'.join(lines)
+
+
+class _Value:
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Counter(_Metric):
+    type = 'counter'
+
+    @property
+    def family(self) -> str:
+        # No formato texto 0.0.4 o nome da família é o mesmo das amostras.
+        return f'{self.name}_total'
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def _samples(self):
+        for key, child in list(self._children.items()):
+            yield f'{self.family}{_format_labels(self.labelnames, key)} {_format_value(child.value)}'
+
+
+class Gauge(_Metric):
+    type = 'gauge'
+
+    # `function` é avaliada no momento da coleta; com labels deve retornar
+    # um dict {(valor_label, ...): valor}.
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), function: Callable[[], float | dict] | None = None) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._function = function
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default().dec(amount)
+
+    def set(self, value: float) -> None:
+        self._default().set(value)
+
+    def set_function(self, function: Callable[[], float | dict]) -> None:
+        self._function = function
+
+    def _samples(self):
+        if self._function is not None:
+            values = self._function()
+            if not isinstance(values, dict):
+                values = {(): values}
+        else:
+            values = {key: child.value for key, child in list(self._children.items())}
+        for key, value in values.items():
+            yield f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+
+
+class _HistogramValue:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+
+
+class Histogram(_Metric):
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+    def _samples(self):
+        for key, child in list(self._children.items()):
+            cumulative = 0
+            for bound, count in zip(child.buckets, child.counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                yield f'{self.name}_bucket{labels} {cumulative}'
+            labels = _format_labels(self.labelnames, key)
+            yield f'{self.name}_sum{labels} {_format_value(child.sum)}'
+            yield f'{self.name}_count{labels} {child.count}'
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f'Métrica {metric.name} já registrada.')
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        return '\n'.join(metric.render() for metric in self._metrics.values()) + '\n'
+
+
+registry = Registry()
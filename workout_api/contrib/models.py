@@ -1,7 +1,13 @@
+from datetime import datetime
 from uuid import uuid4
-from sqlalchemy import UUID
+from sqlalchemy import UUID, DateTime, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 
 class BaseModel(DeclarativeBase):
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), default=uuid4, nullable=False)
+    # Chave pública de todas as rotas /{id}; o índice único evita varrer a tabela.
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), default=uuid4, nullable=False, unique=True, index=True)
+    # Carimbo de versão usado nos ETags/Last-Modified; atualizado em todo UPDATE.
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=func.now(), nullable=False
+    )
@@ -0,0 +1,39 @@
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+
+
+def encode_cursor(created_at: datetime, pk_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), pk_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, pk_id = json.loads(raw)
+        created_at = datetime.fromisoformat(created_at)
+        # created_at é gravado sem fuso; comparar com um valor com fuso quebra no asyncpg.
+        if created_at.tzinfo is not None:
+            raise ValueError(created_at)
+        return created_at, int(pk_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Cursor de paginação inválido.')
+
+
+def keyset(stmt, model, cursor: str | None, limit: int):
+    # Busca limit + 1 linhas: a linha extra só indica se existe próxima página,
+    # sem COUNT nem OFFSET.
+    if cursor:
+        stmt = stmt.where(tuple_(model.created_at, model.pk_id) > tuple_(*decode_cursor(cursor)))
+    return stmt.order_by(model.created_at, model.pk_id).limit(limit + 1)
+
+
+def next_page(rows: list, limit: int, key=lambda row: (row.created_at, row.pk_id)) -> tuple[list, str | None, bool]:
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(*key(rows[-1])) if has_more else None
+    return rows, next_cursor, has_more
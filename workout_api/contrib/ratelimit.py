@@ -0,0 +1,206 @@
+import asyncio
+import json
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import NamedTuple
+
+from workout_api.configs.settings import settings
+from workout_api.contrib.metrics import Counter, Gauge
+
+UNITS = {'s': 1, 'm': 60, 'h': 3600}
+
+# Monitoramento e documentação continuam respondendo sob sobrecarga.
+EXEMPT_PATHS = ('/metrics', '/docs', '/redoc', '/openapi.json')
+
+http_requests_shed = Counter(
+    'http_requests_shed', 'Requisições recusadas pelo controle de admissão', labelnames=('reason', 'group'),
+)
+admission_in_flight = Gauge('admission_in_flight', 'Requisições admitidas em andamento no worker')
+admission_max_in_flight = Gauge('admission_max_in_flight', 'Limite de requisições simultâneas do worker')
+
+
+class Rate(NamedTuple):
+    capacity: int
+    per_second: float
+
+
+def parse_rate(value: str) -> Rate:
+    # '100/s', '6000/m' ou '100/s:200' (taxa/unidade:rajada).
+    try:
+        rate, _, burst = value.partition(':')
+        amount, unit = rate.split('/')
+        per_second = int(amount) / UNITS[unit.strip()]
+        capacity = int(burst) if burst else int(amount)
+    except (KeyError, ValueError):
+        raise ValueError(f'Limite inválido: {value!r}. Use <quantidade>/<s|m|h>[:rajada], ex.: 100/s:200.')
+    return Rate(capacity, per_second)
+
+
+class Decision(NamedTuple):
+    allowed: bool
+    remaining: int
+    retry_after: float
+
+
+class RateLimitStore(ABC):
+    @abstractmethod
+    async def take(self, key: str, rate: Rate) -> Decision:
+        ...
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    # Token bucket por chave; os buckets menos usados são descartados acima
+    # de max_keys para que clientes de passagem não acumulem memória.
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(self, key: str, rate: Rate) -> Decision:
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (rate.capacity, now))
+        tokens = min(rate.capacity, tokens + (now - updated) * rate.per_second)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+        retry_after = 0.0 if allowed else (1 - tokens) / rate.per_second
+        return Decision(allowed, int(tokens), retry_after)
+
+
+def _build_store() -> RateLimitStore:
+    return InMemoryRateLimitStore(settings.RATE_LIMIT_MAX_CLIENTS)
+
+
+def _route_group(path: str, groups) -> str | None:
+    for group in groups:
+        if path == group or path.startswith(group + '/'):
+            return group
+    return None
+
+
+async def _reject(send, status_code: int, detail: str, retry_after: float, headers: list | None = None) -> None:
+    body = json.dumps({'detail': detail}, ensure_ascii=False).encode()
+    await send({
+        'type': 'http.response.start',
+        'status': status_code,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(body)).encode()),
+            (b'retry-after', str(max(1, math.ceil(retry_after))).encode()),
+            *(headers or []),
+        ],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+def client_identity(scope) -> str:
+    # Identidade do cliente para rate limit e Idempotency-Key. Só chaves
+    # conhecidas contam: uma chave qualquer no cabeçalho não pode abrir um
+    # bucket (ou escopo de idempotência) novo a cada requisição.
+    api_key = dict(scope['headers']).get(settings.RATE_LIMIT_KEY_HEADER.lower().encode())
+    if api_key and api_key.decode('latin-1') in settings.RATE_LIMIT_API_KEYS:
+        return 'key:' + api_key.decode('latin-1')
+    # Atrás de proxy o uvicorn (proxy_headers) já preenche o IP real do cliente.
+    client = scope.get('client')
+    return 'ip:' + (client[0] if client else 'unknown')
+
+
+class RateLimitMiddleware:
+    def __init__(self, app, limits: dict[str, str] | None = None, store: RateLimitStore | None = None) -> None:
+        self.app = app
+        limits = settings.RATE_LIMITS if limits is None else limits
+        # Prefixos mais longos primeiro para que o grupo mais específico vença.
+        self.rates = {group: parse_rate(value) for group, value in sorted(limits.items(), key=lambda item: -len(item[0]))}
+        self.store = store or _build_store()
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+        group = _route_group(scope['path'], self.rates)
+        if group is None:
+            return await self.app(scope, receive, send)
+
+        rate = self.rates[group]
+        decision = await self.store.take(f'{group}|{client_identity(scope)}', rate)
+        headers = [
+            (b'x-ratelimit-limit', str(rate.capacity).encode()),
+            (b'x-ratelimit-remaining', str(decision.remaining).encode()),
+        ]
+        if not decision.allowed:
+            http_requests_shed.labels('rate_limit', group).inc()
+            return await _reject(
+                send, 429, 'Limite de requisições excedido. Tente novamente mais tarde.', decision.retry_after, headers
+            )
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start':
+                message = {**message, 'headers': [*message.get('headers', []), *headers]}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class AdmissionMiddleware:
+    # Limita as requisições simultâneas do worker à capacidade do pool: o
+    # excedente é recusado com 503 em vez de esperar DB_POOL_TIMEOUT na fila.
+    # A vaga é liberada com a última parte do corpo, e não nos cabeçalhos: um
+    # streaming (/atletas/export) segura a conexão do pool até terminar.
+    def __init__(self, app, max_in_flight: int | None = None, wait: float | None = None) -> None:
+        self.app = app
+        self.max_in_flight = (
+            max_in_flight
+            or settings.ADMISSION_MAX_IN_FLIGHT
+            or max(1, int(settings.ADMISSION_POOL_FACTOR * (settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)))
+        )
+        self.wait = settings.ADMISSION_WAIT_SECONDS if wait is None else wait
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self.in_flight = 0
+        admission_in_flight.set_function(lambda: float(self.in_flight))
+        admission_max_in_flight.set(self.max_in_flight)
+
+    async def _acquire(self) -> bool:
+        if not self._slots.locked():
+            await self._slots.acquire()
+            return True
+        if self.wait <= 0:
+            return False
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.wait)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['path'] in EXEMPT_PATHS:
+            return await self.app(scope, receive, send)
+
+        if not await self._acquire():
+            http_requests_shed.labels('overload', _route_group(scope['path'], settings.RATE_LIMITS) or 'other').inc()
+            return await _reject(send, 503, 'Servidor sobrecarregado. Tente novamente em instantes.', settings.ADMISSION_RETRY_AFTER)
+
+        self.in_flight += 1
+        released = False
+
+        def release():
+            nonlocal released
+            if not released:
+                released = True
+                self.in_flight -= 1
+                self._slots.release()
+
+        async def send_wrapper(message):
+            await send(message)
+            if message['type'] == 'http.response.body' and not message.get('more_body', False):
+                release()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            release()
@@ -0,0 +1,40 @@
+import json
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson é opcional
+    orjson = None
+
+DefaultResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp) -> TypeAdapter:
+    # Construir um TypeAdapter compila o schema do pydantic-core; manter um
+    # por tipo evita pagar esse custo a cada requisição.
+    return TypeAdapter(tp)
+
+
+def render(value: Any, tp=None) -> bytes:
+    if tp is not None:
+        # Só serializa: os dados vêm do próprio banco/cache e não são revalidados.
+        return type_adapter(tp).dump_json(value)
+    if orjson is not None:
+        return orjson.dumps(value, default=jsonable_encoder)
+    return json.dumps(jsonable_encoder(value), separators=(',', ':'), ensure_ascii=False).encode()
+
+
+def trusted_response(value: Any, tp=None, response: Response | None = None, status_code: int = 200) -> Response:
+    fast = Response(content=render(value, tp), status_code=status_code, media_type='application/json')
+    if response is not None:
+        fast.raw_headers.extend(
+            (key, header) for key, header in response.raw_headers if key != b'content-length'
+        )
+    return fast
@@ -0,0 +1,55 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+from workout_api.contrib.metrics import Counter
+
+cache_lookups = Counter(
+    'cache_lookups', 'Leituras por chave por resultado (hit, miss, coalesced)', labelnames=('namespace', 'result'),
+)
+
+
+class SingleFlight:
+    # Leituras concorrentes da mesma chave dentro do worker compartilham uma
+    # única execução do loader e o seu resultado.
+    def __init__(self, namespace: str) -> None:
+        self.namespace = namespace
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    def forget(self, key: Hashable) -> None:
+        # Depois de uma escrita, novas leituras não devem se juntar a uma
+        # execução iniciada antes dela.
+        self._calls.pop(key, None)
+
+    def clear(self) -> None:
+        self._calls.clear()
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        while (call := self._calls.get(key)) is not None:
+            cache_lookups.labels(self.namespace, 'coalesced').inc()
+            try:
+                # shield: o cancelamento de quem espera não cancela a execução compartilhada.
+                return await asyncio.shield(call)
+            except asyncio.CancelledError:
+                if not call.cancelled():
+                    raise
+                # A requisição líder foi cancelada; outra assume a leitura.
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        cache_lookups.labels(self.namespace, 'miss').inc()
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Marca a exceção como consumida quando ninguém estava esperando.
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
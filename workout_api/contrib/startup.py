@@ -0,0 +1,57 @@
+import asyncio
+import logging
+import time
+
+from workout_api.contrib.metrics import Gauge
+
+logger = logging.getLogger('workout_api.startup')
+
+# Importado antes dos modelos em workout_api/__init__.py para que a fase
+# "import" cubra a carga do FastAPI, SQLAlchemy, schemas e rotas.
+started_at = time.perf_counter()
+phases: dict[str, float] = {}
+
+Gauge(
+    'app_startup_seconds', 'Duração de cada fase da inicialização do worker', labelnames=('phase',),
+    function=lambda: {(phase,): seconds for phase, seconds in phases.items()},
+)
+
+
+def mark(phase: str, since: float) -> float:
+    now = time.perf_counter()
+    phases[phase] = now - since
+    return now
+
+
+async def warm_pool(engine, connections: int) -> None:
+    from sqlalchemy import text
+
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text('SELECT 1'))
+
+    # Conexões abertas em paralelo voltam todas ao pool, que passa a
+    # atender as primeiras requisições sem pagar o handshake.
+    await asyncio.gather(*(ping() for _ in range(connections)))
+
+
+async def warmup() -> None:
+    from workout_api.categorias.cache import categoria_cache
+    from workout_api.centro_treinamento.cache import centro_treinamento_cache
+    from workout_api.configs.database import async_session, engine, replica_engine
+    from workout_api.configs.settings import settings
+
+    started = time.perf_counter()
+    try:
+        await warm_pool(engine, settings.DB_POOL_SIZE)
+        if replica_engine is not None:
+            await warm_pool(replica_engine, settings.DB_POOL_SIZE)
+        started = mark('warmup_pool', started)
+
+        async with async_session() as session:
+            await categoria_cache.warm(session)
+            await centro_treinamento_cache.warm(session)
+        mark('warmup_cache', started)
+    except Exception:
+        # O worker sobe mesmo assim; pool e caches são preenchidos sob demanda.
+        logger.exception('Falha no aquecimento do pool/caches.')
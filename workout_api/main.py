@@ -1,5 +1,70 @@
+import logging
+import time
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from workout_api.atleta import write_behind
+from workout_api.configs.database import ReadYourWritesMiddleware, replica_engine
+from workout_api.configs.settings import settings
+from workout_api.contrib import cache, startup
+from workout_api.contrib.responses import DefaultResponse
 from workout_api.routers import api_router
 
-app = FastAPI(title="Workout API", description="API for managing workout routines", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    await cache.start()
+    if settings.WARMUP_ENABLED:
+        # Roda antes do worker aceitar conexões: o uvicorn só começa a
+        # atender depois que o lifespan termina o startup.
+        await startup.warmup()
+    await write_behind.start()
+    startup.mark('lifespan', started)
+    logging.getLogger('workout_api.startup').info(
+        'Worker pronto: %s',
+        ', '.join(f'{phase} {seconds * 1000:.0f} ms' for phase, seconds in startup.phases.items()),
+    )
+    yield
+    # Drena a fila antes de fechar o cache para que os jobs aceitos sejam gravados.
+    await write_behind.stop()
+    await cache.stop()
+
+
+app = FastAPI(
+    title="Workout API",
+    description="API for managing workout routines",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=DefaultResponse if settings.FAST_RESPONSES else JSONResponse,
+)
 app.include_router(api_router)
+
+if replica_engine is not None:
+    app.add_middleware(ReadYourWritesMiddleware)
+
+# Middlewares opcionais são importados só quando ligados: além de encurtar o
+# startup, a instrumentação registra listeners em todas as queries ao ser importada.
+if settings.IDEMPOTENCY_ENABLED:
+    from workout_api.contrib.idempotency import IdempotencyMiddleware
+
+    app.add_middleware(IdempotencyMiddleware)
+
+# Ordem final: instrumentação -> limite por cliente -> admissão -> idempotência.
+# Clientes acima do limite são recusados antes de ocupar uma vaga de admissão.
+if settings.ADMISSION_CONTROL_ENABLED:
+    from workout_api.contrib.ratelimit import AdmissionMiddleware
+
+    app.add_middleware(AdmissionMiddleware)
+
+if settings.RATE_LIMIT_ENABLED:
+    from workout_api.contrib.ratelimit import RateLimitMiddleware
+
+    app.add_middleware(RateLimitMiddleware)
+
+if settings.INSTRUMENTATION_ENABLED:
+    from workout_api.contrib.instrumentation import InstrumentationMiddleware
+
+    app.add_middleware(InstrumentationMiddleware)
+
+startup.mark('import', startup.started_at)
@@ -0,0 +1,8 @@
+from fastapi import APIRouter, Response
+from workout_api.contrib.metrics import CONTENT_TYPE, registry
+
+router = APIRouter()
+
+@router.get('', include_in_schema=False)
+async def metrics() -> Response:
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
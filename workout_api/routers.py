@@ -2,8 +2,10 @@ from fastapi import APIRouter
 from workout_api.centro_treinamento.controller import router as centro_treinamento
 from workout_api.categorias.controller import router as categorias
 from workout_api.atleta.controller import router as atleta
+from workout_api.metrics.controller import router as metrics
 
 api_router = APIRouter()
 api_router.include_router(atleta, prefix='/atletas', tags=['Atletas'])
 api_router.include_router(categorias, prefix='/categorias', tags=['Categorias'])
-api_router.include_router(centro_treinamento, prefix='/centros_treinamento', tags=['Centros de Treinamento'])
\ No newline at end of file
+api_router.include_router(centro_treinamento, prefix='/centros_treinamento', tags=['Centros de Treinamento'])
+api_router.include_router(metrics, prefix='/metrics', tags=['Métricas'])
@@ -0,0 +1,80 @@
+import argparse
+import importlib.util
+import logging
+import math
+import os
+
+from workout_api.configs.settings import settings
+
+logger = logging.getLogger('workout_api.startup')
+
+
+def available_cpus() -> int:
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    # Em containers o limite de CPU (cgroup v2) costuma ser menor que os
+    # núcleos visíveis; subir um worker por núcleo do host só gera disputa.
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as file:
+            quota, period = file.read().split()
+        if quota != 'max':
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def _available(module: str) -> bool:
+    # find_spec não importa o módulo: a escolha não pesa no startup do supervisor.
+    return importlib.util.find_spec(module) is not None
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m workout_api.server', description='Servidor de produção da Workout API.')
+    parser.add_argument('--host', default=settings.SERVER_HOST)
+    parser.add_argument('--port', type=int, default=settings.SERVER_PORT)
+    parser.add_argument('--workers', type=int, default=settings.SERVER_WORKERS,
+                        help='Quantidade de processos (padrão: CPUs disponíveis)')
+    parser.add_argument('--graceful-timeout', type=float, default=settings.SERVER_GRACEFUL_TIMEOUT)
+    parser.add_argument('--keep-alive', type=int, default=settings.SERVER_KEEP_ALIVE)
+    parser.add_argument('--no-access-log', action='store_true', help='Desliga o log de acesso do uvicorn')
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    import uvicorn
+
+    args = parse_args(argv)
+    workers = args.workers or available_cpus()
+    loop = 'uvloop' if _available('uvloop') else 'asyncio'
+    http = 'httptools' if _available('httptools') else 'h11'
+
+    logging.basicConfig(level=logging.INFO)
+    logger.info('Iniciando %d workers (loop=%s, http=%s) em %s:%d', workers, loop, http, args.host, args.port)
+    connections = workers * (settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+    logger.info('Até %d conexões com o banco (%d workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW)).', connections, workers)
+
+    # Com workers > 1 o uvicorn supervisiona os processos: recria os que
+    # morrerem e, com SIGHUP, reinicia um por vez (restart gradual). Cada
+    # worker que para conclui as requisições em andamento por até
+    # graceful-timeout e roda o shutdown do lifespan (drena a fila de escrita).
+    uvicorn.run(
+        'workout_api.main:app',
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        lifespan='on',
+        proxy_headers=True,
+        timeout_keep_alive=args.keep_alive,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        access_log=not args.no_access_log,
+    )
+
+
+if __name__ == '__main__':
+    main()